@@ -9,14 +9,32 @@ import os
 from pathlib import Path
 from datetime import datetime
 import re
+import threading
+from functools import lru_cache
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
+from reportlab.platypus.paragraph import cleanBlockQuotedText, textTransformFrags
+from reportlab.platypus.paraparser import ParaParser
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import mm
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_JUSTIFY
 import argparse
 
+
+# Стили создаются один раз на процесс (ResumeBuilder.get_styles), поэтому объект стиля годится как ключ
+@lru_cache(maxsize=4096)
+def _parse_paragraph(text, style):
+    """Разбор разметки Paragraph (как в Paragraph._setup); кэш ограничен, фрагменты не изменять"""
+    parser = ParaParser()
+    parser.caseSensitive = 1
+    parsed_style, frags, bullet_frags = parser.parse(cleanBlockQuotedText(text), style)
+    if frags is None:
+        raise ValueError(f"xml parser error ({parser.errors[0]}) in paragraph beginning '{text[:30]}'")
+    textTransformFrags(frags, parsed_style)
+    return parsed_style, tuple(frags), bullet_frags or getattr(parsed_style, 'bulletText', None)
+
+
 class ResumeBuilder:
     def __init__(self, blocks_dir="resume_blocks"):
         self.blocks_dir = Path(blocks_dir)
@@ -159,9 +177,8 @@ class ResumeBuilder:
             bottomMargin=20*mm
         )
         
-        # Стили
-        styles = getSampleStyleSheet()
-        self.create_custom_styles(styles)
+        # Стили (общие для всех PDF в процессе)
+        styles = self.get_styles()
         
         # Элементы документа
         story = []
@@ -194,6 +211,24 @@ class ResumeBuilder:
         
         return output_filename
     
+    _styles_cache = None
+    _styles_lock = threading.Lock()
+
+    def get_styles(self):
+        """Таблица стилей, создаваемая один раз на процесс; не изменять"""
+        cls = type(self)
+        with cls._styles_lock:
+            if cls._styles_cache is None:
+                styles = getSampleStyleSheet()
+                self.create_custom_styles(styles)
+                cls._styles_cache = styles
+            return cls._styles_cache
+
+    def cached_paragraph(self, text, style):
+        """Paragraph с разметкой, разобранной один раз на процесс; фрагменты копируются для каждого вызова"""
+        parsed_style, frags, bullet_text = _parse_paragraph(text, style)
+        return Paragraph(text, parsed_style, bulletText=bullet_text, frags=[frag.clone() for frag in frags])
+
     def create_custom_styles(self, styles):
         """Создание кастомных стилей"""
         styles.add(ParagraphStyle(
@@ -319,14 +354,14 @@ class ResumeBuilder:
             
             # Обязанности
             for responsibility in exp['responsibilities']:
-                elements.append(Paragraph(responsibility, styles['BodyText']))
+                elements.append(self.cached_paragraph(responsibility, styles['BodyText']))
             
             # Достижения (если есть и если нужно выделить)
             if 'achievements' in exp and template.get('highlight_achievements', True):
                 elements.append(Spacer(1, 2*mm))
                 for achievement in exp['achievements']:
                     achievement_text = f"<i>→ {achievement}</i>"
-                    elements.append(Paragraph(achievement_text, styles['BodyText']))
+                    elements.append(self.cached_paragraph(achievement_text, styles['BodyText']))
             
             if i < len(filtered_experience) - 1:
                 elements.append(Spacer(1, 6*mm))
@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import math
+import platform
+import shutil
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence
+
+from .composer import ComposeCache, ResumeComposer
+from .data_models import TemplateConfig
+from .data_store import DataStore
+from .exporters import registry
+from .filters import compile_filters
+from .loaders import TemplateLoader
+from .snapshot import write_snapshot
+from .synthetic import SyntheticSpec, write_dataset
+
+BENCH_VERSION = 1
+STAGES = ("bundle_load", "snapshot_load", "template_load", "compose", "filter", "export_pdf", "export_markdown")
+# Synthetic bundles select thousands of blocks; exports are capped so they measure rendering, not page count.
+SYNTHETIC_EXPORT_BLOCKS = 20
+
+
+@dataclass(frozen=True)
+class StageStats:
+    runs: int
+    p50_ms: float
+    p95_ms: float
+    mean_ms: float
+    peak_kib: float
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "runs": self.runs,
+            "p50_ms": round(self.p50_ms, 3),
+            "p95_ms": round(self.p95_ms, 3),
+            "mean_ms": round(self.mean_ms, 3),
+            "peak_kib": round(self.peak_kib, 1),
+        }
+
+
+def percentile(samples: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def measure(fn: Callable[[], Any], repeat: int) -> StageStats:
+    """Time ``fn`` ``repeat`` times, then run it once more under tracemalloc for peak memory."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    fn()
+    peak = tracemalloc.get_traced_memory()[1] - baseline
+    if not tracing:
+        tracemalloc.stop()
+    return StageStats(
+        runs=repeat,
+        p50_ms=percentile(samples, 50),
+        p95_ms=percentile(samples, 95),
+        mean_ms=sum(samples) / len(samples),
+        peak_kib=max(peak, 0) / 1024,
+    )
+
+
+def bench_dataset(
+    name: str,
+    blocks_path: Path,
+    templates_dir: Path,
+    *,
+    repeat: int,
+    stages: Sequence[str] = STAGES,
+    export_blocks: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Per-stage stats for every template in ``templates_dir`` against ``blocks_path``.
+
+    ``bundle_load`` always validates the JSON; ``snapshot_load`` loads a copy
+    of it through a freshly written snapshot (``snapshot.py``).
+    """
+    loader = TemplateLoader(templates_dir)
+    templates = loader.list_templates()
+    configs = [loader.load(template) for template in templates]
+    bundle = DataStore(blocks_path, background=False).bundle()
+    index = bundle.tag_index()
+    export_configs = [_cap_blocks(config, export_blocks) for config in configs] if export_blocks else configs
+    composer = ResumeComposer(bundle, cache=ComposeCache(maxsize=0))
+    resumes = [composer.compose(config) for config in export_configs]
+
+    def export(format_name: str) -> Callable[[], None]:
+        exporter = registry.create(format_name)
+        return lambda: [exporter.export_bytes(resume) for resume in resumes]
+
+    def filter_all() -> None:
+        for config in configs:
+            max_blocks = config.options.get("max_experience_blocks")
+            compile_filters(config.filters, max_items=max_blocks, template_key=config.template).run(
+                bundle.experience, index
+            )
+
+    runners: Dict[str, Callable[[], Any]] = {
+        "bundle_load": lambda: DataStore(blocks_path, background=False, use_snapshot=False).bundle(),
+        "snapshot_load": lambda: DataStore(snapshot_blocks, background=False).bundle(),
+        "template_load": lambda: [TemplateLoader(templates_dir).load(template) for template in templates],
+        "compose": lambda: [composer.compose(config) for config in configs],
+        "filter": filter_all,
+        "export_pdf": export("pdf"),
+        "export_markdown": export("markdown"),
+    }
+    with tempfile.TemporaryDirectory(prefix="resume-bench-snapshot-") as tmp:
+        snapshot_blocks = Path(tmp) / blocks_path.name
+        if "snapshot_load" in stages:
+            shutil.copyfile(blocks_path, snapshot_blocks)
+            write_snapshot(snapshot_blocks)
+        results = {stage: measure(runners[stage], repeat).to_dict() for stage in stages}
+    return {
+        "dataset": name,
+        "blocks": len(bundle.experience),
+        "templates": len(templates),
+        "stages": results,
+    }
+
+
+def _cap_blocks(config: TemplateConfig, limit: int) -> TemplateConfig:
+    current = config.options.get("max_experience_blocks")
+    capped = limit if not isinstance(current, int) else min(current, limit)
+    return config.model_copy(update={"options": {**config.options, "max_experience_blocks": capped}})
+
+
+def run_bench(
+    configs_dir: Path,
+    *,
+    sizes: Sequence[int] = (),
+    repeat: int = 10,
+    stages: Sequence[str] = STAGES,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """Bench the shipped configs plus one synthetic dataset (``synthetic.py``) per entry in ``sizes``."""
+    runs = [
+        bench_dataset("shipped", configs_dir / "blocks.json", configs_dir / "templates", repeat=repeat, stages=stages)
+    ]
+    with tempfile.TemporaryDirectory(prefix="resume-bench-") as tmp:
+        for size in sizes:
+            blocks_path, templates_dir = write_dataset(SyntheticSpec(blocks=size, seed=seed), Path(tmp) / str(size))
+            runs.append(
+                bench_dataset(
+                    f"synthetic-{size}",
+                    blocks_path,
+                    templates_dir,
+                    repeat=repeat,
+                    stages=stages,
+                    export_blocks=SYNTHETIC_EXPORT_BLOCKS,
+                )
+            )
+    return {
+        "version": BENCH_VERSION,
+        "python": platform.python_version(),
+        "repeat": repeat,
+        "seed": seed,
+        "runs": runs,
+    }
+
+
+@dataclass(frozen=True)
+class Regression:
+    dataset: str
+    stage: str
+    baseline_ms: float
+    current_ms: float
+
+    @property
+    def change_pct(self) -> float:
+        return (self.current_ms / self.baseline_ms - 1) * 100 if self.baseline_ms else math.inf
+
+    def __str__(self) -> str:
+        return (
+            f"{self.dataset}/{self.stage}: p50 {self.baseline_ms:.3f} ms -> {self.current_ms:.3f} ms "
+            f"(+{self.change_pct:.1f}%)"
+        )
+
+
+def compare(
+    current: Mapping[str, Any],
+    baseline: Mapping[str, Any],
+    threshold_pct: float,
+    *,
+    min_delta_ms: float = 0.5,
+) -> List[Regression]:
+    """Stages whose p50 grew more than ``threshold_pct`` over the baseline.
+
+    Differences under ``min_delta_ms`` are ignored so sub-millisecond stages
+    do not fail on timer noise. Datasets or stages missing from either side
+    are skipped.
+    """
+    previous = {
+        (run["dataset"], stage): stats["p50_ms"] for run in baseline.get("runs", []) for stage, stats in run["stages"].items()
+    }
+    regressions = []
+    for run in current.get("runs", []):
+        for stage, stats in run["stages"].items():
+            before = previous.get((run["dataset"], stage))
+            after = stats["p50_ms"]
+            if before is None or after - before < min_delta_ms:
+                continue
+            if after > before * (1 + threshold_pct / 100):
+                regressions.append(Regression(run["dataset"], stage, before, after))
+    return regressions
+
+
+def format_report(report: Mapping[str, Any]) -> str:
+    lines = [f"{'DATASET':<18} {'STAGE':<16} {'P50 MS':>9} {'P95 MS':>9} {'PEAK KIB':>10}"]
+    for run in report["runs"]:
+        for stage, stats in run["stages"].items():
+            lines.append(
+                f"{run['dataset']:<18} {stage:<16} {stats['p50_ms']:9.3f} {stats['p95_ms']:9.3f} {stats['peak_kib']:10.1f}"
+            )
+    return "\n".join(lines)
@@ -0,0 +1,332 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import multiprocessing
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from . import telemetry
+from .composer import ComposedResume, ResumeComposer, resume_fingerprint
+from .data_models import BlocksBundle, TemplateConfig
+from .data_store import DataStore
+from .exporters import Exporter, registry
+from .fitting import FitReport, fit_for_exporter
+from .loaders import TemplateLoader
+from .settings import Settings
+
+
+@dataclass(frozen=True)
+class BuildOptions:
+    export: str = "pdf"
+    out: Path = Path("builds")
+    filename: Optional[str] = None
+    since: Optional[Path] = None
+    force: bool = False
+    deterministic: bool = False
+    # Output filename -> entry from the previous run's manifest.
+    known_outputs: Mapping[str, Mapping[str, Any]] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class BuildResult:
+    template: str
+    status: str  # "built", "cached", "skipped" or "failed"
+    seconds: float
+    output: Optional[str] = None
+    error: Optional[str] = None
+    digest: Optional[str] = None
+    fit: Optional[FitReport] = None
+    # Size and SHA-256 of the file at ``output``, recorded in the manifest.
+    size: Optional[int] = None
+    sha256: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status != "failed"
+
+
+class BuildContext:
+    """Loader and warm composer shared by every build in one process."""
+
+    def __init__(self, loader: TemplateLoader, composer: ResumeComposer) -> None:
+        self.loader = loader
+        self.composer = composer
+        self._previous: Dict[Path, BlocksBundle] = {}
+
+    @classmethod
+    def load(cls, config_dir: Path | None = None) -> "BuildContext":
+        settings = Settings.from_project_root()
+        if config_dir:
+            settings.configs_dir = config_dir
+        store = DataStore(settings.blocks_path())
+        return cls(TemplateLoader(settings.templates_dir()), ResumeComposer.from_store(store))
+
+    def previous_bundle(self, path: Path) -> BlocksBundle:
+        bundle = self._previous.get(path)
+        if bundle is None:
+            bundle = self._previous[path] = DataStore(path).bundle()
+        return bundle
+
+
+def output_filename(config: TemplateConfig, export: str, override: str | None = None) -> str:
+    file_ext = export if export != "markdown" else "md"
+    filename = override
+    if not filename and config.output and isinstance(config.output, dict):
+        custom_value = config.output.get("filename")
+        if isinstance(custom_value, str) and custom_value.strip():
+            filename = custom_value.strip()
+    if not filename:
+        return f"{config.template.replace('_', '-')}.{file_ext}"
+    if not filename.lower().endswith(f".{file_ext}"):
+        filename = f"{filename}.{file_ext}"
+    return filename
+
+
+MANIFEST_NAME = ".resume-manifest.json"
+MANIFEST_VERSION = 2
+
+
+def output_digest(resume: ComposedResume, exporter: Exporter) -> str:
+    """Content address of one output: composed resume, exporter format/version/settings and theme."""
+    theme = resume.meta.get("options", {}).get("theme")
+    payload = json.dumps(
+        {
+            "resume": resume_fingerprint(resume),
+            "format": exporter.format,
+            "exporter_version": exporter.version,
+            "theme": theme,
+            "settings": exporter.settings(),
+        },
+        sort_keys=True,
+        default=dict,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def load_manifest(out: Path) -> Dict[str, Dict[str, Any]]:
+    """Return ``{filename: entry}`` from ``out``'s manifest, or ``{}`` if missing or unreadable."""
+    try:
+        data = json.loads((out / MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+        return {}
+    outputs = data.get("outputs")
+    return outputs if isinstance(outputs, dict) else {}
+
+
+def file_fingerprint(path: Path) -> Tuple[int, str]:
+    """Size and SHA-256 of ``path``."""
+    data = path.read_bytes()
+    return len(data), hashlib.sha256(data).hexdigest()
+
+
+def output_is_current(destination: Path, entry: Mapping[str, Any] | None, digest: str) -> bool:
+    """Whether ``destination`` is the output the manifest ``entry`` recorded for build ``digest``."""
+    if not entry or entry.get("digest") != digest:
+        return False
+    try:
+        if destination.stat().st_size != entry.get("size"):
+            return False
+        return file_fingerprint(destination) == (entry.get("size"), entry.get("sha256"))
+    except OSError:
+        return False
+
+
+def update_manifest(out: Path, results: Sequence[BuildResult]) -> None:
+    """Record built and cached outputs; forget outputs whose build failed."""
+    entries = load_manifest(out)
+    target = out / MANIFEST_NAME
+    for result in results:
+        if not result.output:
+            continue
+        name = Path(result.output).name
+        if result.status == "failed":
+            entries.pop(name, None)
+        elif result.digest and result.sha256 and result.status in {"built", "cached"}:
+            entries[name] = {
+                "digest": result.digest,
+                "template": result.template,
+                "size": result.size,
+                "sha256": result.sha256,
+            }
+    if not entries and not target.exists():
+        return
+    out.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(f"{target.name}.tmp")
+    payload = {"version": MANIFEST_VERSION, "outputs": dict(sorted(entries.items()))}
+    tmp.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    os.replace(tmp, target)
+
+
+def create_exporter(options: BuildOptions) -> Exporter:
+    if options.export == "pdf":
+        return registry.create("pdf", deterministic=options.deterministic)
+    return registry.create(options.export)
+
+
+def build_template(context: BuildContext, template: str, options: BuildOptions) -> BuildResult:
+    """Compose and export one template; failures are captured in the result, never raised."""
+    started = time.perf_counter()
+    destination: Optional[Path] = None
+    try:
+        config = context.loader.load(template)
+        if options.since:
+            previous = context.previous_bundle(options.since)
+            if not context.composer.affected_templates(previous, context.composer.bundle, [config]):
+                return BuildResult(template, "skipped", time.perf_counter() - started)
+        resume = context.composer.compose(config)
+        exporter = create_exporter(options)
+        destination = options.out / output_filename(config, options.export, options.filename)
+        digest = output_digest(resume, exporter)
+        entry = options.known_outputs.get(destination.name)
+        if not options.force and output_is_current(destination, entry, digest):
+            return BuildResult(
+                template,
+                "cached",
+                time.perf_counter() - started,
+                output=str(destination),
+                digest=digest,
+                size=entry["size"],
+                sha256=entry["sha256"],
+            )
+        # Fitting is a pure function of the composed resume and exporter, so the digest is taken before it.
+        resume, fit = fit_for_exporter(resume, exporter)
+        options.out.mkdir(parents=True, exist_ok=True)
+        output = exporter.export(resume, destination)
+        size, sha256 = file_fingerprint(Path(output))
+        return BuildResult(
+            template,
+            "built",
+            time.perf_counter() - started,
+            output=output,
+            digest=digest,
+            fit=fit,
+            size=size,
+            sha256=sha256,
+        )
+    except Exception as exc:  # noqa: BLE001 - isolate failures per template
+        error = "".join(traceback.format_exception_only(type(exc), exc)).strip()
+        # ``output`` names the file this build would have written, so the manifest can forget it.
+        output = str(destination) if destination is not None else None
+        return BuildResult(template, "failed", time.perf_counter() - started, output=output, error=error)
+
+
+_WORKER_CONTEXT: Optional[BuildContext] = None
+
+
+def _init_worker(config_dir: Path | None, export: str) -> None:
+    global _WORKER_CONTEXT
+    telemetry.reset()  # sinks inherited through fork belong to the parent
+    _WORKER_CONTEXT = BuildContext.load(config_dir)
+    warm_exporter(export, _WORKER_CONTEXT.loader)
+
+
+def _run_in_worker(template: str, options: BuildOptions) -> BuildResult:
+    assert _WORKER_CONTEXT is not None, "worker initializer did not run"
+    return build_template(_WORKER_CONTEXT, template, options)
+
+
+def warm_exporter(export: str, loader: TemplateLoader | None = None) -> None:
+    registry.resolve(export)
+    if export == "pdf":
+        from .exporters.fonts import register_fonts
+        from .exporters.styles import get_stylesheet
+
+        get_stylesheet()
+        # Fonts are parsed once per process. Pool workers call this from their initializer,
+        # so they are warm under any start method; under fork they inherit the parent's
+        # registrations and the calls return immediately.
+        for template in loader.list_templates() if loader else []:
+            try:
+                register_fonts((loader.load(template).options or {}).get("fonts"))
+            except Exception:  # noqa: BLE001 - reported by that template's own build
+                continue
+
+
+def build_many(
+    templates: Sequence[str],
+    options: BuildOptions,
+    *,
+    jobs: int = 1,
+    config_dir: Path | None = None,
+    context: BuildContext | None = None,
+) -> List[BuildResult]:
+    """Build ``templates`` serially or in a process pool, returning results in input order.
+
+    Pool workers load the bundle, templates and stylesheet once in their
+    initializer and then reuse them for every template they are handed.
+    Outputs whose digest matches the manifest in ``options.out`` and whose
+    file still has the recorded size and SHA-256 are not re-rendered unless
+    ``options.force`` is set; the manifest is updated by this (parent)
+    process once all builds finish, dropping entries for failed builds.
+    """
+    if not options.force:
+        options = replace(options, known_outputs=load_manifest(options.out))
+    results = _run_builds(templates, options, jobs=jobs, config_dir=config_dir, context=context)
+    update_manifest(options.out, results)
+    return results
+
+
+def _run_builds(
+    templates: Sequence[str],
+    options: BuildOptions,
+    *,
+    jobs: int,
+    config_dir: Path | None,
+    context: BuildContext | None,
+) -> List[BuildResult]:
+    if jobs <= 1 or len(templates) <= 1:
+        context = context or BuildContext.load(config_dir)
+        return [build_template(context, template, options) for template in templates]
+
+    if context is not None and multiprocessing.get_start_method() == "fork":
+        # Only forked workers share the parent's memory; spawn/forkserver workers warm up themselves.
+        warm_exporter(options.export, context.loader)
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(templates)),
+        initializer=_init_worker,
+        initargs=(config_dir, options.export),
+    ) as pool:
+        futures = [pool.submit(_run_in_worker, template, options) for template in templates]
+        results = []
+        for template, future in zip(templates, futures):
+            try:
+                results.append(future.result())
+            except Exception as exc:  # noqa: BLE001 - e.g. a worker died mid-build
+                results.append(BuildResult(template, "failed", 0.0, error=repr(exc)))
+        return results
+
+
+def validation_errors(store: DataStore, loader: TemplateLoader) -> List[str]:
+    errors: List[str] = []
+    try:
+        store.bundle()
+    except Exception as exc:  # noqa: BLE001
+        errors.append(f"Blocks validation failed: {exc}")
+
+    for config in loader.iter_configs():
+        # ensure summary exists by instantiating composer later; here we just check fields
+        if not config.skill_categories:
+            errors.append(f"Template {config.template} has no skill categories")
+    return errors
+
+
+def format_summary(results: Sequence[BuildResult]) -> str:
+    width = max([len("template")] + [len(result.template) for result in results])
+    lines = [f"{'TEMPLATE':<{width}}  STATUS   SECONDS  DETAIL"]
+    for result in results:
+        detail = result.error if result.status == "failed" else (result.output or "")
+        if result.fit and result.fit.describe():
+            detail = f"{detail} ({result.fit.describe()[0]})"
+        lines.append(f"{result.template:<{width}}  {result.status:<7}  {result.seconds:7.3f}  {detail}")
+    failed = sum(not result.ok for result in results)
+    total = sum(result.seconds for result in results)
+    lines.append(f"{len(results)} template(s), {failed} failed, {total:.3f}s total render time")
+    return "\n".join(lines)
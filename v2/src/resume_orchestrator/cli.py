@@ -2,14 +2,23 @@ from __future__ import annotations
 
 import argparse
 import json
+import sys
 from pathlib import Path
 from typing import Iterable
 
+from . import telemetry
 from .composer import ResumeComposer
 from .data_store import DataStore
 from .exporters import registry
+from .fitting import fit_for_exporter
 from .loaders import TemplateLoader
 from .settings import Settings
+from .snapshot import write_snapshot
+
+# ``profiling.MODES``; repeated here because profiling (cProfile, pstats, sysconfig) and
+# builds (process pools) are only imported by the commands that use them.
+PROFILE_MODES = ("cpu", "mem", "both")
+DEFAULT_PROFILE_MODE = "both"
 
 
 def _load_context(config_dir: Path | None = None):
@@ -19,13 +28,60 @@ def _load_context(config_dir: Path | None = None):
 
     store = DataStore(settings.blocks_path())
     loader = TemplateLoader(settings.templates_dir())
-    composer = ResumeComposer(store.bundle())
+    composer = ResumeComposer.from_store(store)
     return settings, store, loader, composer
 
 
+def _int_list(value: str) -> list[int]:
+    return [int(item) for item in value.split(",") if item.strip()]
+
+
+def _str_list(value: str) -> list[str]:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def _export_format(value: str) -> str:
+    # Checked here rather than with ``choices`` so plugin entry points are only scanned for unknown formats.
+    if not registry.supports(value):
+        raise argparse.ArgumentTypeError(
+            f"invalid choice: '{value}' (choose from {', '.join(registry.available_formats())})"
+        )
+    return value
+
+
+def _expand_bare_profile(argv: list[str]) -> list[str]:
+    """Turn a bare ``--profile`` into ``--profile=both``.
+
+    With ``nargs="?"`` argparse would otherwise take the subcommand that
+    follows (``--profile build ...``) as the mode.
+    """
+    expanded = list(argv)
+    for position, arg in enumerate(expanded):
+        if arg == "--":
+            break
+        if arg == "--profile" and (position + 1 == len(expanded) or expanded[position + 1] not in PROFILE_MODES):
+            expanded[position] = f"--profile={DEFAULT_PROFILE_MODE}"
+    return expanded
+
+
 def app():
     parser = argparse.ArgumentParser(prog="resume-cli", description="Resume Orchestrator CLI")
     parser.add_argument("--config-dir", type=Path, help="Override configs directory", dest="config_dir")
+    parser.add_argument(
+        "--trace",
+        action="append",
+        metavar="SINK",
+        help="Emit pipeline spans: 'json' (stderr), 'json:PATH' or 'prom:PATH' (Prometheus textfile); repeatable",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const=DEFAULT_PROFILE_MODE,
+        choices=PROFILE_MODES,
+        help="Profile the command with cProfile (cpu), tracemalloc per pipeline stage (mem) or both (the default)",
+    )
+    parser.add_argument("--profile-out", type=Path, default=Path("profile"), help="Directory for profile reports")
+    parser.add_argument("--profile-top", type=int, default=25, help="Functions/lines listed per report section")
 
     subparsers = parser.add_subparsers(dest="command")
 
@@ -36,42 +92,114 @@ def app():
     tpl_show = tpl_list_sub.add_parser("show", help="Show template details")
     tpl_show.add_argument("template", help="Template key")
 
-    build = subparsers.add_parser("build", help="Compose resume and export to file")
-    build.add_argument("template", help="Template key")
-    build.add_argument("--export", choices=registry.available_formats(), default="pdf", help="Export format")
+    build = subparsers.add_parser("build", help="Compose resumes and export to files")
+    build.add_argument("templates", nargs="*", metavar="template", help="Template key(s)")
+    build.add_argument("--all", action="store_true", help="Build every available template")
+    build.add_argument("-j", "--jobs", type=int, default=1, help="Number of worker processes")
+    formats = "{" + ",".join(registry.available_formats(include_plugins=False)) + ",...}"
+    build.add_argument("--export", type=_export_format, metavar=formats, default="pdf", help="Export format")
     build.add_argument("--out", type=Path, default=Path("builds"), help="Output directory")
     build.add_argument("--filename", type=str, help="Optional output filename")
+    build.add_argument(
+        "--since",
+        type=Path,
+        help="Previous blocks.json; skip the build when the template is unaffected by the changes",
+    )
+
+    build.add_argument("--force", action="store_true", help="Re-render even if the build manifest says the output is current")
+    build.add_argument(
+        "--deterministic",
+        action="store_true",
+        help="Produce byte-identical PDFs for identical input (fixed timestamps and metadata)",
+    )
 
     preview = subparsers.add_parser("preview", help="Render resume to stdout")
     preview.add_argument("template", help="Template key")
-    preview.add_argument("--export", choices=[fmt for fmt in registry.available_formats() if fmt != "pdf"], default="markdown")
+    preview.add_argument("--export", type=_export_format, metavar=formats, default="markdown")
+
+    serve = subparsers.add_parser("serve", help="Run a warm render daemon over HTTP or a Unix socket")
+    serve.add_argument("--host", default="127.0.0.1", help="Interface to bind (default: localhost only)")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--socket", type=Path, help="Listen on a Unix socket instead of TCP")
+    serve.add_argument("-w", "--workers", type=int, default=4, help="Render worker threads")
+    serve.add_argument("--queue", type=int, default=16, help="Requests allowed to wait for a worker before 503")
+    serve.add_argument("--out", type=Path, default=Path("builds"), help="Output directory for /build")
+    serve.add_argument("--quiet", action="store_true", help="Do not log each request")
+
+    bench = subparsers.add_parser("bench", help="Time each pipeline stage and compare against a baseline")
+    bench.add_argument("--repeat", type=int, default=10, help="Timed runs per stage")
+    bench.add_argument(
+        "--sizes",
+        type=_int_list,
+        default=[],
+        help="Comma-separated synthetic bundle sizes in experience blocks, e.g. 100,5000,50000",
+    )
+    bench.add_argument("--stages", type=_str_list, help="Comma-separated subset of stages to run")
+    bench.add_argument("--seed", type=int, default=0, help="Seed for synthetic bundles")
+    bench.add_argument("--out", type=Path, help="Write the JSON report here instead of stdout")
+    bench.add_argument("--baseline", type=Path, help="Baseline JSON report to compare against")
+    bench.add_argument("--threshold", type=float, default=20.0, help="Allowed p50 slowdown in percent")
+    bench.add_argument("--save-baseline", type=Path, help="Also write the report as a new baseline")
 
     subparsers.add_parser("validate", help="Validate data blocks and templates")
+    subparsers.add_parser("snapshot", help="Compile blocks into a pre-validated snapshot for fast loading")
 
-    args = parser.parse_args()
+    args = parser.parse_args(_expand_bare_profile(sys.argv[1:]))
 
     if not args.command:
         parser.print_help()
         return
 
-    settings, store, loader, composer = _load_context(getattr(args, "config_dir", None))
+    try:
+        sinks = [telemetry.sink_from_spec(spec) for spec in args.trace or ()]
+    except ValueError as exc:
+        parser.error(str(exc))
+    for sink in sinks:
+        telemetry.add_sink(sink)
+    profiler = None
+    if args.profile:
+        from .profiling import Profiler
+
+        profiler = Profiler(args.profile, args.profile_out, top=args.profile_top)
 
-    command = args.command
-    if command == "templates":
-        if args.templates_command == "list":
-            _cmd_templates_list(loader)
-        elif args.templates_command == "show":
-            _cmd_templates_show(loader, args.template)
+    try:
+        if profiler is not None:
+            profiler.start_profiling()
+        settings, store, loader, composer = _load_context(getattr(args, "config_dir", None))
+
+        command = args.command
+        if command == "templates":
+            if args.templates_command == "list":
+                _cmd_templates_list(loader)
+            elif args.templates_command == "show":
+                _cmd_templates_show(loader, args.template)
+            else:
+                tpl_list.print_help()
+        elif command == "build":
+            if args.all:
+                args.templates = loader.list_templates()
+            if not args.templates:
+                build.error("specify at least one template or --all")
+            if args.filename and len(args.templates) > 1:
+                build.error("--filename can only be used with a single template")
+            _cmd_build(args, loader, composer)
+        elif command == "preview":
+            _cmd_preview(args, loader, composer)
+        elif command == "bench":
+            _cmd_bench(args, settings)
+        elif command == "serve":
+            _cmd_serve(args, store, loader, composer)
+        elif command == "validate":
+            _cmd_validate(store, loader)
+        elif command == "snapshot":
+            _cmd_snapshot(store)
         else:
-            tpl_list.print_help()
-    elif command == "build":
-        _cmd_build(args, loader, composer)
-    elif command == "preview":
-        _cmd_preview(args, loader, composer)
-    elif command == "validate":
-        _cmd_validate(store, loader)
-    else:
-        parser.print_help()
+            parser.print_help()
+    finally:
+        if profiler is not None:
+            for path in profiler.stop_profiling(sys.argv[1:]):
+                print(f"📈 Profile written to {path}", file=sys.stderr)
+        telemetry.shutdown()
 
 
 def _cmd_templates_list(loader: TemplateLoader):
@@ -87,57 +215,101 @@ def _cmd_templates_show(loader: TemplateLoader, template: str):
 
 
 def _cmd_build(args, loader: TemplateLoader, composer: ResumeComposer):
-    config = loader.load(args.template)
-    resume = composer.compose(config)
-
-    exporter = registry.create(args.export)
-    args.out.mkdir(parents=True, exist_ok=True)
-    file_ext = args.export if args.export != "markdown" else "md"
-
-    filename: str
-    if args.filename:
-        filename = args.filename
-        if not filename.lower().endswith(f".{file_ext}"):
-            filename = f"{filename}.{file_ext}"
-    else:
-        custom = None
-        if config.output and isinstance(config.output, dict):
-            custom_value = config.output.get("filename")
-            if isinstance(custom_value, str) and custom_value.strip():
-                custom = custom_value.strip()
-        if custom:
-            filename = custom
-            if not filename.lower().endswith(f".{file_ext}"):
-                filename = f"{filename}.{file_ext}"
+    from .builds import BuildContext, BuildOptions, build_many, format_summary
+
+    options = BuildOptions(
+        export=args.export,
+        out=args.out,
+        filename=args.filename,
+        since=args.since,
+        force=args.force,
+        deterministic=args.deterministic,
+    )
+    results = build_many(
+        args.templates,
+        options,
+        jobs=args.jobs,
+        config_dir=args.config_dir,
+        context=BuildContext(loader, composer),
+    )
+
+    if len(results) == 1:
+        result = results[0]
+        if result.status == "built":
+            print(f"✅ Created {args.export} at {result.output}")
+            for line in result.fit.describe() if result.fit else []:
+                print(f"   {line}")
+        elif result.status == "cached":
+            print(f"⏭️  {result.output} is up to date")
+        elif result.status == "skipped":
+            print(f"⏭️  {result.template} unaffected by changes since {args.since}, skipping")
         else:
-            safe_name = config.template.replace("_", "-")
-            filename = f"{safe_name}.{file_ext}"
-    destination = args.out / filename
+            print(f"❌ Failed to build {result.template}: {result.error}")
+    else:
+        print(format_summary(results))
 
-    output = exporter.export(resume, destination)
-    print(f"✅ Created {args.export} at {output}")
+    if not all(result.ok for result in results):
+        raise SystemExit(1)
 
 
 def _cmd_preview(args, loader: TemplateLoader, composer: ResumeComposer):
     config = loader.load(args.template)
-    resume = composer.compose(config)
     exporter = registry.create(args.export)
-    content = exporter.export(resume, None)
-    print(content)
+    resume, _ = fit_for_exporter(composer.compose(config), exporter)
+    if not exporter.binary:
+        print(exporter.export(resume, None))
+        return
+    if sys.stdout.isatty():
+        raise SystemExit(f"Refusing to write binary {args.export} output to a terminal; redirect stdout to a file or pipe")
+    data = exporter.export_bytes(resume)
+    sys.stdout.flush()
+    sys.stdout.buffer.write(data)
+    sys.stdout.buffer.flush()
+
+
+def _cmd_bench(args, settings: Settings):
+    from .bench import STAGES, compare, format_report, run_bench
+
+    stages = args.stages or list(STAGES)
+    unknown = sorted(set(stages) - set(STAGES))
+    if unknown:
+        raise SystemExit(f"Unknown stage(s): {', '.join(unknown)}; choose from {', '.join(STAGES)}")
+    configs_dir = settings.configs_dir or settings.root_dir / "configs"
+    report = run_bench(configs_dir, sizes=args.sizes, repeat=args.repeat, stages=stages, seed=args.seed)
+    payload = json.dumps(report, indent=2) + "\n"
+    if args.out:
+        args.out.write_text(payload, encoding="utf-8")
+        print(format_report(report))
+    else:
+        sys.stdout.write(payload)
+    if args.save_baseline:
+        args.save_baseline.write_text(payload, encoding="utf-8")
 
+    if args.baseline:
+        regressions = compare(report, json.loads(args.baseline.read_text(encoding="utf-8")), args.threshold)
+        for regression in regressions:
+            print(f"❌ {regression}", file=sys.stderr)
+        if regressions:
+            raise SystemExit(1)
+        print(f"✅ No stage regressed more than {args.threshold:g}% against {args.baseline}", file=sys.stderr)
 
-def _cmd_validate(store: DataStore, loader: TemplateLoader):
-    errors: list[str] = []
-    try:
-        store.bundle()
-    except Exception as exc:  # noqa: BLE001
-        errors.append(f"Blocks validation failed: {exc}")
 
-    for config in loader.iter_configs():
-        # ensure summary exists by instantiating composer later; here we just check fields
-        if not config.skill_categories:
-            errors.append(f"Template {config.template} has no skill categories")
+def _cmd_serve(args, store: DataStore, loader: TemplateLoader, composer: ResumeComposer):
+    from .builds import warm_exporter
+    from .server import RenderService, serve
+
+    service = RenderService(store, loader, composer, workers=args.workers, queue_size=args.queue, out=args.out)
+    # Pay the ReportLab import and stylesheet/font setup before the first request.
+    warm_exporter("pdf", loader)
+    where = args.socket or f"http://{args.host}:{args.port}"
+    print(f"Serving resume-cli on {where} ({args.workers} workers, queue {args.queue})", flush=True)
+    serve(service, host=args.host, port=args.port, socket_path=args.socket, quiet=args.quiet)
 
+
+def _cmd_validate(store: DataStore, loader: TemplateLoader):
+    from .builds import validation_errors
+
+    errors = validation_errors(store, loader)
     if errors:
         print("Validation issues detected:")
         for issue in errors:
@@ -146,5 +318,10 @@ def _cmd_validate(store: DataStore, loader: TemplateLoader):
         print("All blocks and templates look good.")
 
 
+def _cmd_snapshot(store: DataStore):
+    path = write_snapshot(store.blocks_path)
+    print(f"✅ Snapshot written to {path}")
+
+
 if __name__ == "__main__":
     app()
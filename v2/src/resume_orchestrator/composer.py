@@ -1,31 +1,273 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
 from .data_models import BlocksBundle, ExperienceBlock, TemplateConfig
-from .filters import apply_experience_filters
+from .dependencies import TemplateDependencies, diff_bundles
+from .filters import FilterPlan, SortAll, compile_filters, template_tokens
+from .telemetry import span
 
+if TYPE_CHECKING:
+    from .data_store import BundleSnapshot, DataStore
 
-@dataclass
+
+@dataclass(frozen=True)
 class ComposedResume:
-    meta: Dict[str, object]
-    personal_info: Dict[str, object]
+    """Exporter-ready resume. Instances are read-only and may be shared between threads."""
+
+    meta: Mapping[str, object]
+    personal_info: Mapping[str, object]
     summary: str
-    skills: Dict[str, List[str]]
-    experience: List[ExperienceBlock]
+    skills: Mapping[str, Tuple[str, ...]]
+    experience: Tuple[ExperienceBlock, ...]
     closing_statement: Optional[str] = None
 
 
+def _freeze(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def config_fingerprint(config: TemplateConfig) -> str:
+    """Stable hash of everything in a template config that affects composition."""
+    return hashlib.sha256(config.model_dump_json().encode("utf-8")).hexdigest()
+
+
+def resume_fingerprint(resume: ComposedResume) -> str:
+    """Stable hash of a composed resume's full content."""
+    payload = json.dumps(
+        {
+            "meta": resume.meta,
+            "personal_info": resume.personal_info,
+            "summary": resume.summary,
+            "skills": resume.skills,
+            "experience": [block.model_dump() for block in resume.experience],
+            "closing_statement": resume.closing_statement,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+        default=_json_default,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return dict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+
+class ComposeCache:
+    """Thread-safe LRU of composed resumes keyed by ``(bundle fingerprint, config fingerprint)``."""
+
+    def __init__(self, maxsize: int = 128) -> None:
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Tuple[str, str], ComposedResume]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Tuple[str, str]) -> Optional[ComposedResume]:
+        with self._lock:
+            resume = self._entries.get(key)
+            if resume is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return resume
+
+    def put(self, key: Tuple[str, str], resume: ComposedResume) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = resume
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(self.hits, self.misses, self.evictions, len(self._entries), self.maxsize)
+
+
+@dataclass
+class _SharedWork:
+    """Intermediate results reused across the configs of one ``compose_many`` call."""
+
+    skills: Dict[Tuple[str, Tuple[str, ...]], List[str]]
+    experience: Dict[FilterPlan, List[ExperienceBlock]]
+
+
 class ResumeComposer:
-    def __init__(self, bundle: BlocksBundle) -> None:
-        self._bundle = bundle
+    """Builds ``ComposedResume`` objects from a bundle and template configs.
+
+    ``compose`` results are memoised per bundle fingerprint and config hash.
+    Composers created with ``from_store`` follow ``DataStore`` reloads: the
+    fingerprint is the store's content hash, so a reload naturally misses the
+    cache while unchanged content keeps hitting it.
+
+    Every composed template's dependencies (summary key, skill categories,
+    selected block ids) are recorded so ``affected_templates`` can tell which
+    templates a bundle change actually touches.
+    """
+
+    def __init__(
+        self,
+        bundle: BlocksBundle,
+        *,
+        fingerprint: str | None = None,
+        cache: ComposeCache | None = None,
+    ) -> None:
+        fixed = (bundle, fingerprint or f"bundle:{id(bundle)}")
+        self._source: Callable[[], Tuple[BlocksBundle, str]] = lambda: fixed
+        self._cache = cache if cache is not None else ComposeCache()
+        self._tracked: Dict[str, Tuple[TemplateConfig, TemplateDependencies]] = {}
+        self._affected_listeners: List[Callable[[List[str]], None]] = []
+
+    @classmethod
+    def from_store(cls, store: "DataStore", *, cache: ComposeCache | None = None) -> "ResumeComposer":
+        def source() -> Tuple[BlocksBundle, str]:
+            snapshot = store.snapshot()
+            return snapshot.bundle, snapshot.content_hash
+
+        composer = cls(store.bundle(), cache=cache)
+        composer._source = source
+        store.add_reload_listener(composer._on_reload)
+        return composer
+
+    @property
+    def bundle(self) -> BlocksBundle:
+        return self._source()[0]
+
+    @property
+    def cache(self) -> ComposeCache:
+        return self._cache
 
     def compose(self, config: TemplateConfig) -> ComposedResume:
-        info = self._bundle.personal_info
-        summary = self._resolve_summary(config)
-        skills = self._collect_skills(config)
-        exp = self._collect_experience(config)
+        with span("compose", template=config.template) as traced:
+            bundle, fingerprint = self._source()
+            key = (fingerprint, config_fingerprint(config))
+            resume = self._cache.get(key)
+            traced.set(cached=resume is not None)
+            if resume is None:
+                resume = self._compose(bundle, config)
+                self._cache.put(key, resume)
+            self._track(bundle, config, resume)
+            return resume
+
+    def compose_many(self, configs: Sequence[TemplateConfig]) -> List[ComposedResume]:
+        """Compose several templates in one pass, returning results in input order.
+
+        Skill categories requested with the same ``skill_levels`` are collected
+        and sorted once, and templates with the same ``filters:`` block share
+        one ranked experience selection, even when their names (and so their
+        ``hidden_for`` matches) or block limits differ. Results also go through the compose
+        cache, so repeated configs are composed only once.
+        """
+        bundle, fingerprint = self._source()
+        shared = _SharedWork(skills={}, experience={})
+        composed: Dict[Tuple[str, str], ComposedResume] = {}
+        results: List[ComposedResume] = []
+        for config in configs:
+            key = (fingerprint, config_fingerprint(config))
+            resume = composed.get(key) or self._cache.get(key)
+            if resume is None:
+                resume = self._compose(bundle, config, shared)
+                self._cache.put(key, resume)
+            self._track(bundle, config, resume)
+            composed[key] = resume
+            results.append(resume)
+        return results
+
+    def dependencies(self) -> Dict[str, TemplateDependencies]:
+        """Dependencies recorded for every template composed so far, by template key."""
+        return {template: deps for template, (_, deps) in self._tracked.items()}
+
+    def affected_templates(
+        self,
+        old_bundle: BlocksBundle,
+        new_bundle: BlocksBundle,
+        configs: Iterable[TemplateConfig] | None = None,
+    ) -> List[str]:
+        """Template keys whose composed output differs between two bundles.
+
+        Without ``configs`` the templates composed so far are checked. Changes
+        to tags, periods or visibility can alter which blocks a template
+        selects, so in that case its filter plan is re-run on ``new_bundle``.
+        """
+        if configs is None:
+            tracked = list(self._tracked.values())
+        else:
+            tracked = [(config, self._dependencies(old_bundle, config)) for config in configs]
+        diff = diff_bundles(old_bundle, new_bundle)
+        if diff.empty:
+            return []
+        affected = []
+        for config, deps in tracked:
+            if deps.touched_by(diff):
+                affected.append(config.template)
+            elif diff.selection:
+                selected = self._collect_experience(new_bundle, config)
+                if tuple(block.id for block in selected) != deps.block_ids:
+                    affected.append(config.template)
+        return sorted(affected)
+
+    def add_affected_listener(self, listener: Callable[[List[str]], None]) -> None:
+        """Call ``listener`` with the affected template keys after each store reload."""
+        self._affected_listeners.append(listener)
+
+    def _on_reload(self, old: "BundleSnapshot", new: "BundleSnapshot") -> None:
+        affected = self.affected_templates(old.bundle, new.bundle)
+        for listener in list(self._affected_listeners):
+            listener(affected)
+
+    def _track(self, bundle: BlocksBundle, config: TemplateConfig, resume: ComposedResume) -> None:
+        self._tracked[config.template] = (config, self._dependencies(bundle, config, resume.experience))
+
+    def _dependencies(
+        self,
+        bundle: BlocksBundle,
+        config: TemplateConfig,
+        selected: Sequence[ExperienceBlock] | None = None,
+    ) -> TemplateDependencies:
+        if selected is None:
+            selected = self._collect_experience(bundle, config)
+        return TemplateDependencies(
+            summary_key=config.summary_key,
+            skill_keys=frozenset(key for key in config.skill_categories if key in bundle.skills),
+            block_ids=tuple(block.id for block in selected),
+        )
+
+    def _compose(self, bundle: BlocksBundle, config: TemplateConfig, shared: _SharedWork | None = None) -> ComposedResume:
+        info = bundle.personal_info
+        summary = self._resolve_summary(bundle, config)
+        skills = self._collect_skills(bundle, config, shared)
+        exp = self._collect_experience(bundle, config, shared)
 
         meta = {
             "template": config.template,
@@ -41,45 +283,58 @@ class ResumeComposer:
         }
 
         return ComposedResume(
-            meta=meta,
-            personal_info=personal,
+            meta=_freeze(meta),
+            personal_info=_freeze(personal),
             summary=summary,
-            skills=skills,
-            experience=exp,
+            skills=_freeze(skills),
+            experience=tuple(exp),
             closing_statement=config.closing_statement,
         )
 
-    def _resolve_summary(self, config: TemplateConfig) -> str:
+    def _resolve_summary(self, bundle: BlocksBundle, config: TemplateConfig) -> str:
         try:
-            return self._bundle.summaries[config.summary_key]
+            return bundle.summaries[config.summary_key]
         except KeyError as exc:
             raise KeyError(f"summary '{config.summary_key}' not found in blocks") from exc
 
-    def _collect_skills(self, config: TemplateConfig) -> Dict[str, List[str]]:
+    def _collect_skills(
+        self, bundle: BlocksBundle, config: TemplateConfig, shared: _SharedWork | None = None
+    ) -> Dict[str, List[str]]:
         skills: Dict[str, List[str]] = {}
+        levels = tuple(config.skill_levels)
         for key in config.skill_categories:
-            category = self._bundle.skills.get(key)
+            category = bundle.skills.get(key)
             if not category:
                 continue
-            values = category.collect(config.skill_levels)
+            memo_key = (key, levels)
+            values = shared.skills.get(memo_key) if shared else None
+            if values is None:
+                values = sorted(category.collect(config.skill_levels))
+                if shared:
+                    shared.skills[memo_key] = values
             if values:
-                skills[category.category] = sorted(values)
+                skills[category.category] = values
         return skills
 
-    def _collect_experience(self, config: TemplateConfig) -> List[ExperienceBlock]:
-        filters_cfg = config.filters
-        include_tags = filters_cfg.get("include_tags")
-        exclude_tags = filters_cfg.get("exclude_tags")
-        priority_tags = filters_cfg.get("priority_tags")
-        limit_years = filters_cfg.get("limit_years")
+    def _collect_experience(
+        self, bundle: BlocksBundle, config: TemplateConfig, shared: _SharedWork | None = None
+    ) -> List[ExperienceBlock]:
         max_blocks = config.options.get("max_experience_blocks") if config.options else None
-
-        return apply_experience_filters(
-            self._bundle.experience,
-            include_tags=include_tags,
-            exclude_tags=exclude_tags,
-            priority_tags=priority_tags,
-            limit_years=limit_years,
-            max_items=max_blocks,
-            template_key=config.template,
-        )
+        plan = compile_filters(config.filters, max_items=max_blocks, template_key=config.template)
+        if shared is None:
+            return plan.run(bundle.experience, bundle.tag_index())
+        # Rank once per filter stack, ignoring the template key and block limit; ``hidden_for``
+        # and the limit are applied per template. Sorting is stable, so dropping hidden blocks
+        # from the ranked list and truncating matches the per-template plan exactly.
+        ranked_plan = compile_filters(config.filters)
+        if not isinstance(ranked_plan.selector, SortAll):  # a custom selector may depend on the limit
+            selected = shared.experience.get(plan)
+            if selected is None:
+                selected = shared.experience[plan] = plan.run(bundle.experience, bundle.tag_index())
+            return selected
+        ranked = shared.experience.get(ranked_plan)
+        if ranked is None:
+            ranked = shared.experience[ranked_plan] = ranked_plan.run(bundle.experience, bundle.tag_index())
+        tokens = template_tokens(config.template)
+        visible = [block for block in ranked if tokens.isdisjoint(block.hidden_tokens)]
+        return visible[:max_blocks] if max_blocks else visible
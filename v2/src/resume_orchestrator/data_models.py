@@ -1,7 +1,11 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Literal, Optional
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, Dict, FrozenSet, List, Literal, Optional, Tuple
 import re
+import threading
+import weakref
 from datetime import datetime
 
 from pydantic import BaseModel, Field, ConfigDict
@@ -45,6 +49,86 @@ class SkillCategory(BaseModel):
         return result
 
 
+_MONTHS = {
+    name: number
+    for number, names in enumerate(
+        (
+            ("jan", "january"),
+            ("feb", "february"),
+            ("mar", "march"),
+            ("apr", "april"),
+            ("may",),
+            ("jun", "june"),
+            ("jul", "july"),
+            ("aug", "august"),
+            ("sep", "sept", "september"),
+            ("oct", "october"),
+            ("nov", "november"),
+            ("dec", "december"),
+        ),
+        start=1,
+    )
+    for name in names
+}
+_DATE_RE = re.compile(
+    r"(?:(?P<month_name>[A-Za-z]{3,9})\.?\s+(?P<year_a>(?:19|20)\d{2}))"
+    r"|(?:(?P<month_num>0?[1-9]|1[0-2])[/.](?P<year_b>(?:19|20)\d{2}))"
+    r"|(?:(?P<year_c>(?:19|20)\d{2})-(?P<month_iso>0[1-9]|1[0-2])\b)"
+    r"|(?P<year>(?:19|20)\d{2})"
+)
+_CURRENT_MARKERS = ("present", "current")
+
+
+@dataclass(frozen=True)
+class PeriodRange:
+    """Start/end of an experience period with month precision (``(year, month)`` tuples)."""
+
+    start: Optional[Tuple[int, int]]
+    end: Optional[Tuple[int, int]]
+    current: bool
+
+    @classmethod
+    def parse(cls, period: str) -> "PeriodRange":
+        dates: List[Tuple[int, int]] = []
+        for match in _DATE_RE.finditer(period):
+            if match.group("year_a"):
+                month = _MONTHS.get(match.group("month_name").lower())
+                if month is None:
+                    dates.append((int(match.group("year_a")), 0))
+                else:
+                    dates.append((int(match.group("year_a")), month))
+            elif match.group("year_b"):
+                dates.append((int(match.group("year_b")), int(match.group("month_num"))))
+            elif match.group("year_c"):
+                dates.append((int(match.group("year_c")), int(match.group("month_iso"))))
+            else:
+                dates.append((int(match.group("year")), 0))
+
+        lowered = period.lower()
+        current = any(marker in lowered for marker in _CURRENT_MARKERS)
+        start = end = None
+        if dates:
+            year, month = dates[0]
+            start = (year, month or 1)
+        if len(dates) > 1 and not current:
+            year, month = dates[-1]
+            end = (year, month or 12)
+        elif len(dates) == 1 and not current and "–" not in period and "-" not in period:
+            year, month = dates[0]
+            end = (year, month or 12)
+        return cls(start=start, end=end, current=current)
+
+    @property
+    def start_year(self) -> Optional[int]:
+        return self.start[0] if self.start else None
+
+
+# Cached derived attributes of ``ExperienceBlock`` and the fields they are computed from.
+# Replacing a source field refreshes them; mutating its list in place does not.
+_DERIVED_FIELDS = ("period_range", "tag_set", "hidden_tokens", "current")
+_DERIVED_SOURCES = frozenset({"period", "tags", "hidden_for"})
+
+
 class ExperienceBlock(BaseModel):
     id: str
     title: str
@@ -55,26 +139,99 @@ class ExperienceBlock(BaseModel):
     achievements: List[str] = Field(default_factory=list)
     hidden_for: List[str] = Field(default_factory=list)
 
+    def model_post_init(self, __context: Any) -> None:
+        # Derived fields are parsed once here and cached in the instance dict, so the
+        # filters read them as plain attributes on every compose.
+        self.period_range
+        self.tag_set
+        self.hidden_tokens
+        self.current
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in _DERIVED_SOURCES:
+            self._refresh_derived()
+
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> "ExperienceBlock":
+        # ``model_copy`` copies the instance dict, cached values included, and applies
+        # ``update`` without going through ``__setattr__``.
+        copy = super().model_copy(update=update, deep=deep)
+        if update and not _DERIVED_SOURCES.isdisjoint(update):
+            copy._refresh_derived()
+        return copy
+
+    def _refresh_derived(self) -> None:
+        for name in _DERIVED_FIELDS:
+            self.__dict__.pop(name, None)
+        self.model_post_init(None)
+
+    def derived_state(self) -> Tuple[Any, ...]:
+        """The derived fields as plain values, for ``from_trusted`` (snapshots store this)."""
+        period = self.period_range
+        return (period.start, period.end, period.current, self.tag_set, self.hidden_tokens, self.current)
+
+    @classmethod
+    def from_trusted(cls, fields: Dict[str, Any], derived: Tuple[Any, ...]) -> "ExperienceBlock":
+        """Rebuild a validated block and its derived fields without validating or re-parsing.
+
+        ``fields`` is a ``model_dump()`` of a validated block and is taken over,
+        not copied; ``derived`` is that block's ``derived_state()``. The instance
+        state is set the same way pydantic's own ``__copy__`` sets it.
+        """
+        start, end, period_current, tag_set, hidden_tokens, current = derived
+        fields["period_range"] = PeriodRange(start, end, period_current)
+        fields["tag_set"] = tag_set
+        fields["hidden_tokens"] = hidden_tokens
+        fields["current"] = current
+        block = cls.__new__(cls)
+        object.__setattr__(block, "__dict__", fields)
+        object.__setattr__(block, "__pydantic_fields_set__", set(cls.__pydantic_fields__))
+        object.__setattr__(block, "__pydantic_extra__", None)
+        object.__setattr__(block, "__pydantic_private__", None)
+        return block
+
+    @cached_property
+    def period_range(self) -> PeriodRange:
+        return PeriodRange.parse(self.period)
+
+    @cached_property
+    def tag_set(self) -> FrozenSet[str]:
+        return frozenset(self.tags)
+
+    @cached_property
+    def hidden_tokens(self) -> FrozenSet[str]:
+        return frozenset(token.lower() for token in self.hidden_for)
+
+    @cached_property
+    def current(self) -> bool:
+        return self.period_range.current or "current" in self.tag_set
+
     def matches_tags(self, include: List[str] | None, exclude: List[str] | None) -> bool:
-        tags_set = set(self.tags)
-        if exclude and any(tag in tags_set for tag in exclude):
+        if exclude and not self.tag_set.isdisjoint(exclude):
             return False
-        if include and not any(tag in tags_set for tag in include):
+        if include and self.tag_set.isdisjoint(include):
             return False
         return True
 
     def is_current(self) -> bool:
-        period_lower = self.period.lower()
-        return "present" in period_lower or "current" in period_lower or "current" in self.tags
+        return self.current
 
     def start_year(self) -> int:
-        years = re.findall(r"(?:19|20)\d{2}", self.period)
-        if years:
-            try:
-                return int(years[0])
-            except ValueError:
-                pass
-        return datetime.now().year
+        year = self.period_range.start_year
+        return year if year is not None else datetime.now().year
+
+
+# Tag indexes live outside the model so they never take part in ``BlocksBundle.__eq__``.
+# Models are unhashable, so entries are keyed by ``id`` and dropped when the bundle is freed.
+_TAG_INDEXES: Dict[int, Any] = {}
+_TAG_INDEXES_LOCK = threading.Lock()
+
+
+def find_tag_index(blocks: Any) -> Any:
+    """The tag index already built over exactly ``blocks``, or ``None``."""
+    with _TAG_INDEXES_LOCK:
+        indexes = list(_TAG_INDEXES.values())
+    return next((index for index in indexes if index.covers(blocks)), None)
 
 
 class BlocksBundle(BaseModel):
@@ -83,6 +240,20 @@ class BlocksBundle(BaseModel):
     skills: Dict[str, SkillCategory]
     experience: List[ExperienceBlock]
 
+    def tag_index(self):
+        """Return the inverted tag index over ``experience``, building it on first use."""
+        from .index import TagIndex
+
+        key = id(self)
+        index = _TAG_INDEXES.get(key)
+        if index is None or not index.covers(self.experience):
+            index = TagIndex(self.experience)
+            with _TAG_INDEXES_LOCK:
+                if key not in _TAG_INDEXES:
+                    weakref.finalize(self, _TAG_INDEXES.pop, key, None)
+                _TAG_INDEXES[key] = index
+        return index
+
     @classmethod
     def from_dict(cls, raw: Dict[str, object]) -> "BlocksBundle":
         skills = {key: SkillCategory(**value) for key, value in raw["skills"].items()}
@@ -94,6 +265,22 @@ class BlocksBundle(BaseModel):
             experience=experience,
         )
 
+    @classmethod
+    def from_trusted(cls, raw: Dict[str, object], derived: List[Tuple[Any, ...]]) -> "BlocksBundle":
+        """Rebuild a bundle from data that already passed validation, skipping the validators.
+
+        ``derived`` holds each experience block's ``derived_state()``, so periods
+        are not parsed again.
+        """
+        skills = {key: SkillCategory.model_construct(**value) for key, value in raw["skills"].items()}
+        experience = [ExperienceBlock.from_trusted(item, state) for item, state in zip(raw["experience"], derived)]
+        return cls.model_construct(
+            personal_info=PersonalInfo.model_construct(**raw["personal_info"]),
+            summaries=raw["summaries"],
+            skills=skills,
+            experience=experience,
+        )
+
 
 class TemplateConfig(BaseModel):
     template: str
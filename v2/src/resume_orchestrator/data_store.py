@@ -1,21 +1,174 @@
 from __future__ import annotations
 
+import hashlib
 import json
-from functools import lru_cache
+import threading
+import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict
+from typing import Callable, Dict, List, Optional, Tuple
 
 from .data_models import BlocksBundle
+from .snapshot import load_snapshot
+from .telemetry import span
+
+
+@dataclass(frozen=True)
+class BundleSnapshot:
+    """Immutable view of one successfully loaded bundle."""
+
+    bundle: BlocksBundle
+    generation: int
+    content_hash: str
+    stat_key: Tuple[int, int]
 
 
 class DataStore:
-    """Loads and caches resume blocks."""
+    """Loads and caches resume blocks, reloading them when the file changes.
+
+    Staleness is detected with a cheap ``(mtime, size)`` check first and a
+    content hash second, so touching the file without editing it does not
+    trigger revalidation. Rebuilt bundles are swapped in as a whole snapshot:
+    readers always get a consistent ``BlocksBundle`` and a ``generation``
+    number that increases on every swap. When a compiled snapshot (see
+    ``snapshot.write_snapshot``) matches the content hash it is used instead
+    of full validation.
+    """
 
-    def __init__(self, blocks_path: Path) -> None:
+    def __init__(
+        self,
+        blocks_path: Path,
+        *,
+        background: bool = True,
+        check_interval: float = 0.0,
+        use_snapshot: bool = True,
+    ) -> None:
         self._blocks_path = blocks_path
+        self._use_snapshot = use_snapshot
+        self._background = background
+        self._check_interval = check_interval
+        self._snapshot: Optional[BundleSnapshot] = None
+        self._lock = threading.Lock()
+        self._schedule_lock = threading.Lock()
+        self._reload_thread: Optional[threading.Thread] = None
+        self._last_check = 0.0
+        self._last_error: Optional[Exception] = None
+        self._failed_stat_key: Optional[Tuple[int, int]] = None
+        self._listeners: List[Callable[[BundleSnapshot, BundleSnapshot], None]] = []
+
+    @property
+    def blocks_path(self) -> Path:
+        return self._blocks_path
+
+    @property
+    def generation(self) -> int:
+        """Generation of the current snapshot, ``0`` before the first load."""
+        snapshot = self._snapshot
+        return snapshot.generation if snapshot else 0
+
+    @property
+    def last_error(self) -> Optional[Exception]:
+        """Error from the most recent failed staleness check or background reload, if any."""
+        return self._last_error
+
+    def add_reload_listener(self, listener: Callable[[BundleSnapshot, BundleSnapshot], None]) -> None:
+        """Call ``listener(old, new)`` after every swap to a new generation."""
+        self._listeners.append(listener)
 
-    @lru_cache(maxsize=1)
     def bundle(self) -> BlocksBundle:
-        raw: Dict[str, object] = json.loads(self._blocks_path.read_text(encoding="utf-8"))
-        return BlocksBundle.from_dict(raw)
+        return self.snapshot().bundle
+
+    def snapshot(self) -> BundleSnapshot:
+        snapshot = self._snapshot
+        if snapshot is None:
+            return self.reload()
+        if self._should_check():
+            try:
+                stat_key = self._stat_key()
+            except OSError as exc:  # e.g. the file is mid-replace; keep serving the last good snapshot
+                self._last_error = exc
+                return snapshot
+            if stat_key != snapshot.stat_key and stat_key != self._failed_stat_key:
+                if self._background:
+                    self._schedule_reload()
+                else:
+                    return self.reload()
+        return snapshot
+
+    def reload(self, *, force: bool = False) -> BundleSnapshot:
+        """Synchronously refresh the snapshot if the file content changed."""
+        with span("bundle_load", path=str(self._blocks_path)) as traced:
+            previous, snapshot = self._reload_locked(force)
+            traced.set(generation=snapshot.generation, reloaded=snapshot is not previous)
+        if previous is not None and snapshot is not previous:
+            for listener in list(self._listeners):
+                listener(previous, snapshot)
+        return snapshot
+
+    def _reload_locked(self, force: bool) -> Tuple[Optional[BundleSnapshot], BundleSnapshot]:
+        """Return ``(previous, current)``; ``current is previous`` when nothing was rebuilt."""
+        with self._lock:
+            current = self._snapshot
+            stat_key = self._stat_key()
+            if not force and current is not None and stat_key == current.stat_key:
+                return current, current
+            payload = self._blocks_path.read_bytes()
+            content_hash = hashlib.sha256(payload).hexdigest()
+            if not force and current is not None and content_hash == current.content_hash:
+                # Same content, new mtime: remember the stat so we stop hashing.
+                touched = BundleSnapshot(current.bundle, current.generation, content_hash, stat_key)
+                self._snapshot = touched
+                return touched, touched
+            bundle = self._parse(payload, content_hash)
+            generation = (current.generation if current else 0) + 1
+            snapshot = BundleSnapshot(bundle, generation, content_hash, stat_key)
+            self._snapshot = snapshot
+            self._last_error = None
+            self._failed_stat_key = None
+            return current, snapshot
+
+    def wait_for_reload(self, timeout: float | None = None) -> None:
+        """Block until an in-flight background reload finishes."""
+        thread = self._reload_thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def _parse(self, payload: bytes, content_hash: str) -> BlocksBundle:
+        bundle = load_snapshot(self._blocks_path, content_hash) if self._use_snapshot else None
+        if bundle is None:
+            raw: Dict[str, object] = json.loads(payload.decode("utf-8"))
+            bundle = BlocksBundle.from_dict(raw)
+        # Build derived indexes before the swap so readers never pay for them.
+        bundle.tag_index()
+        return bundle
+
+    def _stat_key(self) -> Tuple[int, int]:
+        stat = self._blocks_path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    def _should_check(self) -> bool:
+        if self._check_interval <= 0:
+            return True
+        now = time.monotonic()
+        if now - self._last_check < self._check_interval:
+            return False
+        self._last_check = now
+        return True
+
+    def _schedule_reload(self) -> None:
+        with self._schedule_lock:
+            thread = self._reload_thread
+            if thread is not None and thread.is_alive():
+                return
+            thread = threading.Thread(target=self._background_reload, name="datastore-reload", daemon=True)
+            self._reload_thread = thread
+        thread.start()
 
+    def _background_reload(self) -> None:
+        stat_key: Optional[Tuple[int, int]] = None
+        try:
+            stat_key = self._stat_key()
+            self.reload()
+        except Exception as exc:  # noqa: BLE001 - keep serving the last good snapshot
+            self._last_error = exc
+            self._failed_stat_key = stat_key
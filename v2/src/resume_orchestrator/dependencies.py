@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import FrozenSet, Tuple
+
+from .data_models import BlocksBundle, ExperienceBlock
+
+# Fields that decide whether and where a block is selected, as opposed to its rendered content.
+_SELECTION_FIELDS = ("tags", "period", "hidden_for")
+
+
+@dataclass(frozen=True)
+class BundleDiff:
+    """What changed between two versions of ``blocks.json``."""
+
+    personal_info: bool
+    summaries: FrozenSet[str]
+    skills: FrozenSet[str]
+    blocks: FrozenSet[str]
+    selection: bool
+
+    @property
+    def empty(self) -> bool:
+        return not (self.personal_info or self.summaries or self.skills or self.blocks or self.selection)
+
+
+@dataclass(frozen=True)
+class TemplateDependencies:
+    """Bundle keys one composed template read."""
+
+    summary_key: str
+    skill_keys: FrozenSet[str]
+    block_ids: Tuple[str, ...]
+
+    def touched_by(self, diff: BundleDiff) -> bool:
+        return (
+            diff.personal_info
+            or self.summary_key in diff.summaries
+            or not self.skill_keys.isdisjoint(diff.skills)
+            or not diff.blocks.isdisjoint(self.block_ids)
+        )
+
+
+def _changed_keys(old: dict, new: dict) -> FrozenSet[str]:
+    return frozenset(key for key in old.keys() | new.keys() if old.get(key) != new.get(key))
+
+
+def _selection_view(block: ExperienceBlock):
+    return tuple(getattr(block, field) for field in _SELECTION_FIELDS)
+
+
+def diff_bundles(old: BlocksBundle, new: BlocksBundle) -> BundleDiff:
+    old_blocks = {block.id: block for block in old.experience}
+    new_blocks = {block.id: block for block in new.experience}
+    changed_blocks = _changed_keys(old_blocks, new_blocks)
+    selection = [block.id for block in old.experience] != [block.id for block in new.experience] or any(
+        block_id in old_blocks
+        and block_id in new_blocks
+        and _selection_view(old_blocks[block_id]) != _selection_view(new_blocks[block_id])
+        for block_id in changed_blocks
+    )
+    return BundleDiff(
+        personal_info=old.personal_info != new.personal_info,
+        summaries=_changed_keys(old.summaries, new.summaries),
+        skills=_changed_keys(old.skills, new.skills),
+        blocks=changed_blocks,
+        selection=selection,
+    )
@@ -1,5 +1,16 @@
 from .base import Exporter, registry, register_exporter
-from .markdown import MarkdownExporter
-from .pdf import PdfExporter
+
+registry.register_lazy("markdown", "resume_orchestrator.exporters.markdown:MarkdownExporter")
+registry.register_lazy("pdf", "resume_orchestrator.exporters.pdf:PdfExporter")
 
 __all__ = ["Exporter", "registry", "register_exporter", "MarkdownExporter", "PdfExporter"]
+
+
+def __getattr__(name: str):
+    # Keep ``from resume_orchestrator.exporters import PdfExporter`` working without
+    # importing ReportLab for callers that never touch the PDF exporter.
+    if name == "MarkdownExporter":
+        return registry.resolve("markdown")
+    if name == "PdfExporter":
+        return registry.resolve("pdf")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
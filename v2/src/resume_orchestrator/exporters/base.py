@@ -1,36 +1,160 @@
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
+import os
+import sys
+import tempfile
+from abc import ABC
+from importlib import import_module
+from io import BytesIO
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, Mapping
 
 from ..composer import ComposedResume
+from ..telemetry import span
+
+ENTRY_POINT_GROUP = "resume_orchestrator.exporters"
 
 
 class Exporter(ABC):
+    """Base class for output formats.
+
+    Exporters implement ``write`` to render into any writable binary stream;
+    ``export_bytes`` and ``export`` are thin wrappers around it. Text formats
+    set ``binary = False`` so ``export(resume)`` without a destination returns
+    the rendered text. ``export`` renders into a temporary file next to the
+    destination and moves it into place only on success, so a failed render
+    never clobbers the previous output. Older exporters that override ``export`` directly keep
+    working: ``export_bytes`` then renders through ``export``. A subclass must
+    override at least one of the two.
+    """
+
     format: str
+    binary: bool = True
+    encoding: str = "utf-8"
+    # Bump when a change to the exporter alters its output, so build manifests re-render.
+    version: str = "1"
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if cls.write is Exporter.write and cls.export is Exporter.export:
+            raise TypeError(f"{cls.__name__} must override write() or export()")
+
+    def write(self, resume: ComposedResume, stream: BinaryIO) -> None:
+        """Render the resume into ``stream``."""
+        raise NotImplementedError(f"{type(self).__name__} does not support stream output")
+
+    def export_bytes(self, resume: ComposedResume) -> bytes:
+        if type(self).write is Exporter.write:
+            return self._export_bytes_via_export(resume)
+        buffer = BytesIO()
+        with span("export", format=self.format) as traced:
+            self.write(resume, buffer)
+            traced.set(bytes=buffer.tell())
+        return buffer.getvalue()
 
-    @abstractmethod
     def export(self, resume: ComposedResume, destination: Path | None = None) -> str:
         """Render the resume and return the output path or textual representation."""
+        if destination is None:
+            if self.binary:
+                raise ValueError(f"{self.format} exporter requires a destination path; use export_bytes()")
+            return self.export_bytes(resume).decode(self.encoding)
+        destination = Path(destination)
+        with span("export", format=self.format, destination=str(destination)):
+            fd, tmp = tempfile.mkstemp(prefix=f".{destination.name}.", suffix=".tmp", dir=destination.parent)
+            try:
+                with os.fdopen(fd, "wb") as stream:
+                    self.write(resume, stream)
+                os.chmod(tmp, 0o644)  # mkstemp creates 0600
+                os.replace(tmp, destination)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        return str(destination)
+
+    def _export_bytes_via_export(self, resume: ComposedResume) -> bytes:
+        """``export_bytes`` for exporters that only implement ``export``."""
+        with span("export", format=self.format, legacy=True):
+            if not self.binary:
+                return self.export(resume).encode(self.encoding)
+            with tempfile.TemporaryDirectory(prefix="resume-export-") as tmp:
+                destination = Path(tmp) / f"resume.{self.format}"
+                return Path(self.export(resume, destination)).read_bytes()
+
+    def settings(self) -> Mapping[str, Any]:
+        """Constructor settings that change the rendered output (part of build digests)."""
+        return {}
 
 
 class ExporterRegistry:
+    """Maps format names to exporter classes, importing them on first use.
+
+    Exporters can be registered eagerly (``register``) or by ``"module:Class"``
+    path (``register_lazy``); third-party packages advertise theirs through the
+    ``resume_orchestrator.exporters`` entry point group. Neither lazy path
+    imports the exporter module until ``create`` asks for that format.
+    """
+
     def __init__(self) -> None:
         self._exporters: dict[str, type[Exporter]] = {}
+        self._lazy: dict[str, str] = {}
+        self._entry_points_loaded = False
 
     def register(self, exporter_cls: type[Exporter]) -> None:
         self._exporters[exporter_cls.format] = exporter_cls
 
-    def create(self, format_name: str) -> Exporter:
-        try:
-            exporter_cls = self._exporters[format_name]
-        except KeyError as exc:
-            raise ValueError(f"Unsupported export format '{format_name}'") from exc
-        return exporter_cls()
+    def register_lazy(self, format_name: str, target: str) -> None:
+        if format_name not in self._exporters:
+            self._lazy[format_name] = target
 
-    def available_formats(self) -> list[str]:
-        return sorted(self._exporters.keys())
+    def create(self, format_name: str, **options: Any) -> Exporter:
+        return self.resolve(format_name)(**options)
+
+    def resolve(self, format_name: str) -> type[Exporter]:
+        exporter_cls = self._exporters.get(format_name)
+        if exporter_cls is not None:
+            return exporter_cls
+        if not self.supports(format_name):
+            raise ValueError(f"Unsupported export format '{format_name}'")
+        target = self._lazy[format_name]
+        exporter_cls = _import_target(target)
+        self._exporters[format_name] = exporter_cls
+        self._lazy.pop(format_name, None)
+        return exporter_cls
+
+    def supports(self, format_name: str) -> bool:
+        """Whether ``format_name`` can be created; plugins are scanned only for unknown names."""
+        if format_name in self._exporters or format_name in self._lazy:
+            return True
+        self._load_entry_points()
+        return format_name in self._exporters or format_name in self._lazy
+
+    def available_formats(self, *, include_plugins: bool = True) -> list[str]:
+        if include_plugins:
+            self._load_entry_points()
+        return sorted(set(self._exporters) | set(self._lazy))
+
+    def _load_entry_points(self) -> None:
+        if self._entry_points_loaded:
+            return
+        self._entry_points_loaded = True
+        for entry_point in _iter_entry_points(ENTRY_POINT_GROUP):
+            self.register_lazy(entry_point.name, entry_point.value)
+
+
+def _import_target(target: str) -> Any:
+    module_name, _, attr = target.partition(":")
+    obj: Any = import_module(module_name)
+    for part in attr.split(".") if attr else []:
+        obj = getattr(obj, part)
+    return obj
+
+
+def _iter_entry_points(group: str):
+    from importlib.metadata import entry_points
+
+    if sys.version_info >= (3, 10):
+        return entry_points(group=group)
+    return entry_points().get(group, [])  # Python 3.9
 
 
 registry = ExporterRegistry()
@@ -39,4 +163,3 @@ registry = ExporterRegistry()
 def register_exporter(cls: type[Exporter]) -> type[Exporter]:
     registry.register(cls)
     return cls
-
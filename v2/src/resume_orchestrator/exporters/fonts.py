@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from reportlab.lib.fonts import addMapping, tt2ps
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+
+from .styles import BASE_STYLES, get_stylesheet
+
+# (face option, (bold, italic), registered font name suffix)
+FACES: Tuple[Tuple[str, Tuple[int, int], str], ...] = (
+    ("normal", (0, 0), ""),
+    ("bold", (1, 0), "-Bold"),
+    ("italic", (0, 1), "-Italic"),
+    ("bold_italic", (1, 1), "-BoldItalic"),
+)
+
+
+@dataclass(frozen=True)
+class FontFamily:
+    """A TrueType family from a template's ``options.fonts``.
+
+    Only ``normal`` is required; missing faces fall back to it. Paths are
+    absolute or bare file names found on ReportLab's ``TTFSearchPath``.
+    """
+
+    name: str
+    normal: str
+    bold: Optional[str] = None
+    italic: Optional[str] = None
+    bold_italic: Optional[str] = None
+
+    @classmethod
+    def from_option(cls, name: str, value: Any) -> "FontFamily":
+        if isinstance(value, str):
+            return cls(name=name, normal=value)
+        if isinstance(value, Mapping) and isinstance(value.get("normal"), str):
+            return cls(name=name, **{face: value.get(face) for face, _, _ in FACES})
+        raise ValueError(f"font family '{name}' needs a 'normal' TTF path")
+
+    def face_path(self, face: str) -> str:
+        return getattr(self, face) or self.normal
+
+
+_registered: Dict[str, FontFamily] = {}
+_lock = threading.Lock()
+
+
+def register_family(family: FontFamily) -> str:
+    """Register ``family``'s faces with ReportLab once per process and return its name.
+
+    ReportLab parses each TTF here and, when a document is saved, embeds
+    only the glyphs that document used (as 256-glyph subsets), so the font
+    files themselves are never copied whole into a PDF. Registrations are
+    per process: build workers register their templates' fonts in the pool
+    initializer (``builds.warm_exporter``), which is a no-op for families a
+    forked worker inherited.
+    """
+    with _lock:
+        existing = _registered.get(family.name)
+        if existing is not None:
+            if existing != family:
+                raise ValueError(f"font family '{family.name}' is already registered with different files")
+            return family.name
+        for face, (bold, italic), suffix in FACES:
+            face_name = f"{family.name}{suffix}"
+            if face_name not in pdfmetrics.getRegisteredFontNames():
+                pdfmetrics.registerFont(TTFont(face_name, family.face_path(face)))
+            addMapping(family.name, bold, italic, face_name)
+        _registered[family.name] = family
+        return family.name
+
+
+def register_fonts(fonts: Optional[Mapping[str, Any]]) -> Tuple[str, ...]:
+    """Register every family in an ``options.fonts`` mapping; returns their names."""
+    return tuple(register_family(FontFamily.from_option(name, value)) for name, value in (fonts or {}).items())
+
+
+def family_theme(theme: Optional[Mapping[str, Any]], family: str) -> Dict[str, Any]:
+    """``theme`` with every base style switched to the matching face of ``family``.
+
+    Bold/italic faces are chosen from each style's current built-in font, so
+    headings stay bold and ``BodyItalic`` stays italic. Explicit ``fontName``
+    overrides in ``theme`` win. ``family`` is a registered TTF family or a
+    built-in one such as ``times``.
+    """
+    base = get_stylesheet()
+    themed: Dict[str, Any] = {name: dict(attrs) for name, attrs in (theme or {}).items()}
+    for name, _, _ in BASE_STYLES:
+        font = base[name].fontName
+        bold, italic = int("Bold" in font), int("Italic" in font or "Oblique" in font)
+        themed.setdefault(name, {}).setdefault("fontName", tt2ps(family, bold, italic))
+    return themed
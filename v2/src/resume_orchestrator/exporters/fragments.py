@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional, Tuple
+
+from reportlab.platypus import Paragraph
+
+from .paragraphs import _parse
+
+
+@dataclass(frozen=True)
+class _Wrapped:
+    width: float
+    height: float
+    wrap_widths: Tuple[float, float]
+    lines: Any  # ReportLab's ``blPara``; read-only once cached
+
+
+class FragmentCache:
+    """Thread-safe LRU of paragraph line breaks, keyed by content hash and width.
+
+    Header and summary paragraphs repeat verbatim across variants of one
+    profile; their line breaking is done once and reused by later stories.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Tuple[str, float], _Wrapped]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple[str, float]) -> Optional[_Wrapped]:
+        with self._lock:
+            wrapped = self._entries.get(key)
+            if wrapped is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return wrapped
+
+    def put(self, key: Tuple[str, float], wrapped: _Wrapped) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = wrapped
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+fragment_cache = FragmentCache()
+
+
+class FragmentParagraph(Paragraph):
+    """A fresh ``Paragraph`` per story whose wrap result comes from ``fragment_cache``.
+
+    Only ``wrap`` is cached; splitting (rare for header/summary text) falls
+    back to a normal wrap so the shared line breaks are never sliced.
+    """
+
+    content_key: Optional[str] = None
+
+    def wrap(self, availWidth, availHeight):
+        key = (self.content_key, availWidth)
+        wrapped = fragment_cache.get(key) if self.content_key else None
+        if wrapped is None:
+            width, height = super().wrap(availWidth, availHeight)
+            if self.content_key:
+                fragment_cache.put(key, _Wrapped(width, height, tuple(self._wrapWidths), self.blPara))
+            return width, height
+        self.width, self.height = wrapped.width, wrapped.height
+        self._wrapWidths = list(wrapped.wrap_widths)
+        self.blPara = wrapped.lines
+        return wrapped.width, wrapped.height
+
+    def split(self, availWidth, availHeight):
+        self.content_key = None
+        Paragraph.wrap(self, availWidth, availHeight)
+        return super().split(availWidth, availHeight)
+
+
+def fragment_paragraph(text: str, style_name: str, theme: str) -> Paragraph:
+    """Static-section paragraph keyed by a hash of its text, style and theme."""
+    style, frags, bullet_text = _parse(text, style_name, theme)
+    paragraph = FragmentParagraph(text, style, bulletText=bullet_text, frags=[frag.clone() for frag in frags])
+    if style.wordWrap not in ("RTL", "CJK"):  # RTL drawing reverses line words in place
+        paragraph.content_key = hashlib.sha256("\0".join((theme, style_name, text)).encode("utf-8")).hexdigest()
+    return paragraph
+
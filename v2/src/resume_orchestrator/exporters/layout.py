@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from io import BytesIO
+from typing import Any, Dict, MutableMapping, Optional, Sequence, Tuple
+
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus import Frame
+
+_FUZZ = 1e-6
+
+
+@dataclass(frozen=True)
+class LayoutMeasurement:
+    """Result of a layout-only pass over a PDF story. Heights are in points."""
+
+    pages: int
+    section_heights: Dict[str, float]
+    frame_height: float
+    last_page_used: float
+    page_budget: Optional[int]
+
+    @property
+    def used_height(self) -> float:
+        """Vertical space consumed, counting every full page before the last one."""
+        return (self.pages - 1) * self.frame_height + self.last_page_used
+
+    @property
+    def overflow(self) -> float:
+        """Points beyond the page budget; ``0.0`` when there is no budget or it fits."""
+        if self.page_budget is None:
+            return 0.0
+        return max(0.0, self.used_height - self.page_budget * self.frame_height)
+
+    @property
+    def fits(self) -> bool:
+        return self.page_budget is None or self.pages <= self.page_budget
+
+
+def measure_sections(
+    sections: Sequence[Tuple[str, Sequence[Any]]],
+    frame: Frame,
+    page_budget: Optional[int] = None,
+    sizes: Optional[MutableMapping[int, Tuple[Any, Tuple[float, float]]]] = None,
+) -> LayoutMeasurement:
+    """Flow ``sections`` through repeated copies of ``frame`` using wrap/split only.
+
+    Mirrors ``Frame._add``/``Frame.split`` (space before/after, attached-space
+    overlap, splitting across pages) but never calls ``drawOn``. Some
+    flowables (lists, tables) read ``self.canv`` while wrapping, so they get a
+    scratch canvas that is never drawn on or saved.
+
+    ``sizes`` lets a caller that measures the same flowables repeatedly (in
+    the same frame) skip re-wrapping them: it maps ``id(flowable)`` to
+    ``(flowable, wrap size)`` for the flowables passed in ``sections``, and
+    holding the flowable keeps its id from being reused. Split parts are
+    always wrapped afresh.
+    """
+    canvas = Canvas(BytesIO(), pagesize=(frame._x2, frame._y2))
+    width = frame._getAvailableWidth()
+    top = frame._y2 - frame._topPadding
+    bottom = frame._y1p
+    frame_height = top - bottom
+    overlap_space = frame._oASpace
+
+    queue = deque((name, flowable, True) for name, flowables in sections for flowable in flowables)
+    heights: Dict[str, float] = {name: 0.0 for name, _ in sections}
+    pages = 1
+    y = top
+    at_top = True
+    prev_after = 0.0
+
+    while queue:
+        name, flowable, whole = queue.popleft()
+        zero_size = getattr(flowable, "_ZEROSIZE", False)
+        space = 0.0
+        if not at_top:
+            space = flowable.getSpaceBefore()
+            if overlap_space:
+                if getattr(flowable, "_SPACETRANSFER", False) or zero_size:
+                    space = prev_after
+                space = max(space - prev_after, 0)
+        available = y - bottom - space
+
+        flowable._frame = frame
+        flowable.canv = canvas
+        try:
+            if available > 0 or zero_size:
+                if whole and sizes is not None:
+                    _, height = _remembered_wrap(flowable, width, available, sizes)
+                else:
+                    _, height = flowable.wrap(width, available)
+                if y - height - space >= bottom - _FUZZ:
+                    after = flowable.getSpaceAfter()
+                    heights[name] += space + height + after
+                    y -= space + height + after
+                    if overlap_space:
+                        prev_after = prev_after if getattr(flowable, "_SPACETRANSFER", False) else after
+                    if y != top:
+                        at_top = False
+                    continue
+                parts = flowable.split(width, available)
+                if parts:
+                    queue.extendleft((name, part, False) for part in reversed(parts))
+                    continue
+
+            if at_top:
+                # Too tall for an empty page: ReportLab would raise; count it and move on.
+                if whole and sizes is not None:
+                    _, height = _remembered_wrap(flowable, width, frame_height, sizes)
+                else:
+                    _, height = flowable.wrap(width, frame_height)
+                heights[name] += height
+                y = bottom
+                at_top = False
+                continue
+        finally:
+            del flowable.canv
+
+        pages += 1
+        y = top
+        at_top = True
+        prev_after = 0.0
+        queue.appendleft((name, flowable, whole))
+
+    return LayoutMeasurement(
+        pages=pages,
+        section_heights=heights,
+        frame_height=frame_height,
+        last_page_used=top - y,
+        page_budget=page_budget,
+    )
+
+
+def _remembered_wrap(flowable: Any, width: float, height: float, sizes: MutableMapping[int, Any]) -> Tuple[float, float]:
+    # Paragraphs, lists, tables, rules and spacers size themselves from the width
+    # alone, and split() reuses the state of the last wrap at that same width.
+    entry = sizes.get(id(flowable))
+    if entry is None or entry[0] is not flowable:
+        entry = sizes[id(flowable)] = (flowable, flowable.wrap(width, height))
+    return entry[1]
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-from pathlib import Path
-from textwrap import indent
+from typing import BinaryIO
 
 from ..composer import ComposedResume
 from .base import Exporter, register_exporter
@@ -10,13 +9,10 @@ from .base import Exporter, register_exporter
 @register_exporter
 class MarkdownExporter(Exporter):
     format = "markdown"
+    binary = False
 
-    def export(self, resume: ComposedResume, destination: Path | None = None) -> str:
-        body = self._render(resume)
-        if destination:
-            destination.write_text(body, encoding="utf-8")
-            return str(destination)
-        return body
+    def write(self, resume: ComposedResume, stream: BinaryIO) -> None:
+        stream.write(self._render(resume).encode(self.encoding))
 
     def _render(self, resume: ComposedResume) -> str:
         lines: list[str] = []
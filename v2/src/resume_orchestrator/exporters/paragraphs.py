@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Tuple
+
+from reportlab.platypus import Paragraph
+from reportlab.platypus.paragraph import cleanBlockQuotedText, textTransformFrags
+from reportlab.platypus.paraparser import ParaParser
+
+from .styles import _stylesheet_for_key
+
+
+def cached_paragraph(text: str, style_name: str, theme: str) -> Paragraph:
+    """A new ``Paragraph`` for ``text`` whose markup was parsed at most once per process.
+
+    ``theme`` is the stylesheet's ``styles.theme_key``. The parsed fragments
+    are shared, so every call clones them: each story gets its own flowable
+    and fragment objects and layout never touches the cached copy.
+    """
+    style, frags, bullet_text = _parse(text, style_name, theme)
+    return Paragraph(text, style, bulletText=bullet_text, frags=[frag.clone() for frag in frags])
+
+
+@lru_cache(maxsize=4096)
+def _parse(text: str, style_name: str, theme: str) -> Tuple[Any, Tuple[Any, ...], Any]:
+    # Same steps as ``Paragraph._setup`` when no fragments are passed in.
+    parser = ParaParser()
+    parser.caseSensitive = 1
+    style, frags, bullet_frags = parser.parse(cleanBlockQuotedText(text), _stylesheet_for_key(theme)[style_name])
+    if frags is None:
+        raise ValueError(f"xml parser error ({parser.errors[0]}) in paragraph beginning\n'{text[:30]}'")
+    textTransformFrags(frags, style)
+    return style, tuple(frags), bullet_frags or getattr(style, "bulletText", None)
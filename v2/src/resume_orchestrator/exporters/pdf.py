@@ -1,13 +1,12 @@
 from __future__ import annotations
 
-from pathlib import Path
+from typing import Any, BinaryIO, Dict, List, Mapping, Optional, Tuple
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
 from reportlab.lib.units import mm
-from reportlab.lib.enums import TA_CENTER
 from reportlab.platypus import (
+    Frame,
     Paragraph,
     SimpleDocTemplate,
     Spacer,
@@ -19,138 +18,151 @@ from reportlab.platypus import (
 )
 
 from ..composer import ComposedResume
+from ..fitting import Measure, page_budget_from_options
 from .base import Exporter, register_exporter
+from .fonts import family_theme, register_fonts
+from .fragments import fragment_paragraph
+from .layout import LayoutMeasurement, measure_sections
+from .paragraphs import cached_paragraph
+from .styles import Stylesheet, get_stylesheet, theme_key
+
+
+PRODUCER = "resume-orchestrator"
+PAGE_SIZE = A4
+PAGE_MARGIN = 20 * mm
 
 
 @register_exporter
 class PdfExporter(Exporter):
+    """Renders resumes with ReportLab.
+
+    Templates can embed TrueType fonts for Unicode content with
+    ``options.fonts`` (family name -> TTF paths) and ``options.font_family``;
+    see ``fonts.py``.
+
+    In deterministic mode (``deterministic=True`` or ``options.deterministic``
+    in the template) ReportLab's invariant mode pins creation dates and the
+    document ID, and metadata is derived from the resume only, so identical
+    input yields byte-identical PDFs.
+    """
+
     format = "pdf"
 
-    def export(self, resume: ComposedResume, destination: Path | None = None) -> str:
-        if destination is None:
-            raise ValueError("PDF exporter requires a destination path")
+    def __init__(self, deterministic: bool = False) -> None:
+        self.deterministic = deterministic
+
+    def settings(self) -> Mapping[str, Any]:
+        return {"deterministic": self.deterministic}
+
+    def write(self, resume: ComposedResume, stream: BinaryIO) -> None:
         doc = SimpleDocTemplate(
-            str(destination),
-            pagesize=A4,
-            leftMargin=20 * mm,
-            rightMargin=20 * mm,
-            topMargin=20 * mm,
-            bottomMargin=20 * mm,
+            stream,
+            pagesize=PAGE_SIZE,
+            leftMargin=PAGE_MARGIN,
+            rightMargin=PAGE_MARGIN,
+            topMargin=PAGE_MARGIN,
+            bottomMargin=PAGE_MARGIN,
+            **self._document_metadata(resume),
         )
-        styles = self._build_styles()
+        styles = self._build_styles(self._resolve_theme(resume.meta.get("options", {})))
         story = self._build_story(resume, styles)
         doc.build(story)
-        return str(destination)
-
-    def _build_styles(self):
-        styles = getSampleStyleSheet()
-        styles.add(
-            ParagraphStyle(
-                name="Name",
-                parent=styles["Heading1"],
-                fontSize=24,
-                textColor=colors.HexColor("#1a1a1a"),
-                alignment=TA_CENTER,
-                spaceAfter=6,
-            )
-        )
-        styles.add(
-            ParagraphStyle(
-                name="Headline",
-                parent=styles["Heading2"],
-                fontSize=14,
-                textColor=colors.HexColor("#333333"),
-                alignment=TA_CENTER,
-                spaceAfter=10,
-            )
-        )
-        styles.add(
-            ParagraphStyle(
-                name="Contacts",
-                parent=styles["BodyText"],
-                fontSize=10,
-                leading=12,
-                alignment=TA_CENTER,
-                textColor=colors.HexColor("#3d464f"),
-            )
-        )
-        styles.add(
-            ParagraphStyle(
-                name="Section",
-                parent=styles["Heading2"],
-                fontSize=14,
-                textColor=colors.HexColor("#2c3e50"),
-                spaceBefore=10,
-                spaceAfter=6,
-            )
-        )
-        styles.add(
-            ParagraphStyle(
-                name="Body",
-                parent=styles["BodyText"],
-                fontSize=10,
-                leading=14,
-            )
-        )
-        styles.add(
-            ParagraphStyle(
-                name="BodySmall",
-                parent=styles["Body"],
-                fontSize=9,
-                leading=12,
-                textColor=colors.HexColor("#4f5b66"),
-            )
-        )
-        styles.add(
-            ParagraphStyle(
-                name="BodyItalic",
-                parent=styles["Body"],
-                fontSize=10,
-                leading=13,
-                textColor=colors.HexColor("#1a1a1a"),
-                fontName="Times-Italic",
-            )
-        )
-        styles.add(
-            ParagraphStyle(
-                name="ExperienceTitle",
-                parent=styles["Heading3"],
-                fontSize=12,
-                textColor=colors.HexColor("#2c3e50"),
-                spaceAfter=4,
-            )
-        )
-        return styles
 
-    def _build_story(self, resume: ComposedResume, styles):
-        story = []
-        personal = resume.personal_info
+    def measure(self, resume: ComposedResume, page_budget: int | None = None) -> LayoutMeasurement:
+        """Lay the story out page by page without drawing or serialising a PDF.
 
-        story.append(Paragraph(personal["name"], styles["Name"]))
-        story.append(Paragraph(personal["headline"], styles["Headline"]))
-        contacts = " | ".join(f"{k.title()}: {v}" for k, v in personal["contacts"].items())
-        story.append(Paragraph(contacts, styles["Contacts"]))
-        story.append(HRFlowable(width="100%", thickness=1, lineCap="round", color=colors.HexColor("#d0d6dc")))
-        story.append(Spacer(1, 6 * mm))
+        ``page_budget`` defaults to the template's ``options.page_budget`` (or
+        legacy ``target_length: "N_pages"``) and only affects ``overflow``.
+        """
+        return _MeasureSession(self, resume)(resume, page_budget)
 
-        story.append(Paragraph("PROFESSIONAL SUMMARY", styles["Section"]))
-        story.append(Paragraph(resume.summary, styles["Body"]))
-        story.append(Spacer(1, 6 * mm))
+    def measurer(self, resume: ComposedResume) -> Measure:
+        """A ``measure`` for ``resume`` and trimmed copies of it, as ``fit_resume`` makes them.
 
-        story.append(Paragraph("TECHNICAL SKILLS", styles["Section"]))
-        story.extend(self._skills_table(resume, styles))
-        story.append(Spacer(1, 6 * mm))
+        Theme, styles and flowables are built once and reused across calls, so
+        each layout pass only builds and wraps the experience blocks it has not
+        seen before.
+        """
+        return _MeasureSession(self, resume)
 
-        story.append(Paragraph("WORK EXPERIENCE", styles["Section"]))
-        story.extend(self._experience_blocks(resume, styles))
+    def _document_metadata(self, resume: ComposedResume) -> dict:
+        options = resume.meta.get("options", {})
+        if not (self.deterministic or options.get("deterministic")):
+            return {}
+        return {
+            "invariant": 1,
+            "title": str(resume.meta.get("name") or ""),
+            "author": str(resume.personal_info.get("name") or ""),
+            "subject": str(resume.personal_info.get("headline") or ""),
+            "creator": PRODUCER,
+            "producer": PRODUCER,
+        }
+
+    def _resolve_theme(self, options: Mapping[str, Any]) -> Mapping[str, Any] | None:
+        """Register ``options.fonts`` and apply ``options.font_family`` on top of ``options.theme``."""
+        register_fonts(options.get("fonts"))
+        theme = options.get("theme")
+        family = options.get("font_family")
+        return family_theme(theme, family) if family else theme
+
+    def _build_styles(self, theme: Mapping[str, Any] | None = None) -> Stylesheet:
+        return get_stylesheet(theme)
+
+    def _build_story(self, resume: ComposedResume, styles):
+        return [flowable for _, flowables in self._build_sections(resume, styles) for flowable in flowables]
+
+    def _build_sections(self, resume: ComposedResume, styles) -> List[Tuple[str, list]]:
+        personal = resume.personal_info
+        contacts = " | ".join(f"{k.title()}: {v}" for k, v in personal["contacts"].items())
+        theme = self._resolve_theme(resume.meta.get("options", {}))
+        fragment = self._fragment_factory(styles, theme)
+        sections: List[Tuple[str, list]] = [
+            (
+                "header",
+                [
+                    fragment(personal["name"], "Name"),
+                    fragment(personal["headline"], "Headline"),
+                    fragment(contacts, "Contacts"),
+                    HRFlowable(width="100%", thickness=1, lineCap="round", color=colors.HexColor("#d0d6dc")),
+                    Spacer(1, 6 * mm),
+                ],
+            ),
+            (
+                "summary",
+                [
+                    fragment("PROFESSIONAL SUMMARY", "Section"),
+                    fragment(resume.summary, "Body"),
+                    Spacer(1, 6 * mm),
+                ],
+            ),
+            (
+                "skills",
+                [
+                    Paragraph("TECHNICAL SKILLS", styles["Section"]),
+                    *self._skills_table(resume, styles),
+                    Spacer(1, 6 * mm),
+                ],
+            ),
+            (
+                "experience",
+                [Paragraph("WORK EXPERIENCE", styles["Section"]), *self._experience_blocks(resume, styles, theme)],
+            ),
+        ]
 
         if resume.closing_statement:
-            story.append(Spacer(1, 8 * mm))
-            story.append(HRFlowable(width="100%", thickness=1, lineCap="round", color=colors.HexColor("#d0d6dc")))
-            story.append(Spacer(1, 4 * mm))
-            story.append(Paragraph(resume.closing_statement, styles["Body"]))
+            sections.append(
+                (
+                    "closing",
+                    [
+                        Spacer(1, 8 * mm),
+                        HRFlowable(width="100%", thickness=1, lineCap="round", color=colors.HexColor("#d0d6dc")),
+                        Spacer(1, 4 * mm),
+                        Paragraph(resume.closing_statement, styles["Body"]),
+                    ],
+                )
+            )
 
-        return story
+        return sections
 
     def _skills_table(self, resume: ComposedResume, styles):
         table_data = []
@@ -173,48 +185,135 @@ class PdfExporter(Exporter):
         )
         return [table]
 
-    def _experience_blocks(self, resume: ComposedResume, styles):
+    def _experience_blocks(self, resume: ComposedResume, styles, theme: Mapping[str, Any] | None):
         elements = []
-        options = resume.meta.get("options", {})
+        bullet = self._bullet_factory(styles, theme)
+        show_achievements = resume.meta.get("options", {}).get("highlight_achievements", True)
 
         for idx, block in enumerate(resume.experience):
-            elements.append(Paragraph(f"{block.title}", styles["ExperienceTitle"]))
-            elements.append(Paragraph(f"{block.company} | {block.period}", styles["BodySmall"]))
+            elements.extend(self._experience_block(block, styles, bullet, show_achievements))
+            if idx < len(resume.experience) - 1:
+                elements.append(Spacer(1, 5 * mm))
+        return elements
 
-            responsibilities = [
-                ListItem(Paragraph(item, styles["Body"]), leftIndent=4 * mm)
-                for item in block.responsibilities
-            ]
-            if responsibilities:
-                elements.append(
-                    ListFlowable(
-                        responsibilities,
-                        bulletType="bullet",
-                        start="•",
-                        bulletFontName=styles["Body"].fontName,
-                        bulletFontSize=styles["Body"].fontSize,
-                        bulletColor=colors.HexColor("#2c3e50"),
-                        leftIndent=4 * mm,
-                    )
-                )
+    def _experience_block(self, block, styles, bullet, show_achievements: bool) -> list:
+        elements = [
+            Paragraph(f"{block.title}", styles["ExperienceTitle"]),
+            Paragraph(f"{block.company} | {block.period}", styles["BodySmall"]),
+        ]
 
-            if block.achievements and options.get("highlight_achievements", True):
-                ach_items = [
-                    ListItem(Paragraph(text, styles["BodyItalic"]), leftIndent=6 * mm)
-                    for text in block.achievements
-                ]
-                elements.append(
-                    ListFlowable(
-                        ach_items,
-                        bulletType="bullet",
-                        start="→",
-                        bulletFontName=styles["BodyItalic"].fontName,
-                        bulletFontSize=styles["BodyItalic"].fontSize,
-                        bulletColor=colors.HexColor("#1a7f9f"),
-                        leftIndent=6 * mm,
-                    )
+        responsibilities = [
+            ListItem(bullet(item, "Body"), leftIndent=4 * mm)
+            for item in block.responsibilities
+        ]
+        if responsibilities:
+            elements.append(
+                ListFlowable(
+                    responsibilities,
+                    bulletType="bullet",
+                    start="•",
+                    bulletFontName=styles["Body"].fontName,
+                    bulletFontSize=styles["Body"].fontSize,
+                    bulletColor=colors.HexColor("#2c3e50"),
+                    leftIndent=4 * mm,
                 )
+            )
 
-            if idx < len(resume.experience) - 1:
-                elements.append(Spacer(1, 5 * mm))
+        if block.achievements and show_achievements:
+            ach_items = [
+                ListItem(bullet(text, "BodyItalic"), leftIndent=6 * mm)
+                for text in block.achievements
+            ]
+            elements.append(
+                ListFlowable(
+                    ach_items,
+                    bulletType="bullet",
+                    start="→",
+                    bulletFontName=styles["BodyItalic"].fontName,
+                    bulletFontSize=styles["BodyItalic"].fontSize,
+                    bulletColor=colors.HexColor("#1a7f9f"),
+                    leftIndent=6 * mm,
+                )
+            )
         return elements
+
+    def _bullet_factory(self, styles: Stylesheet, theme: Mapping[str, Any] | None):
+        """Paragraph constructor for bullets; reuses parsed markup."""
+        return self._shared_factory(styles, theme, cached_paragraph)
+
+    def _fragment_factory(self, styles: Stylesheet, theme: Mapping[str, Any] | None):
+        """Paragraph constructor for header/summary text; reuses parsed markup and line breaks."""
+        return self._shared_factory(styles, theme, fragment_paragraph)
+
+    def _shared_factory(self, styles: Stylesheet, theme: Mapping[str, Any] | None, build):
+        # Process-wide caches are keyed by theme, so they only apply to the shared theme stylesheet.
+        if styles is not get_stylesheet(theme):
+            return lambda text, style_name: Paragraph(text, styles[style_name])
+        key = theme_key(theme)
+        return lambda text, style_name: build(text, style_name, key)
+
+
+def _block_key(block) -> Tuple[Any, ...]:
+    return (block.title, block.company, block.period, tuple(block.responsibilities), tuple(block.achievements))
+
+
+class _MeasureSession:
+    """Measures one resume and trimmed copies of it with shared flowables.
+
+    The theme is resolved and the header, summary, skills and closing sections
+    are built from the first resume; candidates that keep those parts reuse
+    them, and experience blocks are built once per distinct content. The
+    flowables outlive each pass, so ``measure_sections`` remembers their wrap
+    sizes and only wraps what changed. Anything else is measured from scratch.
+    """
+
+    def __init__(self, exporter: PdfExporter, resume: ComposedResume) -> None:
+        self._exporter = exporter
+        self._resume = resume
+        self._options = resume.meta.get("options", {})
+        theme = exporter._resolve_theme(self._options)
+        self._styles = exporter._build_styles(theme)
+        self._bullet = exporter._bullet_factory(self._styles, theme)
+        self._show_achievements = self._options.get("highlight_achievements", True)
+        self._sections: Optional[List[Tuple[str, list]]] = None
+        self._blocks: Dict[Tuple[Any, ...], list] = {}
+        self._gap = Spacer(1, 5 * mm)
+        self._sizes: Dict[int, Any] = {}
+        self._frame = _measure_frame()
+
+    def __call__(self, resume: ComposedResume, page_budget: int | None = None) -> LayoutMeasurement:
+        if page_budget is None:
+            page_budget = page_budget_from_options(resume.meta.get("options", {}))
+        if not self._shares_sections(resume):
+            styles = self._exporter._build_styles(self._exporter._resolve_theme(resume.meta.get("options", {})))
+            return measure_sections(self._exporter._build_sections(resume, styles), _measure_frame(), page_budget)
+
+        if self._sections is None:
+            self._sections = self._exporter._build_sections(self._resume, self._styles)
+            self._title = dict(self._sections)["experience"][0]
+        experience: list = [self._title]
+        for idx, block in enumerate(resume.experience):
+            if idx:
+                experience.append(self._gap)
+            key = _block_key(block)
+            flowables = self._blocks.get(key)
+            if flowables is None:
+                flowables = self._exporter._experience_block(block, self._styles, self._bullet, self._show_achievements)
+                self._blocks[key] = flowables
+            experience.extend(flowables)
+        sections = [(name, experience if name == "experience" else flowables) for name, flowables in self._sections]
+        return measure_sections(sections, self._frame, page_budget, sizes=self._sizes)
+
+    def _shares_sections(self, resume: ComposedResume) -> bool:
+        base = self._resume
+        return resume is base or (
+            resume.meta == base.meta
+            and resume.personal_info == base.personal_info
+            and resume.summary == base.summary
+            and resume.skills == base.skills
+            and resume.closing_statement == base.closing_statement
+        )
+
+
+def _measure_frame() -> Frame:
+    return Frame(PAGE_MARGIN, PAGE_MARGIN, PAGE_SIZE[0] - 2 * PAGE_MARGIN, PAGE_SIZE[1] - 2 * PAGE_MARGIN)
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import json
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, Tuple
+
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+
+# (name, parent, attributes) in dependency order; colours are hex strings.
+BASE_STYLES: Tuple[Tuple[str, str, Mapping[str, Any]], ...] = (
+    ("Name", "Heading1", {"fontSize": 24, "textColor": "#1a1a1a", "alignment": TA_CENTER, "spaceAfter": 6}),
+    ("Headline", "Heading2", {"fontSize": 14, "textColor": "#333333", "alignment": TA_CENTER, "spaceAfter": 10}),
+    ("Contacts", "BodyText", {"fontSize": 10, "leading": 12, "alignment": TA_CENTER, "textColor": "#3d464f"}),
+    ("Section", "Heading2", {"fontSize": 14, "textColor": "#2c3e50", "spaceBefore": 10, "spaceAfter": 6}),
+    ("Body", "BodyText", {"fontSize": 10, "leading": 14}),
+    ("BodySmall", "Body", {"fontSize": 9, "leading": 12, "textColor": "#4f5b66"}),
+    ("BodyItalic", "Body", {"fontSize": 10, "leading": 13, "textColor": "#1a1a1a", "fontName": "Times-Italic"}),
+    ("ExperienceTitle", "Heading3", {"fontSize": 12, "textColor": "#2c3e50", "spaceAfter": 4}),
+)
+
+Stylesheet = Mapping[str, ParagraphStyle]
+
+
+def theme_key(theme: Optional[Mapping[str, Any]]) -> str:
+    """Canonical cache key for a theme.
+
+    A theme maps names from ``BASE_STYLES`` to ``ParagraphStyle`` attribute
+    overrides, e.g. ``{"Name": {"fontSize": 20, "textColor": "#000000"}}``.
+    """
+    return json.dumps(theme or {}, sort_keys=True, default=dict)
+
+
+def get_stylesheet(theme: Optional[Mapping[str, Any]] = None) -> Stylesheet:
+    """Return the shared, read-only stylesheet for ``theme``.
+
+    Each distinct theme is built once per process; callers must treat the
+    returned styles as immutable so they can be reused across exports and
+    worker threads.
+    """
+    return _stylesheet_for_key(theme_key(theme))
+
+
+@lru_cache(maxsize=32)
+def _stylesheet_for_key(key: str) -> Stylesheet:
+    overrides = json.loads(key)
+    sheet = getSampleStyleSheet()
+    for name, parent, attributes in BASE_STYLES:
+        values = {**attributes, **overrides.get(name, {})}
+        sheet.add(ParagraphStyle(name=name, parent=sheet[parent], **_resolve_colors(values)))
+    return MappingProxyType(dict(sheet.byName))
+
+
+def _resolve_colors(values: Mapping[str, Any]) -> Mapping[str, Any]:
+    return {
+        attr: colors.HexColor(value) if "Color" in attr and isinstance(value, str) else value
+        for attr, value in values.items()
+    }
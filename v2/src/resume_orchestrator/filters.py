@@ -1,10 +1,278 @@
 from __future__ import annotations
 
-import re
+import heapq
+import json
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Iterable, List
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
 
-from .data_models import ExperienceBlock
+from .data_models import ExperienceBlock, find_tag_index
+from .telemetry import span
+
+if TYPE_CHECKING:
+    from .data_models import TemplateConfig
+    from .index import TagIndex
+
+
+class Predicate(ABC):
+    """Keeps or drops a block. May expose a bitset so the tag index can answer it."""
+
+    @abstractmethod
+    def __call__(self, block: ExperienceBlock) -> bool:
+        ...
+
+    def mask(self, index: "TagIndex") -> Optional[int]:
+        return None
+
+
+class Scorer(ABC):
+    """Contributes one component to the sort key; lower sorts first.
+
+    May also compute the keys of many indexed blocks at once from the tag index.
+    """
+
+    @abstractmethod
+    def key(self, block: ExperienceBlock) -> Any:
+        ...
+
+    def keys(self, index: "TagIndex", positions: Sequence[int]) -> Optional[List[Any]]:
+        """Keys of ``index.blocks`` at ``positions``, or ``None`` to call ``key`` per block."""
+        return None
+
+
+class Selector(ABC):
+    @abstractmethod
+    def select(self, blocks: Iterable[ExperienceBlock], key: Callable[[ExperienceBlock], Any]) -> List[ExperienceBlock]:
+        ...
+
+
+StageFactory = Callable[[Any], "Predicate | Scorer | Selector"]
+
+_STAGES: Dict[str, StageFactory] = {}
+
+
+def register_filter_stage(name: str) -> Callable[[StageFactory], StageFactory]:
+    """Bind a template ``filters:`` key to a factory that turns its value into a stage."""
+
+    def decorator(factory: StageFactory) -> StageFactory:
+        _STAGES[name] = factory
+        _compile_payload.cache_clear()
+        return factory
+
+    return decorator
+
+
+def template_tokens(template_key: str | None) -> Set[str]:
+    if not template_key:
+        return set()
+    lowered = template_key.lower()
+    tokens = {lowered}
+    tokens.update(part for part in lowered.replace("-", "_").split("_") if part)
+    return tokens
+
+
+class HiddenFor(Predicate):
+    def __init__(self, tokens: Iterable[str]) -> None:
+        self.tokens = frozenset(tokens)
+
+    def __call__(self, block: ExperienceBlock) -> bool:
+        return self.tokens.isdisjoint(block.hidden_tokens)
+
+    def mask(self, index: "TagIndex") -> Optional[int]:
+        return ~index.hidden_for(self.tokens)
+
+
+class IncludeTags(Predicate):
+    def __init__(self, tags: Iterable[str]) -> None:
+        self.tags = frozenset(tags)
+
+    def __call__(self, block: ExperienceBlock) -> bool:
+        return not self.tags or not self.tags.isdisjoint(block.tag_set)
+
+    def mask(self, index: "TagIndex") -> Optional[int]:
+        return index.any_of(self.tags) if self.tags else None
+
+
+class ExcludeTags(Predicate):
+    def __init__(self, tags: Iterable[str]) -> None:
+        self.tags = frozenset(tags)
+
+    def __call__(self, block: ExperienceBlock) -> bool:
+        return self.tags.isdisjoint(block.tag_set)
+
+    def mask(self, index: "TagIndex") -> Optional[int]:
+        return ~index.any_of(self.tags)
+
+
+class LimitYears(Predicate):
+    def __init__(self, years: int) -> None:
+        self.years = years
+
+    def __call__(self, block: ExperienceBlock) -> bool:
+        start_year = block.period_range.start_year
+        return start_year is None or datetime.now().year - start_year <= self.years
+
+
+class CurrentFirst(Scorer):
+    def key(self, block: ExperienceBlock) -> int:
+        return 0 if block.is_current() else 1
+
+    def keys(self, index: "TagIndex", positions: Sequence[int]) -> Optional[List[Any]]:
+        return index.not_current(positions)
+
+
+class MostRecent(Scorer):
+    def key(self, block: ExperienceBlock) -> int:
+        return -block.start_year()
+
+    def keys(self, index: "TagIndex", positions: Sequence[int]) -> Optional[List[Any]]:
+        return [-year for year in index.start_years(positions)]
+
+
+class PriorityTags(Scorer):
+    def __init__(self, tags: Iterable[str]) -> None:
+        self.tags = frozenset(tags)
+
+    def key(self, block: ExperienceBlock) -> int:
+        return -len(self.tags & block.tag_set)
+
+    def keys(self, index: "TagIndex", positions: Sequence[int]) -> Optional[List[Any]]:
+        return [-count for count in index.tag_counts(self.tags, positions)]
+
+
+class SortAll(Selector):
+    def select(self, blocks, key):
+        return sorted(blocks, key=key)
+
+
+class TopK(Selector):
+    """Heap-based selection of the ``k`` best blocks; same order as ``sorted(...)[:k]``."""
+
+    def __init__(self, k: int) -> None:
+        self.k = k
+
+    def select(self, blocks, key):
+        return heapq.nsmallest(self.k, blocks, key=key)
+
+
+_STAGES.update(
+    {
+        "include_tags": IncludeTags,
+        "exclude_tags": ExcludeTags,
+        "priority_tags": PriorityTags,
+        "limit_years": lambda value: LimitYears(int(value)),
+    }
+)
+
+
+@dataclass(frozen=True)
+class FilterPlan:
+    """Compiled form of a template ``filters:`` block."""
+
+    predicates: Tuple[Predicate, ...]
+    scorers: Tuple[Scorer, ...]
+    selector: Selector
+
+    def sort_key(self, block: ExperienceBlock) -> Tuple[Any, ...]:
+        return tuple(scorer.key(block) for scorer in self.scorers)
+
+    def candidates(self, blocks: Sequence[ExperienceBlock], index: "TagIndex | None" = None) -> List[ExperienceBlock]:
+        return self._candidates(blocks, index)[0]
+
+    def _candidates(
+        self, blocks: Sequence[ExperienceBlock], index: "TagIndex | None"
+    ) -> Tuple[List[ExperienceBlock], Optional[List[int]]]:
+        """Matching blocks and, when ``index`` covers ``blocks``, their positions in it."""
+        predicates: Sequence[Predicate] = self.predicates
+        if index is None or not index.covers(blocks):
+            if not predicates:
+                return list(blocks), None
+            return [block for block in blocks if all(predicate(block) for predicate in predicates)], None
+        mask = index.full_mask
+        remaining = []
+        for predicate in predicates:
+            predicate_mask = predicate.mask(index)
+            if predicate_mask is None:
+                remaining.append(predicate)
+            else:
+                mask &= predicate_mask
+        positions = index.positions(mask)
+        if remaining:
+            positions = [pos for pos in positions if all(predicate(blocks[pos]) for predicate in remaining)]
+        return [blocks[pos] for pos in positions], positions
+
+    def _sort_keys(
+        self, blocks: List[ExperienceBlock], positions: Optional[List[int]], index: "TagIndex | None"
+    ) -> List[Tuple[Any, ...]]:
+        """``sort_key`` of every block, computed a scorer at a time (from the index where it can)."""
+        columns = []
+        for scorer in self.scorers:
+            column = scorer.keys(index, positions) if positions is not None else None
+            columns.append(column if column is not None else [scorer.key(block) for block in blocks])
+        return list(zip(*columns)) if columns else [()] * len(blocks)
+
+    def run(self, blocks: Iterable[ExperienceBlock], index: "TagIndex | None" = None) -> List[ExperienceBlock]:
+        with span("filter", indexed=index is not None) as traced:
+            if not isinstance(blocks, Sequence):
+                blocks = list(blocks)
+            candidates, positions = self._candidates(blocks, index)
+            # Blocks are unhashable models, so precomputed keys are looked up by identity.
+            keys = {id(block): key for block, key in zip(candidates, self._sort_keys(candidates, positions, index))}
+            selected = self.selector.select(candidates, lambda block: keys[id(block)])
+            traced.set(blocks=len(blocks), selected=len(selected))
+            return selected
+
+
+DEFAULT_SCORERS: Tuple[Scorer, ...] = (CurrentFirst(), MostRecent())
+
+
+def compile_filters(
+    filters: Mapping[str, Any] | None,
+    *,
+    max_items: int | None = None,
+    template_key: str | None = None,
+) -> FilterPlan:
+    """Compile a template ``filters:`` mapping into a cached ``FilterPlan``.
+
+    Plans are cached by a JSON encoding of the inputs, so templates with
+    identical filter stacks share one plan. Key order is kept because custom
+    scorers are applied in the order the template lists them.
+    """
+    payload = json.dumps(
+        {"filters": dict(filters or {}), "max_items": max_items, "template": template_key},
+        default=str,
+    )
+    return _compile_payload(payload)
+
+
+@lru_cache(maxsize=512)
+def _compile_payload(payload: str) -> FilterPlan:
+    spec = json.loads(payload)
+    predicates: List[Predicate] = []
+    scorers: List[Scorer] = list(DEFAULT_SCORERS)
+    selector: Selector = TopK(spec["max_items"]) if spec["max_items"] else SortAll()
+
+    tokens = template_tokens(spec["template"])
+    if tokens:
+        predicates.append(HiddenFor(tokens))
+
+    for name, value in spec["filters"].items():
+        factory = _STAGES.get(name)
+        if factory is None or value is None:
+            continue
+        stage = factory(value)
+        if isinstance(stage, Predicate):
+            predicates.append(stage)
+        elif isinstance(stage, Scorer):
+            scorers.append(stage)
+        elif isinstance(stage, Selector):
+            selector = stage
+        else:
+            raise TypeError(f"Filter stage '{name}' returned unsupported object {stage!r}")
+
+    return FilterPlan(tuple(predicates), tuple(scorers), selector)
 
 
 def apply_experience_filters(
@@ -16,49 +284,131 @@ def apply_experience_filters(
     limit_years=None,
     max_items=None,
     template_key: str | None = None,
+    index: "TagIndex | None" = None,
 ) -> List[ExperienceBlock]:
-    result: List[ExperienceBlock] = []
-    current_year = datetime.now().year
+    """Filter, order and truncate experience blocks for one template.
 
-    template_tokens: set[str] = set()
-    if template_key:
-        lowered = template_key.lower()
-        template_tokens = {lowered}
-        template_tokens.update(part for part in lowered.replace("-", "_").split("_") if part)
+    ``index`` defaults to the tag index already built over ``blocks`` (the
+    ``experience`` list of a loaded bundle), if there is one. With an index the
+    tag and visibility checks run as bitset operations and the sort keys come
+    from the index instead of scanning every block.
+    """
+    filters = {
+        "include_tags": include_tags,
+        "exclude_tags": exclude_tags,
+        "priority_tags": priority_tags,
+        "limit_years": limit_years,
+    }
+    plan = compile_filters(filters, max_items=max_items, template_key=template_key)
+    if index is None:
+        index = find_tag_index(blocks)
+    return plan.run(blocks, index)
 
-    for block in blocks:
-        if template_tokens and block.hidden_for:
-            hidden_tokens = {tag.lower() for tag in block.hidden_for}
-            if template_tokens & hidden_tokens:
-                continue
-        if exclude_tags and any(tag in block.tags for tag in exclude_tags):
-            continue
-        if include_tags and not any(tag in block.tags for tag in include_tags):
-            continue
-        if limit_years is not None:
-            years = re.findall(r"(?:19|20)\\d{2}", block.period)
-            if years:
-                try:
-                    start_year = int(years[0])
-                    if current_year - start_year > limit_years:
-                        continue
-                except ValueError:
-                    pass
-        result.append(block)
-
-    priorities = set(priority_tags or [])
-
-    def sort_key(block: ExperienceBlock):
-        priority_score = sum(tag in priorities for tag in block.tags)
-        return (
-            0 if block.is_current() else 1,
-            -block.start_year(),
-            -priority_score,
+
+_BUILTIN_STAGES = dict(_STAGES)
+# Configs evaluated together by ``apply_experience_filters_batch``; bounds its blocks×configs arrays.
+BATCH_CHUNK = 64
+
+
+def apply_experience_filters_batch(
+    blocks: Sequence[ExperienceBlock],
+    configs: Sequence["TemplateConfig"],
+) -> List[List[ExperienceBlock]]:
+    """Run the experience filters of many templates over the same blocks at once.
+
+    Blocks are encoded as boolean tag×block and token×block matrices; each
+    template's include, exclude, priority and ``hidden_for`` checks reduce the
+    few rows it names, and the age limit and ordering are vectorised across
+    ``BATCH_CHUNK`` templates at a time, so memory grows with blocks ×
+    ``BATCH_CHUNK`` rather than blocks × templates. Results are identical to
+    calling ``compile_filters(...).run(blocks)`` per config and come back in
+    input order. Requires NumPy (``pip install resume-orchestrator[fast]``);
+    without it, or for configs using custom filter stages, the scalar plans
+    are used.
+    """
+    blocks = list(blocks)
+    plans = [
+        compile_filters(
+            config.filters,
+            max_items=config.options.get("max_experience_blocks") if config.options else None,
+            template_key=config.template,
         )
+        for config in configs
+    ]
+    try:
+        import numpy as np
+    except ImportError:
+        return [plan.run(blocks) for plan in plans]
+
+    results: List[Optional[List[ExperienceBlock]]] = [None] * len(configs)
+    vector_ids = []
+    for position, (config, plan) in enumerate(zip(configs, plans)):
+        if all(_STAGES.get(name) is _BUILTIN_STAGES.get(name, False) for name in config.filters):
+            vector_ids.append(position)
+        else:
+            results[position] = plan.run(blocks)
+    if not vector_ids or not blocks:
+        for position in vector_ids:
+            results[position] = []
+        return results  # type: ignore[return-value]
+
+    tag_ids: Dict[str, int] = {}
+    token_ids: Dict[str, int] = {}
+    for block in blocks:
+        for tag in block.tag_set:
+            tag_ids.setdefault(tag, len(tag_ids))
+        for token in block.hidden_tokens:
+            token_ids.setdefault(token, len(token_ids))
+
+    n_blocks = len(blocks)
+    # Tag-major boolean matrices: a template names only a few tags and tokens, so
+    # their rows are gathered and reduced instead of multiplied by dense vectors.
+    tag_matrix = np.zeros((max(len(tag_ids), 1), n_blocks), dtype=bool)
+    hidden_matrix = np.zeros((max(len(token_ids), 1), n_blocks), dtype=bool)
+    for row, block in enumerate(blocks):
+        for tag in block.tag_set:
+            tag_matrix[tag_ids[tag], row] = True
+        for token in block.hidden_tokens:
+            hidden_matrix[token_ids[token], row] = True
+
+    current_year = datetime.now().year
+    start_known = np.array([block.period_range.start_year is not None for block in blocks])
+    start_year = np.array([block.start_year() for block in blocks], dtype=np.int32)
+    not_current = np.array([0 if block.is_current() else 1 for block in blocks], dtype=np.int8)
+    age = np.where(start_known, current_year - start_year, 0)
 
-    result.sort(key=sort_key)
+    def vocab_rows(tags, vocab) -> List[int]:
+        return [vocab[tag] for tag in tags if tag in vocab]
 
-    if max_items:
-        result = result[:max_items]
+    # Configs are evaluated BATCH_CHUNK at a time so the blocks×configs intermediates stay bounded.
+    for offset in range(0, len(vector_ids), BATCH_CHUNK):
+        chunk = vector_ids[offset : offset + BATCH_CHUNK]
+        keep = np.ones((n_blocks, len(chunk)), dtype=bool)
+        scores = np.zeros((n_blocks, len(chunk)), dtype=np.int16)  # a block has far fewer than 32k tags
+        limits = np.full(len(chunk), np.iinfo(np.int32).max, dtype=np.int32)
+        for column, position in enumerate(chunk):
+            filters = configs[position].filters
+            if filters.get("include_tags"):
+                keep[:, column] = tag_matrix[vocab_rows(filters["include_tags"], tag_ids)].any(axis=0)
+            excluded = vocab_rows(filters.get("exclude_tags") or [], tag_ids)
+            if excluded:
+                keep[:, column] &= ~tag_matrix[excluded].any(axis=0)
+            hidden = vocab_rows(template_tokens(configs[position].template), token_ids)
+            if hidden:
+                keep[:, column] &= ~hidden_matrix[hidden].any(axis=0)
+            priority = vocab_rows(set(filters.get("priority_tags") or []), tag_ids)
+            if priority:
+                scores[:, column] = tag_matrix[priority].sum(axis=0, dtype=np.int16)
+            if filters.get("limit_years") is not None:
+                limits[column] = int(filters["limit_years"])
+        keep &= age[:, None] <= limits[None, :]
 
-    return result
+        for column, position in enumerate(chunk):
+            rows = np.flatnonzero(keep[:, column])
+            # lexsort is stable and uses the last key as the primary one.
+            order = rows[np.lexsort((-scores[rows, column], -start_year[rows], not_current[rows]))]
+            selector = plans[position].selector
+            if isinstance(selector, TopK):
+                order = order[: selector.k]
+            results[position] = [blocks[row] for row in order]
+    return results  # type: ignore[return-value]
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import re
+import time
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Mapping, Optional, Set, Tuple
+
+from .composer import ComposedResume
+
+if TYPE_CHECKING:
+    from .exporters import Exporter
+    from .exporters.layout import LayoutMeasurement
+
+Measure = Callable[[ComposedResume], "LayoutMeasurement"]
+
+_PAGES_RE = re.compile(r"^\s*(\d+)(?:[_\s-]*pages?)?\s*$", re.IGNORECASE)
+
+
+def page_budget_from_options(options: Mapping[str, Any]) -> Optional[int]:
+    """Read ``page_budget: 2`` or the legacy ``target_length: "2_pages"`` from template options."""
+    for key in ("page_budget", "target_length"):
+        value = options.get(key)
+        if isinstance(value, int) and value > 0:
+            return value
+        if isinstance(value, str):
+            match = _PAGES_RE.match(value)
+            if match and int(match.group(1)) > 0:
+                return int(match.group(1))
+    return None
+
+
+@dataclass(frozen=True)
+class Trim:
+    """One piece of content removed to meet a page budget."""
+
+    kind: str  # "responsibility", "achievement" or "block"
+    block_id: str
+    text: str
+
+
+@dataclass(frozen=True)
+class FitReport:
+    page_budget: int
+    pages_before: int
+    pages_after: int
+    blocks_before: int
+    blocks_after: int
+    dropped: Tuple[Trim, ...]
+    measurements: int
+    seconds: float
+
+    @property
+    def fits(self) -> bool:
+        return self.pages_after <= self.page_budget
+
+    def describe(self) -> List[str]:
+        """Human-readable lines for CLI output."""
+        if not self.fits:
+            return [
+                f"does not fit {self.page_budget} page(s) even after trimming; "
+                f"kept all content ({self.pages_before} pages)"
+            ]
+        if not self.dropped:
+            return []
+        lines = [
+            f"trimmed {len(self.dropped)} item(s) to fit {self.page_budget} page(s) "
+            f"(was {self.pages_before}, {self.measurements} layout passes, {self.seconds * 1000:.0f} ms)"
+        ]
+        if self.blocks_after < self.blocks_before:
+            lines.append(f"experience blocks: {self.blocks_before} -> {self.blocks_after}")
+        for trim in self.dropped:
+            lines.append(f"- {trim.kind} {trim.block_id}: {trim.text}")
+        return lines
+
+
+# A step removes one item: ("responsibility" | "achievement", block position, item position)
+# or a whole block: ("block", block position, -1).
+_Step = Tuple[str, int, int]
+
+
+def _trim_steps(resume: ComposedResume) -> List[_Step]:
+    """Removable content ordered from least to most important.
+
+    Experience is already ranked by the template's filter plan, so blocks are
+    trimmed bottom-up: a block first loses its trailing achievements, then its
+    trailing responsibilities (the first one is kept), and is then dropped as a
+    whole -- the same as lowering ``max_experience_blocks`` by one. The top
+    block is trimmed but never dropped.
+    """
+    show_achievements = resume.meta.get("options", {}).get("highlight_achievements", True)
+    steps: List[_Step] = []
+    for position in range(len(resume.experience) - 1, -1, -1):
+        block = resume.experience[position]
+        if show_achievements:
+            steps.extend(("achievement", position, item) for item in range(len(block.achievements) - 1, -1, -1))
+        steps.extend(("responsibility", position, item) for item in range(len(block.responsibilities) - 1, 0, -1))
+        if position > 0:
+            steps.append(("block", position, -1))
+    return steps
+
+
+def _apply(resume: ComposedResume, steps: List[_Step]) -> ComposedResume:
+    dropped_blocks: Set[int] = set()
+    removed: Dict[Tuple[str, int], Set[int]] = {}
+    for kind, position, item in steps:
+        if kind == "block":
+            dropped_blocks.add(position)
+        else:
+            removed.setdefault((kind, position), set()).add(item)
+
+    experience = []
+    for position, block in enumerate(resume.experience):
+        if position in dropped_blocks:
+            continue
+        responsibilities = removed.get(("responsibility", position))
+        achievements = removed.get(("achievement", position))
+        if responsibilities or achievements:
+            block = block.model_copy(
+                update={
+                    "responsibilities": [
+                        text for i, text in enumerate(block.responsibilities) if i not in (responsibilities or ())
+                    ],
+                    "achievements": [text for i, text in enumerate(block.achievements) if i not in (achievements or ())],
+                }
+            )
+        experience.append(block)
+    return replace(resume, experience=tuple(experience))
+
+
+def _describe_steps(resume: ComposedResume, steps: List[_Step]) -> Tuple[Trim, ...]:
+    dropped_blocks = {position for kind, position, _ in steps if kind == "block"}
+    trims = []
+    for kind, position, item in steps:
+        block = resume.experience[position]
+        if kind == "block":
+            trims.append(Trim("block", block.id, block.title))
+        elif position not in dropped_blocks:
+            texts = block.achievements if kind == "achievement" else block.responsibilities
+            trims.append(Trim(kind, block.id, texts[item]))
+    return tuple(trims)
+
+
+def fit_resume(resume: ComposedResume, measure: Measure, page_budget: int) -> Tuple[ComposedResume, FitReport]:
+    """Trim ``resume`` until ``measure`` reports at most ``page_budget`` pages.
+
+    Removal steps form a fixed priority order (see ``_trim_steps``), so the
+    smallest prefix that fits is found by binary search over that order:
+    O(log n) layout passes instead of one per removed item. If even the
+    fully trimmed resume overflows, the original is returned unchanged and
+    the report says it does not fit.
+    """
+    started = time.perf_counter()
+    measurements = 0
+
+    def pages(candidate: ComposedResume) -> int:
+        nonlocal measurements
+        measurements += 1
+        return measure(candidate).pages
+
+    def report(pages_after: int, kept: ComposedResume, dropped: Tuple[Trim, ...]) -> FitReport:
+        return FitReport(
+            page_budget=page_budget,
+            pages_before=pages_before,
+            pages_after=pages_after,
+            blocks_before=len(resume.experience),
+            blocks_after=len(kept.experience),
+            dropped=dropped,
+            measurements=measurements,
+            seconds=time.perf_counter() - started,
+        )
+
+    pages_before = pages(resume)
+    if pages_before <= page_budget:
+        return resume, report(pages_before, resume, ())
+
+    steps = _trim_steps(resume)
+    smallest = _apply(resume, steps)
+    smallest_pages = pages(smallest)
+    if smallest_pages > page_budget:
+        return resume, report(pages_before, resume, ())
+
+    # Invariant: prefix ``high`` fits, prefix ``low`` does not.
+    low, high = 0, len(steps)
+    best, best_pages = smallest, smallest_pages
+    while high - low > 1:
+        middle = (low + high) // 2
+        candidate = _apply(resume, steps[:middle])
+        candidate_pages = pages(candidate)
+        if candidate_pages <= page_budget:
+            high, best, best_pages = middle, candidate, candidate_pages
+        else:
+            low = middle
+    return best, report(best_pages, best, _describe_steps(resume, steps[:high]))
+
+
+def fit_for_exporter(resume: ComposedResume, exporter: "Exporter") -> Tuple[ComposedResume, Optional[FitReport]]:
+    """Apply the template's page budget when the exporter can measure layout; otherwise pass through.
+
+    Exporters with a ``measurer(resume)`` get one per fit, so layout passes
+    over trimmed copies can share work; otherwise ``measure`` is called as is.
+    """
+    measure = getattr(exporter, "measure", None)
+    page_budget = page_budget_from_options(resume.meta.get("options", {}))
+    if measure is None or page_budget is None:
+        return resume, None
+    measurer = getattr(exporter, "measurer", None)
+    if measurer is not None:
+        measure = measurer(resume)
+    return fit_resume(resume, measure, page_budget)
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Dict, Iterable, List, Sequence
+
+from .data_models import ExperienceBlock
+
+# Set bit offsets of every byte value; bitsets are decoded a byte at a time with it.
+_BYTE_BITS = tuple(tuple(bit for bit in range(8) if value >> bit & 1) for value in range(256))
+
+
+class TagIndex:
+    """Inverted index from tags (and ``hidden_for`` tokens) to experience blocks.
+
+    Postings are stored as integer bitsets over block positions, so include,
+    exclude and visibility checks are a handful of ``|``/``&`` operations
+    regardless of how many blocks the bundle holds. The sort inputs of the
+    default scorers (current role, start year) are kept per position, and
+    priority-tag scores are counted from the postings, so indexed plans never
+    touch the blocks they drop.
+    """
+
+    def __init__(self, blocks: Sequence[ExperienceBlock]) -> None:
+        self.blocks = blocks
+        self._size = len(blocks)
+        self._all = (1 << self._size) - 1
+        self._tags: Dict[str, int] = {}
+        self._hidden: Dict[str, int] = {}
+        self._not_current: List[int] = []
+        self._start_years: List[int | None] = []
+        for position, block in enumerate(blocks):
+            bit = 1 << position
+            for tag in block.tag_set:
+                self._tags[tag] = self._tags.get(tag, 0) | bit
+            for token in block.hidden_tokens:
+                self._hidden[token] = self._hidden.get(token, 0) | bit
+            self._not_current.append(0 if block.is_current() else 1)
+            self._start_years.append(block.period_range.start_year)
+
+    def covers(self, blocks: Iterable[ExperienceBlock]) -> bool:
+        """Whether the index was built over exactly this block sequence."""
+        return blocks is self.blocks and len(self.blocks) == self._size
+
+    def any_of(self, tags: Iterable[str]) -> int:
+        mask = 0
+        for tag in tags:
+            mask |= self._tags.get(tag, 0)
+        return mask
+
+    def hidden_for(self, tokens: Iterable[str]) -> int:
+        mask = 0
+        for token in tokens:
+            mask |= self._hidden.get(token, 0)
+        return mask
+
+    @property
+    def full_mask(self) -> int:
+        """Bitset with every indexed block set."""
+        return self._all
+
+    def positions(self, mask: int) -> List[int]:
+        """Ascending block positions set in ``mask``."""
+        return decode_bits(mask & self._all)
+
+    def tag_counts(self, tags: Iterable[str], positions: Sequence[int]) -> List[int]:
+        """How many of ``tags`` each block at ``positions`` carries."""
+        counts = [0] * self._size
+        for tag in set(tags):
+            for position in decode_bits(self._tags.get(tag, 0)):
+                counts[position] += 1
+        return [counts[position] for position in positions]
+
+    def not_current(self, positions: Sequence[int]) -> List[int]:
+        """``0`` for current roles and ``1`` otherwise (``CurrentFirst`` keys)."""
+        flags = self._not_current
+        return [flags[position] for position in positions]
+
+    def start_years(self, positions: Sequence[int]) -> List[int]:
+        """``ExperienceBlock.start_year()`` of the blocks at ``positions``."""
+        years, this_year = self._start_years, datetime.now().year
+        return [this_year if years[position] is None else years[position] for position in positions]
+
+
+def decode_bits(mask: int) -> List[int]:
+    """Ascending positions of the set bits of a non-negative ``mask``.
+
+    The bitset is converted to bytes once and decoded through a per-byte table,
+    which is linear in its length; peeling bits off the integer one at a time
+    costs a full-width operation per set bit.
+    """
+    if mask <= 0:
+        return []
+    result: List[int] = []
+    extend = result.extend
+    for offset, value in enumerate(mask.to_bytes((mask.bit_length() + 7) // 8, "little")):
+        if value:
+            base = offset * 8
+            extend([base + bit for bit in _BYTE_BITS[value]])
+    return result
@@ -1,26 +1,48 @@
 from __future__ import annotations
 
+import threading
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 import yaml
 
 from .data_models import TemplateConfig
+from .telemetry import span
 
 
 class TemplateLoader:
+    """Reads template YAMLs; parsed configs are reused until the file's ``(mtime, size)`` changes."""
+
     def __init__(self, templates_dir: Path) -> None:
         self._templates_dir = templates_dir
+        self._cache: Dict[str, Tuple[Tuple[int, int], TemplateConfig]] = {}
+        self._lock = threading.Lock()
 
     def list_templates(self) -> List[str]:
         return sorted(path.stem for path in self._templates_dir.glob("*.yaml"))
 
     def load(self, template_name: str) -> TemplateConfig:
+        with span("template_load", template=template_name) as traced:
+            config, cached = self._load(template_name)
+            traced.set(cached=cached)
+            return config
+
+    def _load(self, template_name: str) -> Tuple[TemplateConfig, bool]:
         path = self._templates_dir / f"{template_name}.yaml"
-        if not path.exists():
-            raise FileNotFoundError(f"Template '{template_name}' not found")
+        try:
+            stat = path.stat()
+        except FileNotFoundError as exc:
+            raise FileNotFoundError(f"Template '{template_name}' not found") from exc
+        stat_key = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._cache.get(template_name)
+        if cached is not None and cached[0] == stat_key:
+            return cached[1], True
         data: Dict[str, object] = yaml.safe_load(path.read_text(encoding="utf-8"))
-        return TemplateConfig(**data)
+        config = TemplateConfig(**data)
+        with self._lock:
+            self._cache[template_name] = (stat_key, config)
+        return config, False
 
     def iter_configs(self):
         for name in self.list_templates():
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import cProfile
+import os
+import pstats
+import sys
+import sysconfig
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+from . import telemetry
+
+MODES = ("cpu", "mem", "both")
+# tottime is attributed to the first matching top-level package of the defining file.
+PACKAGES = ("reportlab", "pydantic", "pydantic_core", "yaml", "resume_orchestrator")
+TRACE_FRAMES = 1
+_STDLIB = os.path.join(sysconfig.get_paths()["stdlib"], "")
+
+
+@lru_cache(maxsize=4096)
+def short_path(filename: str) -> str:
+    """``filename`` relative to the ``sys.path`` entry it was imported from, so reports diff across machines."""
+    for root in sorted((entry for entry in sys.path if entry), key=len, reverse=True):
+        prefix = os.path.join(os.path.abspath(root), "")
+        if filename.startswith(prefix):
+            return filename[len(prefix):]
+    return filename
+
+
+def package_of(filename: str) -> str:
+    if filename == "~":
+        return "<built-in>"
+    top = short_path(filename).split(os.sep, 1)[0]
+    if top in PACKAGES:
+        return top
+    if filename.startswith((_STDLIB, "<frozen ")):
+        return "<stdlib>"
+    return "<other>"
+
+
+class Profiler(telemetry.Sink):
+    """Profiles one CLI command; ``--profile cpu|mem|both``.
+
+    CPU mode runs ``cProfile`` over the whole command. Memory mode runs
+    ``tracemalloc`` and, through the telemetry span hooks, takes a snapshot
+    when each pipeline stage opens and closes; allocations still alive when
+    a stage closes are summed per stage and source line. Nested stages are
+    included in their parent (``filter`` also counts towards ``compose``).
+    cProfile is paused while snapshots are taken, so ``both`` reports the
+    same hot functions as ``cpu``; stage wall times under ``mem`` and
+    ``both`` still include snapshot cost. Only the calling process is
+    profiled, so ``build -j`` workers are not.
+    """
+
+    def __init__(self, mode: str, out: Path, *, top: int = 25) -> None:
+        if mode not in MODES:
+            raise ValueError(f"unknown profile mode '{mode}'; use one of {', '.join(MODES)}")
+        self.mode = mode
+        self.out = out
+        self.top = top
+        self.cpu = mode in ("cpu", "both")
+        self.mem = mode in ("mem", "both")
+        self._profile = cProfile.Profile() if self.cpu else None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._stage_calls: Dict[str, int] = {}
+        self._stage_seconds: Dict[str, float] = {}
+        self._stage_lines: Dict[str, Dict[str, List[int]]] = {}
+        self._started_tracemalloc = False
+
+    def start_profiling(self) -> None:
+        if self.mem and not tracemalloc.is_tracing():
+            tracemalloc.start(TRACE_FRAMES)
+            self._started_tracemalloc = True
+        telemetry.add_sink(self)
+        if self._profile is not None:
+            self._profile.enable()
+
+    def stop_profiling(self, command: Sequence[str]) -> List[Path]:
+        """Stop profiling and write the reports; returns the written paths."""
+        if self._profile is not None:
+            self._profile.disable()
+        telemetry.remove_sink(self)
+        self.out.mkdir(parents=True, exist_ok=True)
+        header = [f"# resume-cli profile ({self.mode}): {' '.join(command)}", ""]
+        written = []
+        if self._profile is not None:
+            pstats_path = self.out / "cpu.pstats"
+            self._profile.dump_stats(pstats_path)
+            summary = self.out / "cpu-top.txt"
+            summary.write_text("\n".join(header + self._cpu_report(pstats.Stats(self._profile))) + "\n", encoding="utf-8")
+            written += [pstats_path, summary]
+        if self.mem:
+            snapshot_path = self.out / "mem.snapshot"
+            tracemalloc.take_snapshot().dump(str(snapshot_path))
+            report = self.out / "mem-stages.txt"
+            report.write_text("\n".join(header + self._mem_report()) + "\n", encoding="utf-8")
+            written += [snapshot_path, report]
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+        return written
+
+    # telemetry.Sink
+    def start(self, name: str) -> None:
+        if not self.mem:
+            return
+        with self._paused():
+            self._stack().append(tracemalloc.take_snapshot())
+
+    def emit(self, record: telemetry.SpanRecord) -> None:
+        with self._lock:
+            self._stage_calls[record.name] = self._stage_calls.get(record.name, 0) + 1
+            self._stage_seconds[record.name] = self._stage_seconds.get(record.name, 0.0) + record.duration
+        if not self.mem:
+            return
+        stack = self._stack()
+        if not stack:
+            return
+        with self._paused(), self._lock:
+            lines = self._stage_lines.setdefault(record.name, {})
+            for stat in tracemalloc.take_snapshot().compare_to(stack.pop(), "lineno"):
+                frame = stat.traceback[0]
+                if stat.size_diff == 0 or frame.filename in _IGNORED_FILES:
+                    continue
+                key = f"{short_path(frame.filename)}:{frame.lineno}"
+                totals = lines.setdefault(key, [0, 0])
+                totals[0] += stat.size_diff
+                totals[1] += stat.count_diff
+
+    @contextmanager
+    def _paused(self) -> Iterator[None]:
+        """Keep snapshot bookkeeping out of the CPU profile."""
+        if self._profile is not None:
+            self._profile.disable()
+        try:
+            yield
+        finally:
+            if self._profile is not None:
+                self._profile.enable()
+
+    def _stack(self) -> List[tracemalloc.Snapshot]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _stage_table(self) -> List[str]:
+        lines = [f"{'STAGE':<16} {'CALLS':>7} {'TOTAL MS':>11}"]
+        for name in sorted(self._stage_calls):
+            lines.append(f"{name:<16} {self._stage_calls[name]:>7} {self._stage_seconds[name] * 1000:>11.3f}")
+        return lines
+
+    def _cpu_report(self, stats: pstats.Stats) -> List[str]:
+        entries: Dict[Tuple[str, int, str], Tuple[int, int, float, float]] = {
+            key: value[:4] for key, value in stats.stats.items()  # type: ignore[attr-defined]
+        }
+        total = sum(tottime for _, _, tottime, _ in entries.values()) or 1.0
+        by_package: Dict[str, float] = {}
+        for (filename, _, _), (_, _, tottime, _) in entries.items():
+            package = package_of(filename)
+            by_package[package] = by_package.get(package, 0.0) + tottime
+
+        lines = ["## time by package (tottime)", f"{'PACKAGE':<22} {'SECONDS':>9} {'SHARE':>7}"]
+        for package, seconds in sorted(by_package.items(), key=lambda item: (-item[1], item[0])):
+            lines.append(f"{package:<22} {seconds:>9.4f} {seconds / total:>7.1%}")
+        lines += ["", "## pipeline stages", *self._stage_table()]
+        for title, column in (("cumulative", 3), ("own", 2)):
+            lines += ["", f"## top {self.top} functions by {title} time", f"{'NCALLS':>9} {'TOTTIME':>9} {'CUMTIME':>9}  FUNCTION"]
+            ranked = sorted(entries.items(), key=lambda item: (-item[1][column], _function_label(item[0])))
+            for key, (_, ncalls, tottime, cumtime) in ranked[: self.top]:
+                lines.append(f"{ncalls:>9} {tottime:>9.4f} {cumtime:>9.4f}  {_function_label(key)}")
+        return lines
+
+    def _mem_report(self) -> List[str]:
+        lines = ["## pipeline stages", *self._stage_table()]
+        for name in sorted(self._stage_lines):
+            entries = self._stage_lines[name]
+            net = sum(size for size, _ in entries.values())
+            lines += [
+                "",
+                f"## {name}: net {net / 1024:+.1f} KiB retained over {self._stage_calls.get(name, 0)} calls",
+                f"{'KIB':>10} {'BLOCKS':>8}  LINE",
+            ]
+            ranked = sorted(entries.items(), key=lambda item: (-abs(item[1][0]), item[0]))
+            for key, (size, count) in ranked[: self.top]:
+                lines.append(f"{size / 1024:>+10.1f} {count:>+8}  {key}")
+        return lines
+
+
+def _function_label(key: Tuple[str, int, str]) -> str:
+    filename, lineno, function = key
+    if filename == "~":
+        return function
+    return f"{function} ({short_path(filename)}:{lineno})"
+
+
+# Allocations made by the profiler and span bookkeeping themselves.
+_IGNORED_FILES = frozenset({__file__, telemetry.__file__, tracemalloc.__file__})
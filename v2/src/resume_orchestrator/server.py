@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+import json
+import os
+import socketserver
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .builds import (
+    BuildContext,
+    BuildOptions,
+    build_template,
+    create_exporter,
+    load_manifest,
+    output_digest,
+    update_manifest,
+    validation_errors,
+)
+from .composer import ResumeComposer
+from .data_store import DataStore
+from .fitting import fit_for_exporter
+from .loaders import TemplateLoader
+
+CONTENT_TYPES = {"pdf": "application/pdf", "markdown": "text/markdown; charset=utf-8"}
+
+
+class ServiceBusy(Exception):
+    """Raised when every worker is busy and the wait queue is full."""
+
+
+class RenderService:
+    """Warm rendering state shared by all requests of one ``resume-cli serve`` process.
+
+    Renders run on a bounded thread pool. At most ``workers + queue_size``
+    jobs are admitted at once; further submissions raise ``ServiceBusy`` so
+    the server can answer 503 instead of queueing without bound. Rendered
+    outputs are kept in a small LRU keyed by the build digest, so repeated
+    previews of an unchanged template skip layout entirely; when the store
+    reloads, only the outputs of templates the change affects are dropped. ``/build`` shares
+    the CLI's build manifest in ``out``; reads and updates of it are
+    serialised by a lock so concurrent builds do not drop each other's entries.
+    """
+
+    def __init__(
+        self,
+        store: DataStore,
+        loader: TemplateLoader,
+        composer: ResumeComposer,
+        *,
+        workers: int = 4,
+        queue_size: int = 16,
+        out: Path = Path("builds"),
+        cache_size: int = 64,
+    ) -> None:
+        self.store = store
+        self.loader = loader
+        self.composer = composer
+        self.out = out
+        self._context = BuildContext(loader, composer)
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="resume-render")
+        self._slots = threading.BoundedSemaphore(workers + queue_size)
+        self._rendered: "OrderedDict[str, Tuple[str, bytes]]" = OrderedDict()
+        self._rendered_lock = threading.Lock()
+        self._cache_size = cache_size
+        self._manifest_lock = threading.Lock()
+        composer.add_affected_listener(self._forget_rendered)
+
+    def submit(self, fn: Callable[..., Any], *args: Any, timeout: Optional[float] = None) -> Any:
+        """Run ``fn(*args)`` on the pool and wait for it; raises ``ServiceBusy`` when saturated."""
+        if not self._slots.acquire(blocking=False):
+            raise ServiceBusy("render queue is full")
+
+        def run() -> Any:
+            try:
+                return fn(*args)
+            finally:
+                self._slots.release()
+
+        try:
+            future = self._pool.submit(run)
+        except BaseException:
+            self._slots.release()
+            raise
+        return future.result(timeout=timeout)
+
+    def render(self, template: str, export: str = "pdf", deterministic: bool = False) -> Tuple[bytes, str]:
+        """Rendered bytes and build digest for ``template``."""
+        exporter = create_exporter(BuildOptions(export=export, deterministic=deterministic))
+        config = self.loader.load(template)
+        resume = self.composer.compose(config)
+        digest = output_digest(resume, exporter)
+        with self._rendered_lock:
+            entry = self._rendered.get(digest)
+            if entry is not None:
+                self._rendered.move_to_end(digest)
+                return entry[1], digest
+        resume, _ = fit_for_exporter(resume, exporter)
+        data = exporter.export_bytes(resume)
+        with self._rendered_lock:
+            self._rendered[digest] = (config.template, data)
+            while len(self._rendered) > self._cache_size:
+                self._rendered.popitem(last=False)
+        return data, digest
+
+    def _forget_rendered(self, affected: List[str]) -> None:
+        # Their digests change with the new bundle, so these entries would only ever be evicted.
+        if not affected:
+            return
+        stale = set(affected)
+        with self._rendered_lock:
+            for digest in [digest for digest, (key, _) in self._rendered.items() if key in stale]:
+                del self._rendered[digest]
+
+    def build(self, template: str, options: BuildOptions) -> Dict[str, Any]:
+        if not options.force:
+            with self._manifest_lock:
+                options = replace(options, known_outputs=load_manifest(options.out))
+        result = build_template(self._context, template, options)
+        with self._manifest_lock:
+            update_manifest(options.out, [result])
+        payload = asdict(result)
+        payload["fit"] = result.fit.describe() if result.fit else None
+        return payload
+
+    def validate(self) -> Dict[str, Any]:
+        errors = validation_errors(self.store, self.loader)
+        return {"ok": not errors, "errors": errors}
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=True)
+
+
+class RequestHandler(BaseHTTPRequestHandler):
+    """JSON API: ``GET /health``, ``GET /validate``, ``POST /preview`` and ``POST /build``."""
+
+    server_version = "resume-orchestrator"
+    protocol_version = "HTTP/1.1"
+    service: RenderService  # set on the server-specific subclass
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        if self.path == "/health":
+            snapshot = self.service.store.snapshot()
+            self._send_json(200, {"status": "ok", "generation": snapshot.generation})
+        elif self.path == "/validate":
+            self._dispatch(self.service.validate)
+        else:
+            self._send_json(404, {"error": f"unknown path {self.path}"})
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server naming
+        # The body is always read so a keep-alive connection stays in sync, even on errors.
+        try:
+            body: Optional[Dict[str, Any]] = self._read_json()
+        except (ValueError, TypeError):
+            body = None
+        if self.path not in ("/preview", "/build"):
+            self._send_json(404, {"error": f"unknown path {self.path}"})
+            return
+        template = body.get("template") if body is not None else None
+        if not isinstance(template, str):
+            self._send_json(400, {"error": "expected a JSON object with a 'template' key"})
+            return
+        # Only listed names reach the loader, so paths like ``../x`` never touch the filesystem.
+        if template not in self.service.loader.list_templates():
+            self._send_json(404, {"error": f"unknown template {template!r}"})
+            return
+        if self.path == "/preview":
+            export = body.get("export", "markdown")
+            outcome = self._dispatch(self.service.render, template, export, bool(body.get("deterministic")), send=False)
+            if outcome is not None:
+                data, digest = outcome
+                self._send(200, data, CONTENT_TYPES.get(export, "application/octet-stream"), {"X-Resume-Digest": digest})
+        else:
+            options = BuildOptions(
+                export=body.get("export", "pdf"),
+                out=self.service.out,
+                force=bool(body.get("force")),
+                deterministic=bool(body.get("deterministic")),
+            )
+            self._dispatch(self.service.build, template, options)
+
+    def _dispatch(self, fn: Callable[..., Any], *args: Any, send: bool = True) -> Any:
+        started = time.perf_counter()
+        try:
+            result = self.service.submit(fn, *args)
+        except ServiceBusy as exc:
+            self._send_json(503, {"error": str(exc)}, {"Retry-After": "1"})
+            return None
+        except FileNotFoundError as exc:
+            self._send_json(404, {"error": str(exc)})
+            return None
+        except ValueError as exc:  # e.g. an unsupported export format
+            self._send_json(400, {"error": str(exc)})
+            return None
+        except Exception as exc:  # noqa: BLE001 - report, keep serving
+            self._send_json(500, {"error": f"{type(exc).__name__}: {exc}"})
+            return None
+        if send:
+            self._send_json(200, result, {"X-Render-Seconds": f"{time.perf_counter() - started:.4f}"})
+        return result
+
+    def _read_json(self) -> Dict[str, Any]:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length) or b"{}")
+        if not isinstance(body, dict):
+            raise TypeError("request body must be a JSON object")
+        return body
+
+    def _send_json(self, status: int, payload: Any, headers: Optional[Dict[str, str]] = None) -> None:
+        data = json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8")
+        self._send(status, data, "application/json", headers)
+
+    def _send(self, status: int, data: bytes, content_type: str, headers: Optional[Dict[str, str]] = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def address_string(self) -> str:
+        return self.client_address[0] if isinstance(self.client_address, tuple) else "unix"
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002 - http.server signature
+        if not getattr(self.server, "quiet", False):
+            super().log_message(format, *args)
+
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def server_bind(self) -> None:
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+        super().server_bind()
+        self.server_name, self.server_port = "localhost", 0
+
+
+def create_server(
+    service: RenderService,
+    *,
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    socket_path: Optional[Path] = None,
+    quiet: bool = False,
+) -> socketserver.BaseServer:
+    """HTTP server bound to ``host:port``, or to ``socket_path`` when given."""
+    handler = type("BoundRequestHandler", (RequestHandler,), {"service": service})
+    if socket_path is not None:
+        server: socketserver.BaseServer = UnixHTTPServer(str(socket_path), handler)
+    else:
+        server = ThreadingHTTPServer((host, port), handler)
+        server.daemon_threads = True
+    server.quiet = quiet  # type: ignore[attr-defined]
+    return server
+
+
+def serve(service: RenderService, **server_options: Any) -> None:
+    server = create_server(service, **server_options)
+    socket_path = server_options.get("socket_path")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.shutdown()
+        if socket_path is not None and Path(socket_path).exists():
+            Path(socket_path).unlink()
+
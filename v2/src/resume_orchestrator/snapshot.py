@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import gc
+import hashlib
+import json
+import os
+import marshal
+import sys
+from pathlib import Path
+from typing import Dict, Optional
+
+from .data_models import BlocksBundle, ExperienceBlock, PersonalInfo, SkillCategory
+
+SNAPSHOT_FORMAT = 2
+SNAPSHOT_SUFFIX = ".snapshot"
+
+
+def schema_version() -> str:
+    """Fingerprint of the snapshot format and the model fields it stores."""
+    fields = {
+        model.__name__: sorted(model.model_fields)
+        for model in (BlocksBundle, PersonalInfo, SkillCategory, ExperienceBlock)
+    }
+    payload = json.dumps(
+        {"format": SNAPSHOT_FORMAT, "marshal": marshal.version, "python": sys.version_info[:2], "fields": fields},
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def snapshot_path(blocks_path: Path) -> Path:
+    return blocks_path.with_suffix(SNAPSHOT_SUFFIX)
+
+
+def source_hash(payload: bytes) -> str:
+    return hashlib.sha256(payload).hexdigest()
+
+
+def write_snapshot(blocks_path: Path, destination: Path | None = None) -> Path:
+    """Validate ``blocks_path`` fully and store the result as a compiled snapshot."""
+    payload = blocks_path.read_bytes()
+    raw: Dict[str, object] = json.loads(payload.decode("utf-8"))
+    bundle = BlocksBundle.from_dict(raw)
+    record = {
+        "schema_version": schema_version(),
+        "source_hash": source_hash(payload),
+        "bundle": bundle.model_dump(),
+        # Parsed periods, tag sets and hidden tokens, so loading skips ``model_post_init``.
+        "derived": [block.derived_state() for block in bundle.experience],
+    }
+    target = destination or snapshot_path(blocks_path)
+    tmp = target.with_name(f"{target.name}.tmp")
+    tmp.write_bytes(marshal.dumps(record))
+    os.replace(tmp, target)
+    return target
+
+
+def load_snapshot(blocks_path: Path, content_hash: str) -> Optional[BlocksBundle]:
+    """Return the snapshot bundle if it matches ``content_hash`` and the current schema.
+
+    Snapshots hold plain ``marshal`` data produced by ``write_snapshot``; any
+    mismatch or unreadable file returns ``None`` so callers fall back to full
+    validation.
+    """
+    path = snapshot_path(blocks_path)
+    try:
+        payload = path.read_bytes()
+    except OSError:
+        return None
+    # Loading allocates a few containers per field and block and frees none of them;
+    # cyclic collection passes during it only cost time.
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return _bundle_from_record(payload, content_hash)
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _bundle_from_record(payload: bytes, content_hash: str) -> Optional[BlocksBundle]:
+    try:
+        record = marshal.loads(payload)
+    except (EOFError, TypeError, ValueError):
+        return None
+    if not isinstance(record, dict):
+        return None
+    if record.get("schema_version") != schema_version() or record.get("source_hash") != content_hash:
+        return None
+    bundle, derived = record.get("bundle"), record.get("derived")
+    if not isinstance(bundle, dict) or not isinstance(derived, list) or len(derived) != len(bundle["experience"]):
+        return None
+    return BlocksBundle.from_trusted(bundle, derived)
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import json
+import random
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import yaml
+
+SKILL_LEVELS = ("expert", "proficient", "familiar")
+
+_WORDS = (
+    "automated", "built", "scaled", "migrated", "operated", "designed", "hardened", "monitored",
+    "kubernetes", "terraform", "pipelines", "clusters", "services", "databases", "observability",
+    "latency", "throughput", "deployments", "incidents", "alerts", "compliance", "capacity",
+    "platform", "teams", "workloads", "gateways", "queues", "caches", "storage", "networks",
+    "releases", "rollouts", "budgets", "dashboards", "runbooks", "policies", "secrets", "images",
+)
+_TITLES = ("DevOps Engineer", "Senior DevOps Engineer", "Lead DevOps", "SRE", "Platform Engineer", "System Administrator")
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+@dataclass(frozen=True)
+class SyntheticSpec:
+    """Shape of a generated dataset. Ranges are inclusive ``(low, high)`` pairs.
+
+    The same spec and ``seed`` always produce byte-identical files.
+    """
+
+    blocks: int = 1000
+    seed: int = 0
+    tag_vocabulary: int = 40
+    tags_per_block: Tuple[int, int] = (2, 6)
+    responsibilities: Tuple[int, int] = (2, 6)
+    achievements: Tuple[int, int] = (0, 3)
+    words_per_bullet: Tuple[int, int] = (6, 18)
+    start_years: Tuple[int, int] = (2000, 2025)
+    duration_years: Tuple[int, int] = (0, 5)
+    month_period_ratio: float = 0.3
+    current_ratio: float = 0.05
+    hidden_ratio: float = 0.1
+    skill_categories: int = 10
+    skills_per_level: Tuple[int, int] = (1, 6)
+    summaries: int = 4
+    headline_variants: Tuple[str, ...] = ("senior", "lead", "sre", "platform")
+    templates: int = 3
+    template_tags: Tuple[int, int] = (2, 5)
+    max_experience_blocks: Tuple[int, int] = (3, 8)
+
+
+def tag_vocabulary(spec: SyntheticSpec) -> List[str]:
+    return [f"tag-{index:03d}" for index in range(spec.tag_vocabulary)]
+
+
+def _between(rng: random.Random, bounds: Tuple[int, int]) -> int:
+    return rng.randint(bounds[0], bounds[1])
+
+
+def _sentence(rng: random.Random, spec: SyntheticSpec) -> str:
+    words = [rng.choice(_WORDS) for _ in range(_between(rng, spec.words_per_bullet))]
+    return " ".join(words).capitalize()
+
+
+def _period(rng: random.Random, spec: SyntheticSpec) -> str:
+    start = _between(rng, spec.start_years)
+    if rng.random() < spec.current_ratio:
+        return f"{start} – Present"
+    end = min(start + _between(rng, spec.duration_years), spec.start_years[1])
+    if rng.random() < spec.month_period_ratio:
+        return f"{rng.choice(_MONTHS)} {start} – {rng.choice(_MONTHS)} {end}"
+    return f"{start} – {end}"
+
+
+def generate_bundle(spec: SyntheticSpec) -> Dict[str, Any]:
+    """A ``blocks.json`` payload that validates as ``BlocksBundle``."""
+    rng = random.Random(spec.seed)
+    tags = tag_vocabulary(spec)
+    skills = {}
+    for index in range(spec.skill_categories):
+        levels = {
+            level: [f"Skill {index}.{level[0]}{item}" for item in range(_between(rng, spec.skills_per_level))]
+            for level in SKILL_LEVELS
+        }
+        skills[f"category_{index:02d}"] = {"category": f"Category {index:02d}", "levels": levels}
+
+    experience = []
+    for index in range(spec.blocks):
+        block: Dict[str, Any] = {
+            "id": f"exp_{index:06d}",
+            "title": rng.choice(_TITLES),
+            "company": f"Company {rng.randrange(max(1, spec.blocks // 3)):05d}",
+            "period": _period(rng, spec),
+            "tags": rng.sample(tags, k=min(len(tags), _between(rng, spec.tags_per_block))),
+            "responsibilities": [_sentence(rng, spec) for _ in range(_between(rng, spec.responsibilities))],
+            "achievements": [_sentence(rng, spec) for _ in range(_between(rng, spec.achievements))],
+        }
+        if rng.random() < spec.hidden_ratio:
+            block["hidden_for"] = [f"template_{rng.randrange(max(1, spec.templates)):03d}"]
+        experience.append(block)
+
+    return {
+        "personal_info": {
+            "name": "Synthetic Candidate",
+            "title_variants": {variant: f"{variant.title()} Engineer" for variant in spec.headline_variants},
+            "contacts": {"email": "candidate@example.com", "telegram": "@synthetic"},
+            "availability": {},
+        },
+        "summaries": {f"summary_{index:02d}": _sentence(rng, spec) for index in range(spec.summaries)},
+        "skills": skills,
+        "experience": experience,
+    }
+
+
+def generate_templates(spec: SyntheticSpec) -> List[Dict[str, Any]]:
+    """Template configs that reference only keys ``generate_bundle(spec)`` produces."""
+    rng = random.Random(spec.seed + 1)
+    tags = tag_vocabulary(spec)
+    categories = [f"category_{index:02d}" for index in range(spec.skill_categories)]
+    templates = []
+    for index in range(spec.templates):
+        key = f"template_{index:03d}"
+        include = rng.sample(tags, k=min(len(tags), _between(rng, spec.template_tags)))
+        remaining = [tag for tag in tags if tag not in include]
+        templates.append(
+            {
+                "template": key,
+                "name": f"Synthetic Template {index}",
+                "headline_variant": rng.choice(spec.headline_variants) if spec.headline_variants else "senior",
+                "summary_key": f"summary_{rng.randrange(max(1, spec.summaries)):02d}",
+                "skill_categories": rng.sample(categories, k=min(len(categories), rng.randint(1, 5))),
+                "skill_levels": ["expert", "proficient"],
+                "filters": {
+                    "include_tags": include,
+                    "priority_tags": rng.sample(include, k=min(len(include), 2)),
+                    "exclude_tags": rng.sample(remaining, k=min(len(remaining), 1)),
+                    "limit_years": rng.randint(5, 15),
+                },
+                "options": {
+                    "highlight_achievements": True,
+                    "max_experience_blocks": _between(rng, spec.max_experience_blocks),
+                },
+            }
+        )
+    return templates
+
+
+def write_dataset(spec: SyntheticSpec, directory: Path) -> Tuple[Path, Path]:
+    """Write ``blocks.json`` and ``templates/*.yaml`` under ``directory``; returns both paths."""
+    directory.mkdir(parents=True, exist_ok=True)
+    blocks_path = directory / "blocks.json"
+    blocks_path.write_text(json.dumps(generate_bundle(spec), indent=1, ensure_ascii=False) + "\n", encoding="utf-8")
+    templates_dir = directory / "templates"
+    templates_dir.mkdir(exist_ok=True)
+    for template in generate_templates(spec):
+        path = templates_dir / f"{template['template']}.yaml"
+        path.write_text(yaml.safe_dump(template, sort_keys=False, allow_unicode=True), encoding="utf-8")
+    return blocks_path, templates_dir
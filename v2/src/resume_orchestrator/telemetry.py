@@ -0,0 +1,309 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, TextIO, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SpanRecord:
+    name: str
+    start: float  # Unix time
+    duration: float  # seconds
+    parent: Optional[str] = None
+    error: Optional[str] = None
+    attributes: Mapping[str, Any] = field(default_factory=dict)
+
+
+class Sink(ABC):
+    """Receives every finished span. ``emit`` may be called from several threads.
+
+    Exceptions raised by any of its methods are logged and swallowed, so a
+    broken sink never fails the stage it observes or the other sinks.
+    """
+
+    @abstractmethod
+    def emit(self, record: SpanRecord) -> None:
+        ...
+
+    def start(self, name: str) -> None:
+        """Called when a span opens, on the thread running it; most sinks ignore it."""
+
+    def flush(self) -> None:
+        """Write out buffered data; called on ``shutdown`` and may be called again later."""
+
+    def close(self) -> None:
+        """Release resources the sink owns; called once on ``shutdown``, after ``flush``."""
+
+
+_sinks: Tuple[Sink, ...] = ()
+_sinks_lock = threading.Lock()
+_current: ContextVar[Optional[str]] = ContextVar("resume_orchestrator_span", default=None)
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> bool:
+        return False
+
+    def set(self, **attributes: Any) -> None:
+        pass
+
+
+_NOOP = _NoopSpan()
+
+
+class _Span:
+    __slots__ = ("name", "attributes", "_sinks", "_start", "_wall", "_token", "_parent")
+
+    def __init__(self, name: str, attributes: Dict[str, Any], sinks: Tuple[Sink, ...]) -> None:
+        self.name = name
+        self.attributes = attributes
+        self._sinks = sinks
+
+    def __enter__(self) -> "_Span":
+        self._parent = _current.get()
+        self._token = _current.set(self.name)
+        for sink in self._sinks:
+            try:
+                sink.start(self.name)
+            except Exception:  # noqa: BLE001 - telemetry must not break the pipeline
+                logger.exception("telemetry sink %r failed to start span %s", sink, self.name)
+        self._wall = time.time()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, traceback: Any) -> bool:
+        duration = time.perf_counter() - self._start
+        _current.reset(self._token)
+        record = SpanRecord(
+            name=self.name,
+            start=self._wall,
+            duration=duration,
+            parent=self._parent,
+            error=f"{exc_type.__name__}: {exc}" if exc_type else None,
+            attributes=self.attributes,
+        )
+        for sink in self._sinks:
+            try:
+                sink.emit(record)
+            except Exception:  # noqa: BLE001 - telemetry must not break the pipeline
+                logger.exception("telemetry sink %r failed to record span %s", sink, self.name)
+        return False
+
+    def set(self, **attributes: Any) -> None:
+        """Attach attributes known only once the work is done (cache hit, result size, ...)."""
+        self.attributes.update(attributes)
+
+
+def span(name: str, **attributes: Any):
+    """Context manager timing one pipeline stage.
+
+    With no sinks installed this returns a shared no-op object, so
+    instrumented code pays one global lookup per call.
+    """
+    sinks = _sinks
+    if not sinks:
+        return _NOOP
+    return _Span(name, attributes, sinks)
+
+
+def enabled() -> bool:
+    return bool(_sinks)
+
+
+def add_sink(sink: Sink) -> Sink:
+    global _sinks
+    with _sinks_lock:
+        _sinks = _sinks + (sink,)
+    return sink
+
+
+def remove_sink(sink: Sink) -> None:
+    global _sinks
+    with _sinks_lock:
+        _sinks = tuple(existing for existing in _sinks if existing is not sink)
+
+
+def reset() -> None:
+    """Detach every sink without flushing it (used in build pool workers)."""
+    global _sinks
+    with _sinks_lock:
+        _sinks = ()
+
+
+def shutdown() -> None:
+    """Detach every sink, then flush and close each one."""
+    global _sinks
+    with _sinks_lock:
+        sinks, _sinks = _sinks, ()
+    for sink in sinks:
+        for step in (sink.flush, sink.close):
+            try:
+                step()
+            except Exception:  # noqa: BLE001 - telemetry must not break the pipeline
+                logger.exception("telemetry sink %r failed to %s", sink, step.__name__)
+
+
+class InMemorySink(Sink):
+    """Collects spans in a list; meant for tests."""
+
+    def __init__(self) -> None:
+        self.records: List[SpanRecord] = []
+        self._lock = threading.Lock()
+
+    def emit(self, record: SpanRecord) -> None:
+        with self._lock:
+            self.records.append(record)
+
+    def names(self) -> List[str]:
+        with self._lock:
+            return [record.name for record in self.records]
+
+    def clear(self) -> None:
+        with self._lock:
+            self.records.clear()
+
+
+class JsonLogSink(Sink):
+    """One JSON object per span, appended to ``path`` or written to ``stream`` (stderr by default)."""
+
+    def __init__(self, path: Path | None = None, stream: TextIO | None = None) -> None:
+        self._owned = path is not None
+        self._stream = open(path, "a", encoding="utf-8") if path is not None else (stream or sys.stderr)
+        self._lock = threading.Lock()
+
+    def emit(self, record: SpanRecord) -> None:
+        line = json.dumps(
+            {
+                "ts": round(record.start, 6),
+                "span": record.name,
+                "duration_ms": round(record.duration * 1000, 3),
+                "parent": record.parent,
+                "error": record.error,
+                **record.attributes,
+            },
+            ensure_ascii=False,
+            default=str,
+        )
+        with self._lock:
+            self._stream.write(line + "\n")
+            self._stream.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._stream.closed:
+                self._stream.flush()
+
+    def close(self) -> None:
+        """Close the file opened for ``path``; a caller's ``stream`` is left open."""
+        with self._lock:
+            if self._owned:
+                self._stream.close()
+
+
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class PrometheusTextfileSink(Sink):
+    """Aggregates span durations into a histogram per span name for node_exporter's textfile collector.
+
+    The file is rewritten atomically at most every ``interval`` seconds while
+    spans arrive, and once more on ``flush``. Writes are serialised and go
+    through a unique temporary file in the target directory, so concurrent
+    flushes (or processes sharing the path) never collide.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        prefix: str = "resume_orchestrator",
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+        interval: float = 10.0,
+    ) -> None:
+        self.path = Path(path)
+        self.prefix = prefix
+        self.buckets = buckets
+        self.interval = interval
+        self._counts: Dict[str, List[int]] = {}
+        self._sums: Dict[str, float] = {}
+        self._errors: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._last_write = time.monotonic()
+
+    def emit(self, record: SpanRecord) -> None:
+        with self._lock:
+            counts = self._counts.setdefault(record.name, [0] * (len(self.buckets) + 1))
+            for position, bound in enumerate(self.buckets):
+                if record.duration <= bound:
+                    counts[position] += 1
+            counts[-1] += 1
+            self._sums[record.name] = self._sums.get(record.name, 0.0) + record.duration
+            if record.error:
+                self._errors[record.name] = self._errors.get(record.name, 0) + 1
+            due = time.monotonic() - self._last_write >= self.interval
+        if due:
+            self.flush()
+
+    def render(self) -> str:
+        metric = f"{self.prefix}_span_duration_seconds"
+        errors = f"{self.prefix}_span_errors_total"
+        lines = [
+            f"# HELP {metric} Duration of instrumented pipeline stages.",
+            f"# TYPE {metric} histogram",
+        ]
+        with self._lock:
+            for name in sorted(self._counts):
+                counts = self._counts[name]
+                for bound, count in zip(self.buckets, counts):
+                    lines.append(f'{metric}_bucket{{span="{name}",le="{bound:g}"}} {count}')
+                lines.append(f'{metric}_bucket{{span="{name}",le="+Inf"}} {counts[-1]}')
+                lines.append(f'{metric}_sum{{span="{name}"}} {self._sums[name]:.6f}')
+                lines.append(f'{metric}_count{{span="{name}"}} {counts[-1]}')
+            lines.append(f"# HELP {errors} Instrumented stages that raised.")
+            lines.append(f"# TYPE {errors} counter")
+            for name in sorted(self._counts):
+                lines.append(f'{errors}{{span="{name}"}} {self._errors.get(name, 0)}')
+        return "\n".join(lines) + "\n"
+
+    def flush(self) -> None:
+        with self._write_lock:
+            payload = self.render()
+            fd, tmp = tempfile.mkstemp(prefix=f".{self.path.name}.", suffix=".tmp", dir=self.path.parent)
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                    handle.write(payload)
+                os.chmod(tmp, 0o644)  # mkstemp creates 0600; the collector may run as another user
+                os.replace(tmp, self.path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+            with self._lock:
+                self._last_write = time.monotonic()
+
+
+def sink_from_spec(spec: str) -> Sink:
+    """Build a sink from a CLI spec: ``json`` (stderr), ``json:PATH`` or ``prom:PATH``."""
+    kind, _, target = spec.partition(":")
+    if kind == "json":
+        return JsonLogSink(Path(target)) if target else JsonLogSink()
+    if kind == "prom" and target:
+        return PrometheusTextfileSink(Path(target))
+    raise ValueError(f"unknown trace sink '{spec}'; use json, json:PATH or prom:PATH")
@@ -0,0 +1,57 @@
+from dataclasses import replace
+from pathlib import Path
+from types import MappingProxyType
+
+import pytest
+
+from resume_orchestrator.composer import ResumeComposer
+from resume_orchestrator.data_store import DataStore
+from resume_orchestrator.loaders import TemplateLoader
+
+CONFIGS_DIR = Path(__file__).resolve().parents[1] / "configs"
+
+
+@pytest.fixture
+def configs_dir():
+    """The shipped ``configs/`` directory (``blocks.json`` and ``templates/``)."""
+    return CONFIGS_DIR
+
+
+@pytest.fixture
+def make_raw():
+    """Factory for a minimal valid ``blocks.json`` payload."""
+
+    def make(summary="Summary"):
+        return {
+            "personal_info": {"name": "Test", "contacts": {"email": "t@example.com"}},
+            "summaries": {"main": summary},
+            "skills": {"cloud": {"category": "Cloud", "levels": {"expert": ["GCP", "AWS"]}}},
+            "experience": [
+                {
+                    "id": "a",
+                    "title": "DevOps",
+                    "company": "Co",
+                    "period": "2022 – Present",
+                    "tags": ["devops"],
+                    "responsibilities": ["Did things"],
+                }
+            ],
+        }
+
+    return make
+
+
+@pytest.fixture
+def compose(configs_dir):
+    """Factory composing a shipped template; keyword arguments override its ``options``."""
+    composer = ResumeComposer(DataStore(configs_dir / "blocks.json", background=False).bundle())
+    loader = TemplateLoader(configs_dir / "templates")
+
+    def make(template="fintech_focused", **options):
+        resume = composer.compose(loader.load(template))
+        if not options:
+            return resume
+        meta = dict(resume.meta, options=MappingProxyType({**resume.meta["options"], **options}))
+        return replace(resume, meta=MappingProxyType(meta))
+
+    return make
@@ -0,0 +1,48 @@
+"""Benchmark smoke tests.
+
+Set ``RESUME_BENCH_BASELINE=path/to/baseline.json`` (and optionally
+``RESUME_BENCH_THRESHOLD``, ``RESUME_BENCH_SIZES``) to turn
+``test_no_stage_regressed`` into a regression gate.
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from resume_orchestrator.bench import STAGES, compare, percentile, run_bench
+
+
+def test_report_covers_every_stage_and_synthetic_size(configs_dir):
+    pytest.importorskip("reportlab")
+    report = run_bench(configs_dir, sizes=[100], repeat=2)
+
+    assert [run["dataset"] for run in report["runs"]] == ["shipped", "synthetic-100"]
+    assert report["runs"][1]["blocks"] == 100
+    for run in report["runs"]:
+        assert tuple(run["stages"]) == STAGES
+        for stats in run["stages"].values():
+            assert stats["runs"] == 2 and stats["p50_ms"] <= stats["p95_ms"]
+    json.dumps(report)
+
+
+def test_compare_flags_only_slowdowns_over_threshold():
+    def report(**stages):
+        return {"runs": [{"dataset": "shipped", "stages": {k: {"p50_ms": v} for k, v in stages.items()}}]}
+
+    baseline = report(compose=10.0, filter=1.0, export_pdf=50.0)
+    current = report(compose=13.0, filter=1.4, export_pdf=55.0, bundle_load=3.0)
+    regressions = compare(current, baseline, threshold_pct=20)
+
+    assert [(r.stage, round(r.change_pct)) for r in regressions] == [("compose", 30)]
+    assert percentile([5, 1, 3, 2, 4], 50) == 3 and percentile([5, 1, 3, 2, 4], 95) == 5
+
+
+@pytest.mark.skipif(not os.environ.get("RESUME_BENCH_BASELINE"), reason="RESUME_BENCH_BASELINE not set")
+def test_no_stage_regressed(configs_dir):
+    baseline = json.loads(Path(os.environ["RESUME_BENCH_BASELINE"]).read_text(encoding="utf-8"))
+    sizes = [int(size) for size in os.environ.get("RESUME_BENCH_SIZES", "").split(",") if size]
+    report = run_bench(configs_dir, sizes=sizes, repeat=int(os.environ.get("RESUME_BENCH_REPEAT", "10")))
+    regressions = compare(report, baseline, float(os.environ.get("RESUME_BENCH_THRESHOLD", "20")))
+    assert not regressions, "\n".join(str(regression) for regression in regressions)
@@ -0,0 +1,64 @@
+from resume_orchestrator.builds import BuildOptions, build_many, load_manifest
+from resume_orchestrator.exporters.markdown import MarkdownExporter
+
+
+def test_parallel_build_isolates_failures(tmp_path, configs_dir):
+    options = BuildOptions(export="markdown", out=tmp_path)
+    results = build_many(["fintech_focused", "missing", "blockchain_startup"], options, jobs=2, config_dir=configs_dir)
+
+    assert [result.template for result in results] == ["fintech_focused", "missing", "blockchain_startup"]
+    assert [result.status for result in results] == ["built", "failed", "built"]
+    assert "missing" in results[1].error
+    assert (tmp_path / "fintech-focused.md").exists()
+
+
+def test_serial_and_parallel_builds_match(tmp_path, configs_dir):
+    serial = build_many(
+        ["fintech_focused"], BuildOptions(export="markdown", out=tmp_path / "a"), config_dir=configs_dir
+    )
+    parallel = build_many(
+        ["fintech_focused", "blockchain_startup"],
+        BuildOptions(export="markdown", out=tmp_path / "b"),
+        jobs=2,
+        config_dir=configs_dir,
+    )
+    assert serial[0].ok and parallel[0].ok
+    assert (tmp_path / "a" / "fintech-focused.md").read_text() == (tmp_path / "b" / "fintech-focused.md").read_text()
+
+
+def test_manifest_skips_unchanged_outputs(tmp_path, configs_dir):
+    options = BuildOptions(export="markdown", out=tmp_path)
+    first = build_many(["fintech_focused"], options, config_dir=configs_dir)
+    second = build_many(["fintech_focused"], options, config_dir=configs_dir)
+    forced = build_many(
+        ["fintech_focused"], BuildOptions(export="markdown", out=tmp_path, force=True), config_dir=configs_dir
+    )
+
+    assert [first[0].status, second[0].status, forced[0].status] == ["built", "cached", "built"]
+    assert first[0].digest == second[0].digest == forced[0].digest
+
+    (tmp_path / "fintech-focused.md").unlink()
+    assert build_many(["fintech_focused"], options, config_dir=configs_dir)[0].status == "built"
+
+
+def test_manifest_forgets_failed_and_tampered_outputs(tmp_path, configs_dir, monkeypatch):
+    options = BuildOptions(export="markdown", out=tmp_path)
+    output = tmp_path / "fintech-focused.md"
+    assert build_many(["fintech_focused"], options, config_dir=configs_dir)[0].status == "built"
+    good = output.read_bytes()
+
+    output.write_bytes(good[:-1] + b"?")  # same size, different content
+    assert build_many(["fintech_focused"], options, config_dir=configs_dir)[0].status == "built"
+    assert output.read_bytes() == good
+
+    def broken_write(self, resume, stream):
+        raise RuntimeError("render failed")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(MarkdownExporter, "write", broken_write)
+        forced = build_many(
+            ["fintech_focused"], BuildOptions(export="markdown", out=tmp_path, force=True), config_dir=configs_dir
+        )
+    assert forced[0].status == "failed"
+    assert "fintech-focused.md" not in load_manifest(tmp_path)
+    assert build_many(["fintech_focused"], options, config_dir=configs_dir)[0].status == "built"
@@ -0,0 +1,83 @@
+import subprocess
+import sys
+
+import pytest
+
+SCRIPT = """
+import sys
+from resume_orchestrator.cli import app
+sys.argv = ["resume-cli", *sys.argv[1:]]
+app()
+assert "reportlab" not in sys.modules, "reportlab imported by non-PDF command"
+"""
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["templates", "list"],
+        ["templates", "show", "fintech_focused"],
+        ["preview", "fintech_focused", "--export", "markdown"],
+        ["validate"],
+    ],
+)
+def test_non_pdf_commands_do_not_import_reportlab(argv):
+    result = subprocess.run([sys.executable, "-c", SCRIPT, *argv], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+
+def test_registry_lists_formats_without_importing_modules():
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; from resume_orchestrator.exporters import registry;"
+            "assert {'markdown', 'pdf'} <= set(registry.available_formats());"
+            "assert 'resume_orchestrator.exporters.pdf' not in sys.modules",
+        ],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_builtin_formats_do_not_scan_entry_points(monkeypatch):
+    from resume_orchestrator.exporters import base
+
+    scanned = []
+    monkeypatch.setattr(base, "_iter_entry_points", lambda group: scanned.append(group) or [])
+    registry = base.ExporterRegistry()
+    registry.register_lazy("markdown", "resume_orchestrator.exporters.markdown:MarkdownExporter")
+
+    assert registry.supports("markdown") and not scanned
+    assert not registry.supports("docx") and scanned == [base.ENTRY_POINT_GROUP]
+
+
+def test_profiling_and_builds_are_imported_only_by_their_commands():
+    modules = ["cProfile", "pstats", "multiprocessing", "concurrent.futures.process"]
+    modules += ["resume_orchestrator.builds", "resume_orchestrator.profiling"]
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; import resume_orchestrator.cli;"
+            f"loaded = [name for name in {modules!r} if name in sys.modules];"
+            "assert not loaded, loaded",
+        ],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_bare_profile_defaults_to_both(tmp_path):
+    from resume_orchestrator import cli, profiling
+
+    assert cli.PROFILE_MODES == profiling.MODES
+    assert cli._expand_bare_profile(["--profile", "templates", "list"]) == ["--profile=both", "templates", "list"]
+    assert cli._expand_bare_profile(["--profile", "cpu", "templates", "list"]) == ["--profile", "cpu", "templates", "list"]
+
+    argv = ["--profile", "--profile-out", str(tmp_path), "templates", "list"]
+    result = subprocess.run([sys.executable, "-c", SCRIPT, *argv], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert {"cpu.pstats", "mem-stages.txt"} <= {path.name for path in tmp_path.iterdir()}
@@ -0,0 +1,135 @@
+import json
+import os
+
+import pytest
+
+from resume_orchestrator.composer import ComposeCache, ResumeComposer
+from resume_orchestrator.data_models import BlocksBundle, TemplateConfig
+from resume_orchestrator.data_store import DataStore
+from resume_orchestrator.filters import FilterPlan
+
+
+def make_config(**overrides):
+    data = {
+        "template": "main",
+        "name": "Main",
+        "headline_variant": "senior",
+        "summary_key": "main",
+        "skill_categories": ["cloud"],
+        "skill_levels": ["expert"],
+    }
+    data.update(overrides)
+    return TemplateConfig(**data)
+
+
+def test_compose_is_memoised_per_config(make_raw):
+    composer = ResumeComposer(BlocksBundle.from_dict(make_raw()))
+    first = composer.compose(make_config())
+    assert composer.compose(make_config()) is first
+    assert composer.compose(make_config(name="Other")) is not first
+
+    stats = composer.cache.stats()
+    assert (stats.hits, stats.misses) == (1, 2)
+
+
+def test_composed_resume_is_read_only(make_raw):
+    resume = ResumeComposer(BlocksBundle.from_dict(make_raw())).compose(make_config())
+    assert resume.skills["Cloud"] == ("AWS", "GCP")
+    with pytest.raises(TypeError):
+        resume.personal_info["contacts"]["email"] = "x"
+
+
+def test_cache_evicts_least_recently_used(make_raw):
+    composer = ResumeComposer(BlocksBundle.from_dict(make_raw()), cache=ComposeCache(maxsize=1))
+    composer.compose(make_config())
+    composer.compose(make_config(name="Other"))
+    assert composer.cache.stats().evictions == 1
+
+
+def test_store_backed_composer_misses_after_reload(tmp_path, make_raw):
+    path = tmp_path / "blocks.json"
+    path.write_text(json.dumps(make_raw()), encoding="utf-8")
+    os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+    composer = ResumeComposer.from_store(DataStore(path, background=False))
+    assert composer.compose(make_config()).summary == "Summary"
+
+    path.write_text(json.dumps(make_raw("Updated")), encoding="utf-8")
+    os.utime(path, ns=(2_000_000_000, 2_000_000_000))
+    assert composer.compose(make_config()).summary == "Updated"
+
+
+def test_compose_many_matches_compose_in_input_order(make_raw):
+    bundle = BlocksBundle.from_dict(make_raw())
+    configs = [make_config(name=f"T{i}", skill_levels=["expert"] if i % 2 else ["proficient"]) for i in range(4)]
+    configs.append(configs[0])
+
+    batch = ResumeComposer(bundle).compose_many(configs)
+    single = [ResumeComposer(bundle).compose(config) for config in configs]
+    assert [resume.meta["name"] for resume in batch] == ["T0", "T1", "T2", "T3", "T0"]
+    assert batch == single
+    assert batch[0] is batch[-1]
+
+
+def test_compose_many_shares_selection_across_template_names(monkeypatch, make_raw):
+    raw = make_raw()
+    raw["experience"] += [
+        dict(raw["experience"][0], id="b", period="2018 – 2020", hidden_for=["fintech"]),
+        dict(raw["experience"][0], id="c", period="2015 – 2017", tags=["legacy"]),
+    ]
+    bundle = BlocksBundle.from_dict(raw)
+    filters = {"include_tags": ["devops"]}
+    configs = [
+        make_config(template="fintech_focused", filters=filters),
+        make_config(template="platform", filters=filters, options={"max_experience_blocks": 1}),
+        make_config(template="senior", filters=filters),
+    ]
+    expected = [ResumeComposer(bundle).compose(config) for config in configs]
+
+    runs = []
+    original_run = FilterPlan.run
+    monkeypatch.setattr(FilterPlan, "run", lambda plan, *args: runs.append(plan) or original_run(plan, *args))
+    batch = ResumeComposer(bundle).compose_many(configs)
+
+    assert len(runs) == 1
+    assert batch == expected
+    assert [[block.id for block in resume.experience] for resume in batch] == [["a"], ["a"], ["a", "b"]]
+
+
+def test_affected_templates_follow_dependencies(make_raw):
+    raw = make_raw()
+    raw["summaries"]["other"] = "Other summary"
+    old = BlocksBundle.from_dict(raw)
+    composer = ResumeComposer(old)
+    composer.compose(make_config())
+    composer.compose(make_config(template="other", summary_key="other", skill_categories=[]))
+
+    edited = json.loads(json.dumps(raw))
+    edited["summaries"]["other"] = "Changed"
+    assert composer.affected_templates(old, BlocksBundle.from_dict(edited)) == ["other"]
+
+    edited = json.loads(json.dumps(raw))
+    edited["experience"][0]["responsibilities"] = ["Did other things"]
+    assert composer.affected_templates(old, BlocksBundle.from_dict(edited)) == ["main", "other"]
+
+    edited = json.loads(json.dumps(raw))
+    edited["experience"].append(dict(raw["experience"][0], id="b", tags=["legacy"]))
+    configs = [make_config(filters={"exclude_tags": ["legacy"]}), make_config(template="all")]
+    assert composer.affected_templates(old, BlocksBundle.from_dict(edited), configs) == ["all"]
+
+
+def test_store_reload_reports_affected_templates(tmp_path, make_raw):
+    path = tmp_path / "blocks.json"
+    raw = make_raw()
+    path.write_text(json.dumps(raw), encoding="utf-8")
+    os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+    store = DataStore(path, background=False)
+    composer = ResumeComposer.from_store(store)
+    composer.compose(make_config())
+    reports = []
+    composer.add_affected_listener(reports.append)
+
+    raw["skills"]["cloud"]["levels"]["expert"].append("Azure")
+    path.write_text(json.dumps(raw), encoding="utf-8")
+    os.utime(path, ns=(2_000_000_000, 2_000_000_000))
+    store.snapshot()
+    assert reports == [["main"]]
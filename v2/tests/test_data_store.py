@@ -0,0 +1,74 @@
+import json
+import os
+
+from resume_orchestrator.data_store import DataStore
+
+
+def write_blocks(path, raw, mtime=None):
+    path.write_text(json.dumps(raw), encoding="utf-8")
+    if mtime is not None:
+        os.utime(path, ns=(mtime, mtime))
+
+
+def test_bundle_is_cached_until_file_changes(tmp_path, make_raw):
+    path = tmp_path / "blocks.json"
+    write_blocks(path, make_raw(), mtime=1_000_000_000)
+    store = DataStore(path, background=False)
+
+    first = store.bundle()
+    assert store.bundle() is first
+    assert store.generation == 1
+
+    write_blocks(path, make_raw("Updated"), mtime=2_000_000_000)
+    assert store.bundle().summaries["main"] == "Updated"
+    assert store.generation == 2
+
+
+def test_touch_without_content_change_keeps_generation(tmp_path, make_raw):
+    path = tmp_path / "blocks.json"
+    write_blocks(path, make_raw(), mtime=1_000_000_000)
+    store = DataStore(path, background=False)
+    first = store.bundle()
+
+    os.utime(path, ns=(3_000_000_000, 3_000_000_000))
+    assert store.bundle() is first
+    assert store.generation == 1
+
+
+def test_background_reload_swaps_snapshot(tmp_path, make_raw):
+    path = tmp_path / "blocks.json"
+    write_blocks(path, make_raw(), mtime=1_000_000_000)
+    store = DataStore(path)
+    old = store.snapshot()
+
+    write_blocks(path, make_raw("Updated"), mtime=2_000_000_000)
+    assert store.snapshot() is old  # stale snapshot served while reloading
+    store.wait_for_reload(5)
+    assert store.bundle().summaries["main"] == "Updated"
+    assert store.generation == 2
+
+
+def test_failed_background_reload_keeps_last_good_snapshot(tmp_path, make_raw):
+    path = tmp_path / "blocks.json"
+    write_blocks(path, make_raw(), mtime=1_000_000_000)
+    store = DataStore(path)
+    old = store.snapshot()
+
+    path.write_text("{broken", encoding="utf-8")
+    store.snapshot()
+    store.wait_for_reload(5)
+    assert store.snapshot() is old
+    assert store.last_error is not None
+
+
+def test_missing_file_keeps_last_good_snapshot(tmp_path, make_raw):
+    path = tmp_path / "blocks.json"
+    write_blocks(path, make_raw(), mtime=1_000_000_000)
+    for background in (True, False):
+        store = DataStore(path, background=background)
+        old = store.bundle()
+
+        path.unlink()
+        assert store.bundle() is old
+        assert isinstance(store.last_error, FileNotFoundError)
+        write_blocks(path, make_raw(), mtime=1_000_000_000)
@@ -0,0 +1,169 @@
+import hashlib
+import os
+import re
+import time
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("reportlab")
+
+import reportlab  # noqa: E402
+from reportlab.platypus import Paragraph  # noqa: E402
+
+from resume_orchestrator.exporters import registry  # noqa: E402
+from resume_orchestrator.exporters.base import Exporter  # noqa: E402
+from resume_orchestrator.exporters.fonts import FontFamily, register_family, register_fonts  # noqa: E402
+from resume_orchestrator.exporters.fragments import fragment_cache, fragment_paragraph  # noqa: E402
+from resume_orchestrator.exporters.paragraphs import _parse, cached_paragraph  # noqa: E402
+from resume_orchestrator.exporters.pdf import PdfExporter  # noqa: E402
+from resume_orchestrator.exporters.styles import get_stylesheet, theme_key  # noqa: E402
+
+
+def test_stylesheet_is_shared_per_theme():
+    assert get_stylesheet() is get_stylesheet({})
+    themed = get_stylesheet({"Name": {"fontSize": 20, "textColor": "#000000"}})
+    assert themed is not get_stylesheet()
+    assert themed["Name"].fontSize == 20
+    assert get_stylesheet()["Name"].fontSize == 24
+
+
+def test_stylesheet_cannot_be_mutated():
+    with pytest.raises(TypeError):
+        get_stylesheet()["Name"] = None
+
+
+def test_deterministic_pdf_renders_identical_bytes(tmp_path, monkeypatch, compose):
+    resume = compose()
+    first, second = tmp_path / "a.pdf", tmp_path / "b.pdf"
+    PdfExporter(deterministic=True).export(resume, first)
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 3600)  # render the second copy an hour "later"
+    PdfExporter(deterministic=True).export(resume, second)
+    digest = lambda path: hashlib.sha256(path.read_bytes()).hexdigest()  # noqa: E731
+    assert digest(first) == digest(second)
+
+
+def test_export_bytes_matches_file_export(tmp_path, compose):
+    resume = compose()
+    markdown = registry.create("markdown")
+    assert markdown.export_bytes(resume).decode("utf-8") == markdown.export(resume)
+
+    pdf = registry.create("pdf", deterministic=True)
+    data = pdf.export_bytes(resume)
+    assert data.startswith(b"%PDF")
+    assert pdf.export(resume, tmp_path / "out.pdf") == str(tmp_path / "out.pdf")
+    assert (tmp_path / "out.pdf").read_bytes() == data
+    with pytest.raises(ValueError):
+        pdf.export(resume)
+
+
+def test_exporters_must_implement_write_or_export(compose):
+    with pytest.raises(TypeError):
+
+        class Empty(Exporter):
+            format = "empty"
+
+    class LegacyText(Exporter):
+        format = "txt"
+        binary = False
+
+        def export(self, resume, destination=None):
+            return resume.summary
+
+    class LegacyBinary(Exporter):
+        format = "bin"
+
+        def export(self, resume, destination=None):
+            Path(destination).write_bytes(resume.summary.encode("utf-8"))
+            return str(destination)
+
+    resume = compose()
+    assert LegacyText().export_bytes(resume) == resume.summary.encode("utf-8")
+    assert LegacyBinary().export_bytes(resume) == resume.summary.encode("utf-8")
+
+
+def test_failed_export_keeps_previous_output(tmp_path, compose):
+    class Flaky(Exporter):
+        format = "flaky"
+        fail = False
+
+        def write(self, resume, stream):
+            stream.write(b"partial" if self.fail else resume.summary.encode("utf-8"))
+            if self.fail:
+                raise RuntimeError("render failed")
+
+    resume, exporter, destination = compose(), Flaky(), tmp_path / "out.flaky"
+    exporter.export(resume, destination)
+    exporter.fail = True
+    with pytest.raises(RuntimeError):
+        exporter.export(resume, destination)
+
+    assert destination.read_bytes() == resume.summary.encode("utf-8")
+    assert [path.name for path in tmp_path.iterdir()] == ["out.flaky"]
+
+
+@pytest.mark.parametrize("template", ["fintech_focused", "blockchain_startup", "senior_devops_standard"])
+def test_measure_matches_rendered_page_count(template, compose):
+    resume = compose(template)
+    exporter = PdfExporter()
+    measurement = exporter.measure(resume, page_budget=1)
+    rendered_pages = len(re.findall(rb"/Type /Page\b", exporter.export_bytes(resume)))
+
+    assert measurement.pages == rendered_pages
+    assert set(measurement.section_heights) >= {"header", "summary", "skills", "experience"}
+    assert measurement.fits == (rendered_pages == 1)
+    assert (measurement.overflow > 0) == (rendered_pages > 1)
+
+
+def test_cached_paragraphs_are_fresh_and_render_identically(compose):
+    text = "Cut deploy time by <b>40%</b> with <i>Argo CD</i>"
+    first, second = cached_paragraph(text, "Body", theme_key(None)), cached_paragraph(text, "Body", theme_key(None))
+    assert first is not second and first.frags[0] is not second.frags[0]
+    assert _parse.cache_info().hits >= 1
+
+    class UncachedPdfExporter(PdfExporter):
+        def _bullet_factory(self, styles, theme):
+            return lambda text, style_name: Paragraph(text, styles[style_name])
+
+    resume = compose("senior_devops_standard")
+    expected = UncachedPdfExporter(deterministic=True).export_bytes(resume)
+    assert PdfExporter(deterministic=True).export_bytes(resume) == expected
+
+
+VERA = {"normal": "Vera.ttf", "bold": "VeraBd.ttf", "italic": "VeraIt.ttf", "bold_italic": "VeraBI.ttf"}
+
+
+def test_ttf_family_is_registered_once_and_embedded_as_subset(compose):
+    assert register_fonts({"Vera": VERA}) == register_fonts({"Vera": VERA}) == ("Vera",)
+    with pytest.raises(ValueError):
+        register_family(FontFamily(name="Vera", normal="VeraBd.ttf"))
+
+    resume = compose(fonts={"Vera": VERA}, font_family="Vera")
+    data = PdfExporter().export_bytes(replace(resume, summary="Équipe DevOps → SRE"))
+
+    assert re.search(rb"/BaseFont /[A-Z]{6}\+BitstreamVeraSans-Bold\b", data)
+    fonts_dir = os.path.join(os.path.dirname(reportlab.__file__), "fonts")
+    full_fonts = sum(os.path.getsize(os.path.join(fonts_dir, name)) for name in VERA.values())
+    assert len(data) < full_fonts / 2
+
+
+def test_header_fragments_reuse_line_breaks_and_render_identically(compose):
+    class UncachedPdfExporter(PdfExporter):
+        def _fragment_factory(self, styles, theme):
+            return lambda text, style_name: Paragraph(text, styles[style_name])
+
+    resume = compose("blockchain_startup")
+    expected = UncachedPdfExporter(deterministic=True).export_bytes(resume)
+    PdfExporter(deterministic=True).export_bytes(resume)
+    hits = fragment_cache.hits
+    assert PdfExporter(deterministic=True).export_bytes(resume) == expected
+    assert fragment_cache.hits > hits
+
+    first = fragment_paragraph(resume.summary, "Body", theme_key(None))
+    second = fragment_paragraph(resume.summary, "Body", theme_key(None))
+    assert first.wrap(300, 1000) == second.wrap(300, 1000)
+    assert first is not second and first.blPara is second.blPara
+    head, tail = second.split(300, 45)
+    assert second.blPara is not first.blPara and head.content_key is None
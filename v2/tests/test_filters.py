@@ -1,5 +1,19 @@
-from resume_orchestrator.data_models import ExperienceBlock
-from resume_orchestrator.filters import apply_experience_filters
+import random
+from datetime import datetime
+
+import pytest
+
+from resume_orchestrator import filters as filters_module
+from resume_orchestrator.data_models import BlocksBundle, ExperienceBlock, TemplateConfig
+from resume_orchestrator.filters import (
+    FilterPlan,
+    Predicate,
+    apply_experience_filters,
+    apply_experience_filters_batch,
+    compile_filters,
+    register_filter_stage,
+)
+from resume_orchestrator.index import TagIndex, decode_bits
 
 
 def make_block(**kwargs):
@@ -34,3 +48,167 @@ def test_priority_sorting():
     result = apply_experience_filters([a, b], priority_tags=["fintech", "security"])
     assert result[0].id == "b"
 
+
+def test_tag_index_matches_scan():
+    blocks = [
+        make_block(id="a", tags=["blockchain", "startup"], period="2023 – Present"),
+        make_block(id="b", tags=["fintech", "security"], period="2021 – 2023"),
+        make_block(id="c", tags=["legacy", "fintech"], period="2019 – 2021"),
+        make_block(id="d", tags=["security", "startup"], period="2020 – 2022", hidden_for=["Fintech"]),
+    ]
+    index = TagIndex(blocks)
+    kwargs = dict(
+        include_tags=["fintech", "startup"],
+        exclude_tags=["legacy"],
+        priority_tags=["security", "startup"],
+        template_key="fintech_focused",
+    )
+    assert apply_experience_filters(blocks, index=index, **kwargs) == apply_experience_filters(blocks, **kwargs)
+    assert [b.id for b in apply_experience_filters(blocks, index=index, **kwargs)] == ["a", "b"]
+
+
+def test_indexed_plans_match_scan_on_random_blocks():
+    rng = random.Random(3)
+    vocab = ["devops", "fintech", "blockchain", "security", "legacy", "startup", "current"]
+    blocks = [
+        make_block(
+            id=f"b{i}",
+            tags=rng.sample(vocab, rng.randint(1, 4)),
+            period=rng.choice(["2015 – 2018", "2022 – Present", "n/a", "Mar 2019 – 2021"]),
+            hidden_for=rng.choice([[], ["fintech"]]),
+        )
+        for i in range(300)
+    ]
+    index = TagIndex(blocks)
+    for _ in range(20):
+        filters = {
+            "include_tags": rng.sample(vocab, 2),
+            "exclude_tags": rng.sample(vocab, 1),
+            "priority_tags": rng.sample(vocab, 3),
+            "limit_years": rng.choice([None, 6]),
+        }
+        plan = compile_filters(filters, max_items=rng.choice([None, 5]), template_key="fintech_focused")
+        assert plan.run(blocks, index) == plan.run(blocks)
+
+
+def test_decode_bits_returns_ascending_positions():
+    rng = random.Random(11)
+    for width in (0, 1, 8, 9, 64, 1000):
+        mask = rng.getrandbits(width) if width else 0
+        assert decode_bits(mask) == [bit for bit in range(width) if mask >> bit & 1]
+
+
+def test_apply_experience_filters_finds_the_bundle_index(make_raw, monkeypatch):
+    bundle = BlocksBundle.from_dict(make_raw())
+    index = bundle.tag_index()
+    seen = []
+    original_run = FilterPlan.run
+
+    def run(plan, blocks, index=None):
+        seen.append(index)
+        return original_run(plan, blocks, index)
+
+    monkeypatch.setattr(FilterPlan, "run", run)
+
+    apply_experience_filters(bundle.experience, include_tags=["devops"])
+    apply_experience_filters(list(bundle.experience), include_tags=["devops"])
+    assert seen == [index, None]
+
+
+def test_limit_years_uses_parsed_start_year():
+    year = datetime.now().year
+    recent = make_block(id="recent", period=f"{year - 2} – Present")
+    old = make_block(id="old", period=f"{year - 10} – {year - 8}")
+    result = apply_experience_filters([recent, old], limit_years=5)
+    assert [b.id for b in result] == ["recent"]
+
+
+def test_period_range_parses_month_precision():
+    block = make_block(period="Mar 2021 – 11/2023", hidden_for=["FinTech"], tags=["devops", "current"])
+    assert block.period_range.start == (2021, 3)
+    assert block.period_range.end == (2023, 11)
+    assert block.start_year() == 2021
+    assert block.is_current()
+    assert block.hidden_tokens == frozenset({"fintech"})
+
+
+def test_derived_fields_follow_copies_and_assignment():
+    block = make_block(period="2019 – 2021", tags=["devops"], hidden_for=["fintech"])
+    copy = block.model_copy(update={"tags": ["current"], "period": "2022 – Present", "hidden_for": []})
+    assert copy.tag_set == frozenset({"current"}) and copy.is_current() and copy.start_year() == 2022
+    assert copy.hidden_tokens == frozenset()
+    assert block.tag_set == frozenset({"devops"}) and not block.is_current()
+
+    block.tags = ["blockchain"]
+    assert block.tag_set == frozenset({"blockchain"})
+
+
+def test_top_k_matches_full_sort_prefix():
+    blocks = [
+        make_block(id=f"b{i}", tags=["devops", "security"] if i % 3 else ["devops"], period=f"{2010 + i % 7} – 2024")
+        for i in range(40)
+    ]
+    full = compile_filters({"priority_tags": ["security"]}).run(blocks)
+    top = compile_filters({"priority_tags": ["security"]}, max_items=5).run(blocks)
+    assert top == full[:5]
+
+
+def test_custom_stage_plugs_into_template_filters():
+    class CompanyIs(Predicate):
+        def __init__(self, company):
+            self.company = company
+
+        def __call__(self, block):
+            return block.company == self.company
+
+    register_filter_stage("company")(CompanyIs)
+    blocks = [make_block(id="a", company="Acme"), make_block(id="b", company="Other")]
+    plan = compile_filters({"company": "Acme"})
+    assert [b.id for b in plan.run(blocks)] == ["a"]
+    assert compile_filters({"company": "Acme"}) is plan
+
+
+@pytest.mark.parametrize("chunk", [64, 5])  # 12 configs: one chunk, then 5 + 5 + 2
+def test_batch_filtering_matches_scalar_path(chunk, monkeypatch):
+    pytest.importorskip("numpy")
+    monkeypatch.setattr(filters_module, "BATCH_CHUNK", chunk)
+
+    rng = random.Random(7)
+    vocab = ["devops", "fintech", "blockchain", "security", "legacy", "startup", "aws", "current"]
+    blocks = [
+        make_block(
+            id=f"b{i}",
+            tags=rng.sample(vocab, rng.randint(1, 4)),
+            period=rng.choice(["2015 – 2018", "2019 – 2021", "2022 – Present", "2010 – 2012", "n/a"]),
+            hidden_for=rng.choice([[], ["fintech"], ["Blockchain"]]),
+        )
+        for i in range(60)
+    ]
+    configs = []
+    for i in range(12):
+        filters = {
+            "include_tags": rng.sample(vocab, 2) if i % 2 else None,
+            "exclude_tags": rng.sample(vocab, 1),
+            "priority_tags": rng.sample(vocab, 3),
+            "limit_years": rng.choice([None, 5, 10]),
+        }
+        configs.append(
+            TemplateConfig(
+                template=rng.choice(["fintech_focused", "blockchain_startup", "senior"]),
+                name="T",
+                headline_variant="senior",
+                summary_key="main",
+                skill_categories=[],
+                skill_levels=["expert"],
+                filters={k: v for k, v in filters.items() if v is not None},
+                options={"max_experience_blocks": rng.choice([None, 3, 8])},
+            )
+        )
+
+    expected = [
+        compile_filters(
+            c.filters, max_items=c.options.get("max_experience_blocks"), template_key=c.template
+        ).run(blocks)
+        for c in configs
+    ]
+    assert apply_experience_filters_batch(blocks, configs) == expected
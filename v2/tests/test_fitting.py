@@ -0,0 +1,58 @@
+import pytest
+
+from resume_orchestrator.fitting import fit_for_exporter, fit_resume, page_budget_from_options
+
+
+def test_page_budget_from_options():
+    assert page_budget_from_options({"page_budget": 2}) == 2
+    assert page_budget_from_options({"target_length": "1_page"}) == 1
+    assert page_budget_from_options({"target_length": "concise"}) is None
+    assert page_budget_from_options({}) is None
+
+
+def test_fit_trims_lowest_priority_content_first(compose):
+    pytest.importorskip("reportlab")
+    from resume_orchestrator.exporters.pdf import PdfExporter
+
+    exporter = PdfExporter()
+    resume = compose("senior_devops_standard", target_length="2_pages")
+    assert exporter.measure(resume).pages > 2
+
+    fitted, report = fit_for_exporter(resume, exporter)
+
+    assert report.fits and report.dropped
+    assert exporter.measure(fitted).pages == report.pages_after <= 2
+    # The top-ranked block is never dropped and loses content last.
+    assert fitted.experience[0].model_dump() == resume.experience[0].model_dump()
+    assert report.dropped[0].block_id == resume.experience[-1].id
+    assert report.measurements < len(report.dropped) + 3
+
+
+def test_fit_keeps_resume_that_already_fits(compose):
+    pytest.importorskip("reportlab")
+    from resume_orchestrator.exporters.pdf import PdfExporter
+
+    resume = compose("fintech_focused")
+    fitted, report = fit_resume(resume, PdfExporter().measure, 1)
+
+    assert fitted is resume
+    assert report.fits and report.dropped == () and report.measurements == 1
+
+
+def test_measurer_reuses_layout_and_matches_fresh_measurements(compose, monkeypatch):
+    pytest.importorskip("reportlab")
+    from resume_orchestrator.exporters.pdf import PdfExporter
+    from resume_orchestrator.fitting import _apply, _trim_steps
+
+    exporter = PdfExporter()
+    resume = compose("senior_devops_standard", target_length="2_pages")
+    steps = _trim_steps(resume)
+    candidates = [_apply(resume, steps[:count]) for count in range(0, len(steps) + 1, 3)]
+    expected = [exporter.measure(candidate) for candidate in candidates]
+
+    measure = exporter.measurer(resume)
+    assert [measure(candidate) for candidate in candidates] == expected
+    # A second round reuses every flowable: nothing is built again.
+    monkeypatch.setattr(PdfExporter, "_build_sections", None)
+    monkeypatch.setattr(PdfExporter, "_experience_block", None)
+    assert [measure(candidate) for candidate in reversed(candidates)] == expected[::-1]
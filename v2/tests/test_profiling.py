@@ -0,0 +1,31 @@
+import pstats
+
+from resume_orchestrator import telemetry
+from resume_orchestrator.composer import ResumeComposer
+from resume_orchestrator.data_store import DataStore
+from resume_orchestrator.exporters import registry
+from resume_orchestrator.loaders import TemplateLoader
+from resume_orchestrator.profiling import Profiler
+
+
+def test_profile_both_writes_stage_grouped_reports(tmp_path, configs_dir):
+    profiler = Profiler("both", tmp_path, top=5)
+    profiler.start_profiling()
+    try:
+        bundle = DataStore(configs_dir / "blocks.json", background=False).bundle()
+        config = TemplateLoader(configs_dir / "templates").load("fintech_focused")
+        registry.create("markdown").export(ResumeComposer(bundle).compose(config))
+    finally:
+        written = profiler.stop_profiling(["preview", "fintech_focused"])
+
+    assert [path.name for path in written] == ["cpu.pstats", "cpu-top.txt", "mem.snapshot", "mem-stages.txt"]
+    assert not telemetry.enabled()
+    assert pstats.Stats(str(tmp_path / "cpu.pstats")).total_calls > 0
+
+    summary = (tmp_path / "cpu-top.txt").read_text(encoding="utf-8")
+    assert summary.startswith("# resume-cli profile (both): preview fintech_focused")
+    assert "resume_orchestrator/" in summary and str(configs_dir.parent / "src") not in summary
+    memory = (tmp_path / "mem-stages.txt").read_text(encoding="utf-8")
+    for stage in ("bundle_load", "template_load", "compose", "filter", "export"):
+        assert f"\n{stage} " in memory
+    assert "## bundle_load: net" in memory
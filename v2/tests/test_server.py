@@ -0,0 +1,103 @@
+import json
+import os
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from resume_orchestrator.builds import MANIFEST_NAME
+from resume_orchestrator.composer import ResumeComposer
+from resume_orchestrator.data_store import DataStore
+from resume_orchestrator.loaders import TemplateLoader
+from resume_orchestrator.server import RenderService, ServiceBusy, create_server
+
+
+@pytest.fixture
+def service(tmp_path, configs_dir):
+    store = DataStore(configs_dir / "blocks.json")
+    loader = TemplateLoader(configs_dir / "templates")
+    service = RenderService(store, loader, ResumeComposer.from_store(store), workers=1, queue_size=0, out=tmp_path)
+    yield service
+    service.shutdown()
+
+
+def _request(base, path, payload=None):
+    data = json.dumps(payload).encode() if payload is not None else None
+    request = urllib.request.Request(base + path, data=data, headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return response.status, response.headers, response.read()
+    except urllib.error.HTTPError as exc:
+        return exc.code, exc.headers, exc.read()
+
+
+def test_serve_preview_build_and_validate(service, tmp_path):
+    server = create_server(service, port=0, quiet=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        status, headers, body = _request(base, "/preview", {"template": "fintech_focused"})
+        assert status == 200 and headers["Content-Type"].startswith("text/markdown")
+        assert _request(base, "/preview", {"template": "fintech_focused"})[2] == body
+
+        status, _, body = _request(base, "/build", {"template": "fintech_focused", "export": "markdown"})
+        assert status == 200 and json.loads(body)["status"] == "built"
+        assert (tmp_path / "fintech-focused.md").exists()
+        status, _, body = _request(base, "/build", {"template": "fintech_focused", "export": "markdown"})
+        assert status == 200 and json.loads(body)["status"] == "cached"
+        assert (tmp_path / MANIFEST_NAME).exists()
+
+        assert json.loads(_request(base, "/validate")[2])["ok"] is True
+        assert _request(base, "/preview", {"template": "missing"})[0] == 404
+        assert _request(base, "/preview", {})[0] == 400
+        assert _request(base, "/missing", {})[0] == 404
+        assert _request(base, "/missing", {"template": "fintech_focused"})[0] == 404
+        assert _request(base, "/build", {"template": "../templates/fintech_focused"})[0] == 404
+        assert _request(base, "/preview", {"template": ["fintech_focused"]})[0] == 400
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_full_queue_is_rejected(service):
+    release = threading.Event()
+    started = threading.Event()
+
+    def block():
+        started.set()
+        release.wait(5)
+
+    worker = threading.Thread(target=service.submit, args=(block,))
+    worker.start()
+    started.wait(5)
+    with pytest.raises(ServiceBusy):
+        service.submit(lambda: None)
+    release.set()
+    worker.join(5)
+    assert service.submit(lambda: "ok") == "ok"
+
+
+def test_reload_drops_rendered_outputs_of_affected_templates_only(tmp_path, configs_dir):
+    blocks = tmp_path / "blocks.json"
+    raw = json.loads((configs_dir / "blocks.json").read_text(encoding="utf-8"))
+    blocks.write_text(json.dumps(raw), encoding="utf-8")
+    os.utime(blocks, ns=(1_000_000_000, 1_000_000_000))
+    store = DataStore(blocks, background=False)
+    loader = TemplateLoader(configs_dir / "templates")
+    service = RenderService(store, loader, ResumeComposer.from_store(store), workers=1, out=tmp_path / "out")
+    try:
+        for template in ("fintech_focused", "senior_devops_standard"):
+            service.render(template, "markdown")
+        kept = service.render("senior_devops_standard", "markdown")
+
+        raw["summaries"]["fintech_focused"] += " Now with more ledgers."
+        blocks.write_text(json.dumps(raw), encoding="utf-8")
+        os.utime(blocks, ns=(2_000_000_000, 2_000_000_000))
+        store.snapshot()
+
+        assert [key for key, _ in service._rendered.values()] == ["senior_devops_standard"]
+        assert service.render("senior_devops_standard", "markdown") == kept
+        assert b"more ledgers" in service.render("fintech_focused", "markdown")[0]
+    finally:
+        service.shutdown()
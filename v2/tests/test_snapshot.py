@@ -0,0 +1,68 @@
+import json
+
+from resume_orchestrator.data_models import BlocksBundle, PeriodRange
+from resume_orchestrator.data_store import DataStore
+from resume_orchestrator.snapshot import load_snapshot, snapshot_path, source_hash, write_snapshot
+
+
+def test_snapshot_round_trip_matches_validated_bundle(tmp_path, make_raw):
+    raw = make_raw()
+    path = tmp_path / "blocks.json"
+    path.write_text(json.dumps(raw), encoding="utf-8")
+    write_snapshot(path)
+
+    bundle = load_snapshot(path, source_hash(path.read_bytes()))
+    assert bundle is not None
+    assert bundle == DataStore(path, use_snapshot=False).bundle()
+
+
+def test_stale_snapshot_falls_back_to_validation(tmp_path, make_raw):
+    raw = make_raw()
+    path = tmp_path / "blocks.json"
+    path.write_text(json.dumps(raw), encoding="utf-8")
+    write_snapshot(path)
+
+    edited = dict(raw, summaries={"main": "Edited"})
+    path.write_text(json.dumps(edited), encoding="utf-8")
+    assert load_snapshot(path, source_hash(path.read_bytes())) is None
+    assert DataStore(path).bundle().summaries["main"] == "Edited"
+
+
+def test_corrupt_snapshot_is_ignored(tmp_path, make_raw):
+    raw = make_raw()
+    path = tmp_path / "blocks.json"
+    path.write_text(json.dumps(raw), encoding="utf-8")
+    snapshot_path(path).write_bytes(b"not a snapshot")
+    assert DataStore(path).bundle().summaries["main"] == "Summary"
+
+
+def test_tag_index_does_not_affect_bundle_equality(tmp_path, make_raw):
+    raw = make_raw()
+    path = tmp_path / "blocks.json"
+    path.write_text(json.dumps(raw), encoding="utf-8")
+    first = DataStore(path, use_snapshot=False).bundle()
+    second = BlocksBundle.from_dict(raw)
+
+    assert first == second
+    assert second.tag_index() is second.tag_index()
+    assert first == second
+
+
+def test_snapshot_restores_derived_fields_without_parsing(tmp_path, make_raw, monkeypatch):
+    path = tmp_path / "blocks.json"
+    path.write_text(json.dumps(make_raw()), encoding="utf-8")
+    write_snapshot(path)
+    expected = DataStore(path, use_snapshot=False).bundle().experience[0]
+
+    def no_parse(period):
+        raise AssertionError("periods are stored in the snapshot")
+
+    monkeypatch.setattr(PeriodRange, "parse", no_parse)
+    block = load_snapshot(path, source_hash(path.read_bytes())).experience[0]
+    assert block == expected
+    assert block.derived_state() == expected.derived_state()
+    assert block.is_current() and block.tag_set == frozenset({"devops"})
+
+    monkeypatch.undo()
+    block.period = "2010 – 2012"
+    assert block.start_year() == 2010 and not block.is_current()
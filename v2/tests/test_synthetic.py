@@ -0,0 +1,29 @@
+from resume_orchestrator.composer import ResumeComposer
+from resume_orchestrator.data_models import BlocksBundle
+from resume_orchestrator.data_store import DataStore
+from resume_orchestrator.loaders import TemplateLoader
+from resume_orchestrator.synthetic import SyntheticSpec, generate_bundle, write_dataset
+
+
+def test_same_seed_writes_identical_files(tmp_path):
+    spec = SyntheticSpec(blocks=200, seed=3)
+    first = write_dataset(spec, tmp_path / "a")
+    second = write_dataset(spec, tmp_path / "b")
+    assert first[0].read_bytes() == second[0].read_bytes()
+    assert [p.read_bytes() for p in sorted(first[1].iterdir())] == [p.read_bytes() for p in sorted(second[1].iterdir())]
+    assert generate_bundle(SyntheticSpec(blocks=200, seed=4)) != generate_bundle(spec)
+
+
+def test_generated_dataset_matches_schema_and_composes(tmp_path):
+    spec = SyntheticSpec(blocks=500, seed=1, tag_vocabulary=12, tags_per_block=(3, 3), skill_categories=4)
+    blocks_path, templates_dir = write_dataset(spec, tmp_path)
+
+    bundle = BlocksBundle.from_dict(generate_bundle(spec))
+    assert len(bundle.experience) == 500 and len(bundle.skills) == 4
+    assert all(len(block.tags) == 3 for block in bundle.experience)
+
+    composer = ResumeComposer(DataStore(blocks_path).bundle())
+    loader = TemplateLoader(templates_dir)
+    resumes = [composer.compose(config) for config in loader.iter_configs()]
+    assert len(resumes) == spec.templates
+    assert any(resume.experience for resume in resumes)
@@ -0,0 +1,142 @@
+import io
+import json
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from resume_orchestrator import telemetry
+from resume_orchestrator.composer import ComposeCache, ResumeComposer
+from resume_orchestrator.data_store import DataStore
+from resume_orchestrator.exporters import registry
+from resume_orchestrator.loaders import TemplateLoader
+
+
+@pytest.fixture
+def sink():
+    collector = telemetry.add_sink(telemetry.InMemorySink())
+    yield collector
+    telemetry.shutdown()
+
+
+def test_disabled_spans_are_a_shared_noop():
+    assert not telemetry.enabled()
+    assert telemetry.span("compose") is telemetry.span("filter")
+
+
+def test_pipeline_stages_emit_nested_spans(sink, configs_dir):
+    bundle = DataStore(configs_dir / "blocks.json", background=False).bundle()
+    config = TemplateLoader(configs_dir / "templates").load("senior_devops_standard")
+    resume = ResumeComposer(bundle, cache=ComposeCache(maxsize=0)).compose(config)
+    registry.create("markdown").export(resume)
+
+    assert sink.names() == ["bundle_load", "template_load", "filter", "compose", "export"]
+    spans = {record.name: record for record in sink.records}
+    assert spans["filter"].parent == "compose"
+    assert spans["template_load"].attributes == {"template": "senior_devops_standard", "cached": False}
+    assert spans["export"].attributes["format"] == "markdown"
+    assert all(record.duration >= 0 and record.error is None for record in sink.records)
+
+
+def test_errors_are_recorded_and_reraised(sink, configs_dir):
+    with pytest.raises(FileNotFoundError):
+        TemplateLoader(configs_dir / "templates").load("missing")
+    assert sink.records[0].error.startswith("FileNotFoundError")
+
+
+def test_json_and_prometheus_sinks(tmp_path):
+    stream = io.StringIO()
+    prom = tmp_path / "resume.prom"
+    telemetry.add_sink(telemetry.JsonLogSink(stream=stream))
+    telemetry.add_sink(telemetry.sink_from_spec(f"prom:{prom}"))
+    for _ in range(3):
+        with telemetry.span("compose", template="t") as traced:
+            traced.set(cached=True)
+    telemetry.shutdown()
+
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert len(lines) == 3 and lines[0]["span"] == "compose" and lines[0]["cached"] is True
+    text = prom.read_text(encoding="utf-8")
+    assert 'resume_orchestrator_span_duration_seconds_count{span="compose"} 3' in text
+    assert 'resume_orchestrator_span_errors_total{span="compose"} 0' in text
+
+
+def test_concurrent_prometheus_flushes_and_failing_sinks_do_not_break_spans(tmp_path):
+    class Broken(telemetry.Sink):
+        def start(self, name):
+            raise RuntimeError("start")
+
+        def emit(self, record):
+            raise RuntimeError("emit")
+
+    prom = tmp_path / "resume.prom"
+    telemetry.add_sink(Broken())
+    telemetry.add_sink(telemetry.PrometheusTextfileSink(prom, interval=0))
+    errors = []
+
+    def work():
+        try:
+            for _ in range(25):
+                with telemetry.span("compose"):
+                    pass
+        except Exception as exc:  # noqa: BLE001
+            errors.append(exc)
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    telemetry.shutdown()
+
+    assert errors == []
+    assert 'resume_orchestrator_span_duration_seconds_count{span="compose"} 200' in prom.read_text(encoding="utf-8")
+    assert [path.name for path in tmp_path.iterdir()] == ["resume.prom"]
+
+
+def test_shutdown_flushes_and_closes_every_sink_despite_failures(tmp_path):
+    calls = []
+
+    class Broken(telemetry.Sink):
+        def emit(self, record):
+            pass
+
+        def flush(self):
+            calls.append("flush")
+            raise RuntimeError("flush")
+
+        def close(self):
+            calls.append("close")
+            raise RuntimeError("close")
+
+    stream = io.StringIO()
+    owned = telemetry.JsonLogSink(tmp_path / "spans.jsonl")
+    for sink in (Broken(), telemetry.JsonLogSink(stream=stream), owned):
+        telemetry.add_sink(sink)
+    with telemetry.span("compose"):
+        pass
+    owned.flush()
+    assert not owned._stream.closed
+    telemetry.shutdown()
+
+    assert calls == ["flush", "close"] and not telemetry.enabled()
+    assert not stream.closed and json.loads(stream.getvalue())["span"] == "compose"
+    assert owned._stream.closed
+    assert json.loads((tmp_path / "spans.jsonl").read_text(encoding="utf-8"))["span"] == "compose"
+
+
+def test_binary_preview_emits_an_export_span(tmp_path, configs_dir):
+    pytest.importorskip("reportlab")
+    trace = tmp_path / "spans.jsonl"
+    script = (
+        "import sys; from resume_orchestrator.cli import app; "
+        "sys.argv = ['resume-cli', *sys.argv[1:]]; app()"
+    )
+    argv = ["--config-dir", str(configs_dir), "--trace", f"json:{trace}", "preview", "fintech_focused", "--export", "pdf"]
+    result = subprocess.run([sys.executable, "-c", script, *argv], capture_output=True)
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.startswith(b"%PDF")
+    spans = [json.loads(line) for line in trace.read_text(encoding="utf-8").splitlines()]
+    assert any(record["span"] == "export" and record["format"] == "pdf" for record in spans)
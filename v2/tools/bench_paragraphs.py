@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Benchmark the Paragraph markup cache on variants that share most of their blocks."""
+
+import argparse
+import random
+import time
+from dataclasses import replace
+from pathlib import Path
+
+from reportlab.platypus import Paragraph
+
+from resume_orchestrator.composer import ResumeComposer
+from resume_orchestrator.data_models import ExperienceBlock
+from resume_orchestrator.data_store import DataStore
+from resume_orchestrator.exporters.paragraphs import _parse
+from resume_orchestrator.exporters.pdf import PdfExporter
+from resume_orchestrator.loaders import TemplateLoader
+
+CONFIGS = Path(__file__).resolve().parents[1] / "configs"
+
+
+class UncachedPdfExporter(PdfExporter):
+    def _bullet_factory(self, styles, theme):
+        return lambda text, style_name: Paragraph(text, styles[style_name])
+
+
+def make_variants(blocks: int, variants: int, share: float, seed: int):
+    """``variants`` resumes drawing from a pool of ``blocks`` blocks; each includes ``share`` of the pool."""
+    composer = ResumeComposer(DataStore(CONFIGS / "blocks.json").bundle())
+    base = composer.compose(TemplateLoader(CONFIGS / "templates").load("senior_devops_standard"))
+    rng = random.Random(seed)
+    source = list(composer.bundle.experience)
+    pool = []
+    for index in range(blocks):
+        block = source[index % len(source)]
+        pool.append(
+            ExperienceBlock(
+                **{
+                    **block.model_dump(),
+                    "id": f"{block.id}_{index}",
+                    "responsibilities": [f"<b>{index}</b> {text}" for text in block.responsibilities],
+                    "achievements": [f"{text} (<i>#{index}</i>)" for text in block.achievements],
+                }
+            )
+        )
+    per_variant = max(1, int(blocks * share))
+    return [replace(base, experience=tuple(rng.sample(pool, per_variant))) for _ in range(variants)]
+
+
+def run(exporter: PdfExporter, resumes) -> float:
+    started = time.perf_counter()
+    for resume in resumes:
+        styles = exporter._build_styles(resume.meta.get("options", {}).get("theme"))
+        exporter._build_story(resume, styles)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--blocks", type=int, default=40)
+    parser.add_argument("--variants", type=int, default=50)
+    parser.add_argument("--share", type=float, default=0.8, help="Fraction of the block pool in each variant")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--export", action="store_true", help="Time full PDF exports instead of story construction")
+    args = parser.parse_args()
+
+    resumes = make_variants(args.blocks, args.variants, args.share, args.seed)
+    if args.export:
+        def timed(exporter):
+            started = time.perf_counter()
+            for resume in resumes:
+                exporter.export_bytes(resume)
+            return time.perf_counter() - started
+    else:
+        timed = lambda exporter: run(exporter, resumes)  # noqa: E731
+
+    _parse.cache_clear()
+    uncached = timed(UncachedPdfExporter())
+    cached = timed(PdfExporter())
+    info = _parse.cache_info()
+    print(f"{args.variants} variants x {int(args.blocks * args.share)} blocks from a pool of {args.blocks}")
+    print(f"uncached: {uncached * 1000:8.1f} ms")
+    print(f"cached:   {cached * 1000:8.1f} ms  ({uncached / cached:.1f}x, {info.hits} hits / {info.misses} parses)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""Write a deterministic synthetic blocks.json and template YAMLs for scale testing."""
+
+import argparse
+from pathlib import Path
+
+from resume_orchestrator.synthetic import SyntheticSpec, write_dataset
+
+
+def _pair(value: str):
+    low, _, high = value.partition(":")
+    return int(low), int(high or low)
+
+
+def main():
+    defaults = SyntheticSpec()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("out", type=Path, help="Directory for blocks.json and templates/ (usable as --config-dir)")
+    parser.add_argument("--blocks", type=int, default=defaults.blocks, help="Number of experience blocks")
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--templates", type=int, default=defaults.templates)
+    parser.add_argument("--tags", type=int, default=defaults.tag_vocabulary, help="Tag vocabulary size")
+    parser.add_argument("--tags-per-block", type=_pair, default=defaults.tags_per_block, metavar="LOW:HIGH")
+    parser.add_argument("--bullet-words", type=_pair, default=defaults.words_per_bullet, metavar="LOW:HIGH")
+    parser.add_argument("--responsibilities", type=_pair, default=defaults.responsibilities, metavar="LOW:HIGH")
+    parser.add_argument("--achievements", type=_pair, default=defaults.achievements, metavar="LOW:HIGH")
+    parser.add_argument("--start-years", type=_pair, default=defaults.start_years, metavar="LOW:HIGH")
+    parser.add_argument("--skill-categories", type=int, default=defaults.skill_categories)
+    args = parser.parse_args()
+
+    spec = SyntheticSpec(
+        blocks=args.blocks,
+        seed=args.seed,
+        templates=args.templates,
+        tag_vocabulary=args.tags,
+        tags_per_block=args.tags_per_block,
+        words_per_bullet=args.bullet_words,
+        responsibilities=args.responsibilities,
+        achievements=args.achievements,
+        start_years=args.start_years,
+        skill_categories=args.skill_categories,
+    )
+    blocks_path, templates_dir = write_dataset(spec, args.out)
+    print(f"Wrote {args.blocks} blocks to {blocks_path} and {args.templates} templates to {templates_dir}")
+
+
+if __name__ == "__main__":
+    main()